@@ -1,6 +1,7 @@
 import json
 import sys
-from Trains.Other.json_utils import  dict_to_map, get_next_json_value, dict_to_player_states, array_to_undirected_connection
+from Trains.Other.json_utils import  dict_to_map, get_next_json_value, dict_to_player_states, array_to_undirected_connection, \
+    index_cities
 from Trains.Common.player_game_state import PlayerGameState
 
 DEFAULT_NUM_STARTING_RAILS = 45
@@ -12,7 +13,7 @@ def main():
     player_state_dict, json_str = get_next_json_value(json_str)
     acquired_array, _ = get_next_json_value(json_str)
     map_obj = dict_to_map(map_dict)
-    cities = map_obj.get_cities()
+    cities = index_cities(map_obj.get_cities())
     private_player_state, public_states = dict_to_player_states(player_state_dict, cities)
     connection_to_acquire = array_to_undirected_connection(acquired_array, cities)
     player_game_state = PlayerGameState(map_obj, private_player_state, public_states)
@@ -0,0 +1,113 @@
+import io
+import json
+import random
+import time
+from typing import Any, Callable, List
+
+from json_stream import iter_json_values
+
+NUM_VALUES = 2000
+SEED = 0
+
+
+def legacy_read_values(read_char: Callable[[], str]) -> List[Any]:
+    """
+    The original reader, which reads one character at a time and tracks braces and strings by hand until a whole
+    value has been read
+    :param read_char: reads the next character of the stream, or "" at its end
+    :return: the JSON values in the stream
+    """
+    def find_nested(existing_json, opening, closing):
+        num_braces = 1
+        while num_braces != 0:
+            current_char = read_char()
+            existing_json.append(current_char)
+            if current_char == opening:
+                num_braces += 1
+            elif current_char == closing:
+                num_braces -= 1
+            elif current_char == '"':
+                find_string(existing_json)
+
+    def find_string(existing_json):
+        current_char = read_char()
+        existing_json.append(current_char)
+        while current_char != '"':
+            if current_char == "\\":
+                current_char = read_char()
+                existing_json.append(current_char)
+            current_char = read_char()
+            existing_json.append(current_char)
+
+    def find_nonwhite_space(existing_json):
+        current_char = read_char()
+        existing_json.append(current_char)
+        while (not current_char.isspace()) and current_char != "":
+            current_char = read_char()
+            existing_json.append(current_char)
+
+    values = []
+    while True:
+        current_char = read_char()
+        while current_char.isspace():
+            current_char = read_char()
+        if not current_char:
+            return values
+        json_val = [current_char]
+        if current_char == "{":
+            find_nested(json_val, "{", "}")
+        elif current_char == "[":
+            find_nested(json_val, "[", "]")
+        elif current_char == '"':
+            find_string(json_val)
+        else:
+            find_nonwhite_space(json_val)
+        values.append(json.loads("".join(json_val)))
+
+
+def build_input(num_values: int, seed: int) -> str:
+    """
+    :param num_values: the number of values
+    :param seed: the seed for the random number generator
+    :return: whitespace separated JSON objects, arrays, strings and numbers
+    """
+    rng = random.Random(seed)
+    values = []
+    for index in range(num_values):
+        values.append({"index": index, "name": "value \"%d\" {[" % index,
+                       "items": [rng.random() for _ in range(rng.randint(0, 80))],
+                       "nested": {"flag": rng.random() < 0.5, "none": None}})
+        values.append(rng.randint(-10 ** 6, 10 ** 6))
+        values.append("string %d" % index)
+    return "\n".join(json.dumps(value) for value in values)
+
+
+def benchmark_json_stream() -> None:
+    """
+    Times the original character by character readers of C (text) and E (bytes, decoded one at a time) against the
+    streaming reader on the same multi-megabyte input, and checks that they read the same values
+    """
+    json_text = build_input(NUM_VALUES, SEED)
+    json_bytes = json_text.encode()
+    expected = list(iter_json_values(io.StringIO(json_text)))
+
+    text_stream = io.StringIO(json_text)
+    byte_stream = io.BytesIO(json_bytes)
+    readers = [
+        ("C char by char (text)", lambda: legacy_read_values(lambda: text_stream.read(1))),
+        ("E char by char (bytes)", lambda: legacy_read_values(lambda: byte_stream.read(1).decode())),
+        ("streaming (text)", lambda: list(iter_json_values(io.StringIO(json_text)))),
+        ("streaming (bytes)", lambda: list(iter_json_values(io.BytesIO(json_bytes)))),
+    ]
+    print(f"input: {len(json_bytes) / 2 ** 20:.1f} MiB, {len(expected)} values")
+    print(f"{'reader':>24} {'time (s)':>9} {'MiB/s':>8}")
+    for name, read_values in readers:
+        start = time.perf_counter()
+        values = read_values()
+        elapsed = time.perf_counter() - start
+        assert values == expected
+        print(f"{name:>24} {elapsed:>9.3f} {len(json_bytes) / 2 ** 20 / elapsed:>8.1f}")
+
+
+if __name__ == '__main__':
+    benchmark_json_stream()
@@ -1,69 +1,6 @@
 import sys
 import json
-
-
-def get_next_json():
-    current_char = sys.stdin.read(1)
-    while current_char.isspace():
-        current_char = sys.stdin.read(1)
-    if not current_char:
-        return ""
-    json_val = [current_char]
-    if current_char == "{":
-        find_json_object(json_val)
-    elif current_char == "[":
-        find_array(json_val)
-    elif current_char == '"':
-        find_string(json_val)
-    elif not current_char.isspace():
-        find_nonwhite_space(json_val)
-
-    return json.loads("".join(json_val))
-
-
-def find_json_object(existing_json):
-    num_braces = 1
-    while num_braces != 0:
-        current_char = sys.stdin.read(1)
-        existing_json.append(current_char)
-        if current_char == "{":
-            num_braces += 1
-        elif current_char == "}":
-            num_braces -= 1
-        elif current_char == '"':
-            find_string(existing_json)
-
-
-def find_array(existing_json):
-    num_braces = 1
-    while num_braces != 0:
-        current_char = sys.stdin.read(1)
-        existing_json.append(current_char)
-        if current_char == "[":
-            num_braces += 1
-        elif current_char == "]":
-            num_braces -= 1
-        elif current_char == '"':
-            find_string(existing_json)
-
-
-def find_string(existing_json):
-    current_char = sys.stdin.read(1)
-    existing_json.append(current_char)
-    while current_char != '"':
-        if current_char == "\\":
-            current_char = sys.stdin.read(1)
-            existing_json.append(current_char)
-        current_char = sys.stdin.read(1)
-        existing_json.append(current_char)
-
-
-def find_nonwhite_space(existing_json):
-    current_char = sys.stdin.read(1)
-    existing_json.append(current_char)
-    while (not current_char.isspace()) and current_char != "":
-        current_char = sys.stdin.read(1)
-        existing_json.append(current_char)
+from json_stream import iter_json_values
 
 
 def reverse_json(json):
@@ -88,7 +25,5 @@ def reverse_json(json):
 
 
 if __name__ == '__main__':
-    json_input = get_next_json()
-    while json_input != "":
+    for json_input in iter_json_values(sys.stdin.buffer):
         print(json.dumps(reverse_json(json_input)))
-        json_input = get_next_json()
@@ -1,4 +1,7 @@
+import io
+import json
 import unittest
+from json_stream import iter_json_values
 from main import reverse_json
 
 
@@ -37,5 +40,87 @@ class ReverseJsonTest(unittest.TestCase):
         self.assertEqual(reverse_json(initial_json), expected_json)
 
 
+
+class OpenStream:
+    """
+    A stream that returns the given chunks and then raises instead of reaching its end, like a socket whose client
+    has not closed it yet
+    """
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def read(self, size):
+        if not self.chunks:
+            raise BlockingIOError("No more input has arrived")
+        return self.chunks.pop(0)
+
+
+class JsonStreamTest(unittest.TestCase):
+    JSON_TEXT = '{"key": [1, "two {[", 3.5]}  -12\n"esc\\"aped"\t[]  true null 1234567'
+    JSON_VALUES = [{"key": [1, "two {[", 3.5]}, -12, 'esc"aped', [], True, None, 1234567]
+
+    def test_text_stream(self):
+        self.assertEqual(self.JSON_VALUES, list(iter_json_values(io.StringIO(self.JSON_TEXT))))
+
+    def test_binary_stream(self):
+        self.assertEqual(self.JSON_VALUES, list(iter_json_values(io.BytesIO(self.JSON_TEXT.encode()))))
+
+    def test_values_across_chunks(self):
+        for chunk_size in range(1, 8):
+            self.assertEqual(self.JSON_VALUES,
+                             list(iter_json_values(io.BytesIO(self.JSON_TEXT.encode()), chunk_size)))
+
+    def test_multibyte_characters_across_chunks(self):
+        values = ["h\u00e9llo \u2603", {"\u00fc": 1}]
+        json_bytes = " ".join(json.dumps(value, ensure_ascii=False) for value in values).encode()
+        self.assertEqual(values, list(iter_json_values(io.BytesIO(json_bytes), 1)))
+
+    def test_large_value(self):
+        value = [{"index": index, "name": "x" * 100} for index in range(10000)]
+        json_text = json.dumps(value) + " " + json.dumps(value)
+        self.assertEqual([value, value], list(iter_json_values(io.StringIO(json_text), 1024)))
+
+    def test_empty_stream(self):
+        self.assertEqual([], list(iter_json_values(io.StringIO("  \n\t "))))
+
+    def test_invalid_json(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_values(io.StringIO("1 {\"a\": }")))
+
+    def test_skip_invalid_json(self):
+        self.assertEqual([1, None, 2], list(iter_json_values(io.StringIO("1 abc 2"), skip_invalid=True)))
+
+    def test_skip_invalid_nested_json(self):
+        json_text = '{"a": x, "b": 2} 5 [1, "]", nope] "bad \\q escape" {"a": [} '
+        for chunk_size in range(1, 8):
+            self.assertEqual([None, 5, None, None, None],
+                             list(iter_json_values(io.StringIO(json_text), chunk_size, skip_invalid=True)))
+
+    def test_skip_invalid_json_before_end_of_stream(self):
+        stream = OpenStream(['1 ab', 'c\n{"a": x', '} [2', ']\n'])
+        values = iter_json_values(stream, skip_invalid=True)
+        self.assertEqual([1, None, None, [2]], [next(values) for _ in range(4)])
+        with self.assertRaises(BlockingIOError):
+            next(values)
+
+    def test_delimited_value_at_end_of_buffer(self):
+        values = iter_json_values(OpenStream(['[1,2]', '{"a":1}', '"ab"', '12']))
+        self.assertEqual([[1, 2], {"a": 1}, "ab"], [next(values) for _ in range(3)])
+        with self.assertRaises(BlockingIOError):
+            next(values)
+
+    def test_max_value_size(self):
+        json_text = '[1, 2] "abcdefgh" 1234567890 {}'
+        for chunk_size in range(1, 12):
+            self.assertEqual([[1, 2], "abcdefgh", 1234567890, {}],
+                             list(iter_json_values(io.StringIO(json_text), chunk_size, max_value_size=10)))
+
+    def test_value_longer_than_max_value_size(self):
+        values = iter_json_values(io.StringIO('1 "abcdefghij" 2'), 4, max_value_size=10)
+        self.assertEqual(1, next(values))
+        with self.assertRaises(ValueError):
+            next(values)
+
+
 if __name__ == '__main__':
     unittest.main()
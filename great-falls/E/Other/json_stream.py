@@ -0,0 +1,120 @@
+"""
+Reads a stream of whitespace separated JSON values in large chunks instead of one character at a time.
+
+Chunks are appended to a buffer, and each value is parsed straight out of the buffer with JSONDecoder.raw_decode,
+which also finds where the value ends, so braces and strings are never tracked by hand. The buffer only drops the
+values that have been parsed when the next chunk is read. A number, literal or other bare value that ends exactly at
+the end of the buffer may continue in the next chunk, so it is only yielded once more input or the end of the stream
+follows it, while an object, array or string ends at its closing character and is yielded at once. While a value
+does not fit in the buffer, each read is as large as the buffer, so a value spanning many chunks is parsed a
+logarithmic number of times rather than once per chunk. Giving a max_value_size bounds the buffer, and so the memory
+used per stream, no matter what the stream contains.
+
+Invalid input can be skipped as soon as it has been read in full, like the original character by character readers
+did: an object or array up to its matching closing bracket, a string up to its closing quote, and anything else up
+to the next whitespace. Only the brackets of the same kind as the opening one are counted, brackets inside strings
+are ignored, and each skipped unit stands for a single null, however many values it seems to contain.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Iterator, Optional, TextIO, Union
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"\s*")
+_TOKEN = re.compile(r"\S*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_STRING_OR_BRACKET = re.compile(r'"(?:[^"\\]|\\.)*"|"|[\[\]{}]', re.DOTALL)
+_CLOSING_BRACKETS = {"{": "}", "[": "]"}
+_DELIMITED_STARTS = frozenset('{["')
+
+
+def iter_json_values(stream: Union[BinaryIO, TextIO], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     skip_invalid: bool = False, max_value_size: Optional[int] = None) -> Iterator[Any]:
+    """
+    Yields the JSON values in a stream as soon as each of them has been read. Binary streams are decoded as UTF-8.
+    Streams that support read1 (e.g. sys.stdin.buffer or a socket's file) are read with it, so a value is yielded as
+    soon as it arrives rather than once a whole chunk has arrived. Given a max_value_size, the buffer never holds more
+    than that many characters plus one, which is enough to see where the longest allowed value ends.
+    :param stream: a binary or text stream containing JSON values separated by whitespace
+    :param chunk_size: the number of bytes or characters to read at a time
+    :param skip_invalid: whether to yield None for each invalid value (see the module docs) instead of raising
+    :param max_value_size: the greatest number of characters a value may take up, if any
+    :return: a generator of the JSON values in the stream
+    :raise json.JSONDecodeError: if the stream contains invalid JSON and skip_invalid is False
+    :raise ValueError: if a value, or invalid input, is longer than max_value_size
+    """
+    read = getattr(stream, "read1", stream.read)
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    is_end_of_stream = False
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()
+        if position < len(buffer):
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+                if end < len(buffer) or is_end_of_stream or buffer[position] in _DELIMITED_STARTS:
+                    yield value
+                    position = end
+                    continue
+            except json.JSONDecodeError:
+                if skip_invalid:
+                    end = _find_invalid_end(buffer, position, is_end_of_stream)
+                    if end is not None:
+                        yield None
+                        position = end
+                        continue
+                elif is_end_of_stream:
+                    raise
+        elif is_end_of_stream:
+            return
+
+        pending_size = len(buffer) - position
+        read_size = max(chunk_size, pending_size)
+        if max_value_size is not None:
+            if pending_size > max_value_size:
+                raise ValueError(f"A JSON value is longer than {max_value_size} characters")
+            read_size = min(read_size, max_value_size + 1 - pending_size)
+        chunk = read(read_size)
+        if not chunk:
+            is_end_of_stream = True
+        buffer = buffer[position:] + (utf8_decoder.decode(chunk, final=is_end_of_stream)
+                                      if isinstance(chunk, bytes) else chunk)
+        position = 0
+
+
+def _find_invalid_end(buffer: str, position: int, is_end_of_stream: bool) -> Optional[int]:
+    """
+    Finds where the invalid value at the given position ends (see the module docs)
+    :param buffer: the buffered input
+    :param position: the start of a value that could not be decoded
+    :param is_end_of_stream: whether the buffer holds the rest of the stream
+    :return: the end of the invalid value, or None if it may continue past the buffer
+    """
+    opening = buffer[position]
+    if opening in _CLOSING_BRACKETS:
+        closing = _CLOSING_BRACKETS[opening]
+        depth = 0
+        for match in _STRING_OR_BRACKET.finditer(buffer, position):
+            token = match.group()
+            if token == '"':
+                break
+            if token == opening:
+                depth += 1
+            elif token == closing:
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+    elif opening == '"':
+        match = _STRING.match(buffer, position)
+        if match:
+            return match.end()
+    else:
+        end = _TOKEN.match(buffer, position).end()
+        if end < len(buffer):
+            return end
+    return len(buffer) if is_end_of_stream else None
@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from typing import List, Optional, Tuple
+from main import LOCALHOST
+from my_tcp_server import MyThreadingTCPServer
+from tcp_json_reverser import TCPJsonReverser
+
+"""
+A load generator for the JSON reversing service. It opens many connections at
+once, sends a number of JSON values over each one, waits for each reversed value
+before sending the next, and reports the throughput and the latency of the
+round trips.
+
+Run it from the E/Other directory, e.g.
+    python3 load_generator.py --connections 500 --values 20
+starts a threaded server on a free port and loads it, and
+    python3 load_generator.py --port 45678 --connections 500
+loads a server started with `python3 main.py 45678 <max connections>`.
+"""
+
+SAMPLE_VALUE = {"str": "hello", "int": 5, "array": [True, "suh", {"key": "val"}],
+                "object": {"thirdkey": [3, 4, [10, 15]]}}
+
+
+# Sends values_per_connection values over one connection, waiting for each
+# reply, and returns the latency of each round trip in seconds
+async def run_connection(host: str, port: int, values_per_connection: int,
+                         start_event: asyncio.Event) -> List[float]:
+    reader, writer = await asyncio.open_connection(host, port)
+    await start_event.wait()
+    request = (json.dumps(SAMPLE_VALUE) + "\n").encode()
+    latencies = []
+    try:
+        for _ in range(values_per_connection):
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            reply = await reader.readline()
+            if not reply:
+                raise ConnectionError("The server closed the connection early")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return latencies
+
+
+# Opens all connections, starts sending on all of them at once, and returns
+# the elapsed time and the latencies of every round trip
+async def run_load(host: str, port: int, num_connections: int,
+                   values_per_connection: int) -> Tuple[float, List[float]]:
+    start_event = asyncio.Event()
+    tasks = [asyncio.create_task(run_connection(host, port, values_per_connection, start_event))
+             for _ in range(num_connections)]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    start_event.set()
+    results = await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    return elapsed, [latency for latencies in results for latency in latencies]
+
+
+# Gets the given percentile of the sorted latencies
+def percentile(sorted_latencies: List[float], percent: float) -> float:
+    index = min(len(sorted_latencies) - 1, int(len(sorted_latencies) * percent / 100))
+    return sorted_latencies[index]
+
+
+# Prints the throughput and latency percentiles of a run
+def print_report(num_connections: int, elapsed: float, latencies: List[float]) -> None:
+    sorted_latencies = sorted(latencies)
+    print(f"connections: {num_connections}, values: {len(latencies)}, time: {elapsed:.3f} s")
+    print(f"throughput: {len(latencies) / elapsed:.0f} values/s")
+    print("latency (ms): mean {:.2f}, p50 {:.2f}, p95 {:.2f}, p99 {:.2f}, max {:.2f}".format(
+        statistics.mean(sorted_latencies) * 1000, percentile(sorted_latencies, 50) * 1000,
+        percentile(sorted_latencies, 95) * 1000, percentile(sorted_latencies, 99) * 1000,
+        sorted_latencies[-1] * 1000))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load the JSON reversing service")
+    parser.add_argument("--host", default=LOCALHOST)
+    parser.add_argument("--port", type=int, default=None,
+                        help="the port of a running server; if not given, a server is started on a free port")
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--values", type=int, default=20, help="the number of values sent per connection")
+    parser.add_argument("--max-connections", type=int, default=None,
+                        help="the connection limit of the started server; defaults to --connections")
+    args = parser.parse_args()
+
+    server: Optional[MyThreadingTCPServer] = None
+    port = args.port
+    if port is None:
+        server = MyThreadingTCPServer((args.host, 0), TCPJsonReverser,
+                                      args.max_connections or args.connections)
+        port = server.server_address[1]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        elapsed, latencies = asyncio.run(run_load(args.host, port, args.connections, args.values))
+        print_report(args.connections, elapsed, latencies)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,49 @@
 import sys
-from typing import List
+from typing import List, Optional
 from tcp_json_reverser import TCPJsonReverser
-from my_tcp_server import MyTCPServer
+from my_tcp_server import MyTCPServer, MyThreadingTCPServer
 
 
 LOCALHOST = "127.0.0.1"
 DEFAULT_PORT = 45678
 
 
-# Main function that starts the TCP listener with the given port
+# Main function that starts the TCP listener with the given port. Given a
+# maximum number of connections, it serves that many clients at a time until
+# it is interrupted, otherwise it serves a single client
 def main() -> None:
     host, port = LOCALHOST, get_port(sys.argv)
+    max_connections = get_max_connections(sys.argv)
 
-    with MyTCPServer((host, port), TCPJsonReverser) as server:
-        server.handle_request()
+    if max_connections is None:
+        with MyTCPServer((host, port), TCPJsonReverser) as server:
+            server.handle_request()
+    else:
+        with MyThreadingTCPServer((host, port), TCPJsonReverser,
+                                  max_connections) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
 
 
 # Gets port from passed in args - if port is not specified, return default port
 def get_port(args: List[str]) -> int:
     port = DEFAULT_PORT
-    if len(args) == 2:
+    if len(args) >= 2:
         port = args[1]
 
     return int(port)
 
 
+# Gets the maximum number of simultaneous connections from passed in args - if
+# it is not specified, return None to serve a single connection
+def get_max_connections(args: List[str]) -> Optional[int]:
+    if len(args) >= 3:
+        return int(args[2])
+
+    return None
+
+
 if __name__ == "__main__":
     main()
@@ -1,4 +1,7 @@
 import socketserver
+import threading
+
+DEFAULT_MAX_CONNECTIONS = 256
 
 """
 A custom TCPServer object inheriting from socketserver's TCPServer. 
@@ -8,4 +11,46 @@ class MyTCPServer(socketserver.TCPServer):
     timeout = 3 # seconds
 
     def handle_timeout(self):
-        print("Error! No data received in 3 seconds, shutting down.")
\ No newline at end of file
+        print("Error! No data received in 3 seconds, shutting down.")
+
+
+"""
+A TCP server that handles every connection in its own thread, so many clients
+can be served at once. At most max_connections connections are handled at a
+time: once that many are open, the server stops accepting until one of them
+closes, and further clients wait in the listen backlog. Together with a bounded
+read buffer in the handler, this bounds the memory the server uses however many
+clients connect. A client that sends nothing for client_timeout seconds is
+disconnected, so idle clients cannot hold on to a connection forever.
+"""
+class MyThreadingTCPServer(socketserver.ThreadingMixIn, MyTCPServer):
+    daemon_threads = True
+    block_on_close = False
+    allow_reuse_address = True
+    request_queue_size = 1024
+    client_timeout = 30 # seconds
+
+    def __init__(self, server_address, handler_class,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS):
+        if max_connections < 1:
+            raise ValueError("The server must allow at least one connection")
+        self.max_connections = max_connections
+        self._connection_slots = threading.BoundedSemaphore(max_connections)
+        super().__init__(server_address, handler_class)
+
+    # Waits for a free connection slot before starting a thread for the request
+    def process_request(self, request, client_address):
+        self._connection_slots.acquire()
+        try:
+            super().process_request(request, client_address)
+        except BaseException:
+            self._connection_slots.release()
+            raise
+
+    # Handles the request in its thread, then frees its connection slot
+    def process_request_thread(self, request, client_address):
+        try:
+            request.settimeout(self.client_timeout)
+            super().process_request_thread(request, client_address)
+        finally:
+            self._connection_slots.release()
@@ -1,7 +1,8 @@
 import socketserver
 import json
-from typing import IO
+from typing import IO, Optional
 import c
+from json_stream import iter_json_values
 
 """
 A custom TCP handler object inheriting from socketserver's StreamRequestHandler
@@ -12,16 +13,24 @@ It reads json from the read stream (self.rfile) and writes to the write stream
 from assignment C.
 """
 class TCPJsonReverser(socketserver.StreamRequestHandler):
+    # The most characters a single JSON value may take up, which bounds the
+    # memory each connection uses for buffering its input
+    MAX_VALUE_SIZE = 1 << 20
+
     def handle(self) -> None:
-        TCPJsonReverser._read_and_write_reversed_json(self.rfile, self.wfile)
+        try:
+            TCPJsonReverser._read_and_write_reversed_json(self.rfile, self.wfile)
+        except (ValueError, RecursionError, OSError):
+            # The client sent a value that is too large or too deeply nested,
+            # went quiet for too long, or disconnected, so the connection is
+            # simply closed
+            pass
 
     # Reads JSON values from the given reader, reverses them, and writes
     # them to the writer
     @staticmethod
-    def _read_and_write_reversed_json(reader: IO, writer: IO) -> None:
-        json_input = c.get_next_json(reader)
-
-        while json_input != "":
-            writer.write(json.dumps(c.reverse_json(json_input)).encode())
-            writer.write("\n".encode())
-            json_input = c.get_next_json(reader)
\ No newline at end of file
+    def _read_and_write_reversed_json(reader: IO, writer: IO,
+                                      max_value_size: Optional[int] = MAX_VALUE_SIZE) -> None:
+        for json_input in iter_json_values(reader, skip_invalid=True,
+                                           max_value_size=max_value_size):
+            writer.write((json.dumps(c.reverse_json(json_input)) + "\n").encode())
@@ -1,10 +1,28 @@
+import socket
+import threading
 import unittest
 from io import BytesIO
 from c import reverse_json
-from main import get_port
+from json_stream import iter_json_values
+from main import LOCALHOST, get_max_connections, get_port
+from my_tcp_server import MyThreadingTCPServer
 from tcp_json_reverser import TCPJsonReverser
 
 
+class OpenStream:
+    """
+    A stream that returns the given chunks and then raises instead of reaching
+    its end, like a socket whose client has not closed it yet
+    """
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def read(self, size):
+        if not self.chunks:
+            raise BlockingIOError("No more input has arrived")
+        return self.chunks.pop(0)
+
+
 class ETests(unittest.TestCase):
     def test_get_port_default(self):
         self.assertEqual(45678, get_port(["Other/main.py"]))
@@ -12,6 +30,15 @@ class ETests(unittest.TestCase):
     def test_get_port(self):
         self.assertEqual(11111, get_port(["Other/main.py", "11111"]))
 
+    def test_get_port_with_max_connections(self):
+        self.assertEqual(11111, get_port(["Other/main.py", "11111", "100"]))
+
+    def test_get_max_connections_default(self):
+        self.assertIsNone(get_max_connections(["Other/main.py", "11111"]))
+
+    def test_get_max_connections(self):
+        self.assertEqual(100, get_max_connections(["Other/main.py", "11111", "100"]))
+
     def test_tcp_handler(self):
         mock_reader = BytesIO('{"foo" : "bar" } 123'.encode())
         mock_out = BytesIO()
@@ -21,6 +48,90 @@ class ETests(unittest.TestCase):
         self.assertEqual('{"foo": "rab"}\n-123\n', mock_out.read().decode())
 
 
+    def test_tcp_handler_invalid_json(self):
+        mock_reader = BytesIO('"foo" nope [1, 2]'.encode())
+        mock_out = BytesIO()
+        TCPJsonReverser._read_and_write_reversed_json(mock_reader, mock_out)
+        mock_out.seek(0)
+
+        self.assertEqual('"oof"\nnull\n[-2, -1]\n', mock_out.read().decode())
+
+    def test_tcp_handler_invalid_json_before_end_of_stream(self):
+        mock_reader = OpenStream([b'"foo" nope\n{"a": x', b'} [1, 2]\n'])
+        mock_out = BytesIO()
+        with self.assertRaises(BlockingIOError):
+            TCPJsonReverser._read_and_write_reversed_json(mock_reader, mock_out)
+        mock_out.seek(0)
+
+        self.assertEqual('"oof"\nnull\nnull\n[-2, -1]\n', mock_out.read().decode())
+
+    def test_tcp_handler_value_too_large(self):
+        mock_reader = BytesIO('"foo" [1, 2, 3, 4, 5]'.encode())
+        mock_out = BytesIO()
+        with self.assertRaises(ValueError):
+            TCPJsonReverser._read_and_write_reversed_json(mock_reader, mock_out, 10)
+        mock_out.seek(0)
+
+        self.assertEqual('"oof"\n', mock_out.read().decode())
+
+    def test_threading_server_concurrent_clients(self):
+        with MyThreadingTCPServer((LOCALHOST, 0), TCPJsonReverser, 4) as server:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                clients = [socket.create_connection(server.server_address, timeout=5)
+                           for _ in range(8)]
+                for index, client in enumerate(clients):
+                    client.sendall(('{"id": "ab%d"} ' % index).encode())
+                    client.shutdown(socket.SHUT_WR)
+                for index, client in enumerate(clients):
+                    with client, client.makefile("rb") as reader:
+                        self.assertEqual('{"id": "%dba"}\n' % index, reader.read().decode())
+            finally:
+                server.shutdown()
+
+    def test_threading_server_replies_in_turn_after_invalid_json(self):
+        requests = [(b"nope\n", "null\n"), (b'"ab"\n', '"ba"\n'), (b'{"a": x}\n', "null\n"),
+                    (b"[1, 2]\n", "[-2, -1]\n")]
+        with MyThreadingTCPServer((LOCALHOST, 0), TCPJsonReverser, 4) as server:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                clients = [socket.create_connection(server.server_address, timeout=5)
+                           for _ in range(4)]
+                readers = [client.makefile("rb") for client in clients]
+                for request, expected_reply in requests:
+                    for client in clients:
+                        client.sendall(request)
+                    for reader in readers:
+                        self.assertEqual(expected_reply, reader.readline().decode())
+                for client, reader in zip(clients, readers):
+                    reader.close()
+                    client.close()
+            finally:
+                server.shutdown()
+
+    def test_threading_server_replies_without_trailing_whitespace(self):
+        requests = [(b'[1,2]', "[-2, -1]\n"), (b'{"a":1}', '{"a": -1}\n'), (b'"ab"', '"ba"\n')]
+        with MyThreadingTCPServer((LOCALHOST, 0), TCPJsonReverser, 1) as server:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                with socket.create_connection(server.server_address, timeout=5) as client, \
+                        client.makefile("rb") as reader:
+                    for request, expected_reply in requests:
+                        client.sendall(request)
+                        self.assertEqual(expected_reply, reader.readline().decode())
+            finally:
+                server.shutdown()
+
+    def test_threading_server_needs_a_connection(self):
+        with self.assertRaises(ValueError):
+            MyThreadingTCPServer((LOCALHOST, 0), TCPJsonReverser, 0)
+
+    def test_iter_json_values_across_chunks(self):
+        json_bytes = '{"foo" : [12, "b\\"ar"] } 123 "\u00e9t\u00e9"'.encode()
+        for chunk_size in range(1, 6):
+            self.assertEqual([{"foo": [12, 'b"ar']}, 123, "\u00e9t\u00e9"],
+                             list(iter_json_values(BytesIO(json_bytes), chunk_size)))
+
     def test_reverse_json(self):
         initial_json = {
             "str": "hello",
@@ -1,11 +1,23 @@
+import io
 import itertools
-from typing import List, Tuple
+import multiprocessing
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import Trains.Other.admin_utils as admin_utils
+from Trains.Admin.player_registry import PlayerRegistry
 from Trains.Admin.referee import Referee
+from Trains.Admin.tournament_checkpoint import TournamentCheckpoint
 from Trains.Common.map import Map
 from Trains.Other.interfaces.i_map_generator import IMapGenerator
+from Trains.Other.game_result import GameResult
 from Trains.Other.interfaces.i_player import IPlayer
+from Trains.Other.ref_deck_strategies.random_deck_creation_strategy import RandomDeckCreationStrategy
+from Trains.Other.ref_destination_options_strategies.random_destination_options_strategy import \
+    RandomDestinationOptionsStrategy
+from Trains.Other.timings import TIMINGS, Timings
 
 
 class Manager:
@@ -15,24 +27,96 @@ class Manager:
     Manager is reponsible for running the tournament and determing the tournament's winners. Manager also keeps track
     of cheaters in this tournament. The manager also picks a valid map, given from the players, which gets assigned
     to each game in the tournament.
+
+    Each game gets its own random seed for its deck and destination options, drawn in group order before the round's
+    games start, so the games of a round can also be run in a pool of worker processes (see run_rounds) with the same
+    results as running them one after the other. Where the platform supports it, the workers are forked, so the map
+    and the players reach each worker once without being pickled, and locally defined players work as in a single
+    process. Each worker plays its games with its own copies of the players, so the results of the games come back as
+    the positions of each game's winners and cheaters in its group of players, which are mapped back to the manager's
+    players in group order, along with the game's timings and the state (the instance attributes) of each player of the
+    game after it, which is copied onto the manager's player. The map is not sent back with the players' states, a
+    player that refers to it refers to the manager's map again. Players whose attributes cannot be pickled, e.g. that
+    hold a socket, must therefore be run in a single process.
+
+    A tournament can write a checkpoint (see TournamentCheckpoint) after every round, which records the ids of the
+    active players and the cheaters, the map's fingerprint and the random state the remaining seeds are drawn from.
+    If the tournament is interrupted, resume_tournament continues it from the last completed round.
+
+    The manager records the time of setting up the tournament, of each round and of each game (table), as well as of
+    each call to a player, in TIMINGS, along with the referees of the games. Games run in worker processes send their
+    timings back with their results. A tournament can write the timings as a JSON report when it ends.
     """
+    SEED_BITS = 64
 
     @staticmethod
-    def run_tournament(players: List[IPlayer], map_generator: IMapGenerator) -> Tuple[List[IPlayer], List[IPlayer]]:
+    def run_tournament(players: List[IPlayer], map_generator: IMapGenerator, num_workers: int = 1,
+                       checkpoint_path: Optional[str] = None,
+                       report_path: Optional[str] = None) -> Tuple[List[IPlayer], List[IPlayer]]:
         """
         Runs an entire tournament.
         :param players: all players participating in the tournament
         :param map_generator: the strategy to generate a map
+        :param num_workers: the number of worker processes to run the games of each round in (see run_rounds)
+        :param checkpoint_path: if given, the file to write a checkpoint of the tournament to after every round, from
+                                which the tournament can be continued with resume_tournament
+        :param report_path: if given, TIMINGS is cleared when the tournament starts and written to this file as a
+                            JSON report when it ends
         :return: a result of a tournament represented as a tuple of lists of winner and cheaters
         """
-        all_cheaters = []
+        if report_path is not None:
+            TIMINGS.clear()
+        registry = PlayerRegistry(players)
         tournament_map, setup_cheaters = Manager.setup_tournament(players, map_generator)
-        active_players = Manager.__remove_players(players, setup_cheaters)
-        winners, game_cheaters = Manager.run_rounds(active_players, tournament_map)
-        all_cheaters = setup_cheaters + game_cheaters
-        non_losers = winners + all_cheaters
-        Manager.end_tournament(Manager.__remove_players(players, non_losers), winners)
-        return winners, all_cheaters
+        registry.mark_cheaters(setup_cheaters)
+        registry.eliminate(setup_cheaters)
+        winners = Manager.__run_registered_rounds(registry, tournament_map, num_workers, checkpoint_path)
+        return Manager.__finish_tournament(registry, winners, report_path)
+
+    @staticmethod
+    def resume_tournament(players: List[IPlayer], tournament_map: Map, checkpoint_path: str, num_workers: int = 1,
+                          report_path: Optional[str] = None) -> Tuple[List[IPlayer], List[IPlayer]]:
+        """
+        Continues a tournament run by run_tournament from the last round in its checkpoint. The tournament is not set
+        up again, and the seeds of the remaining games are drawn from the random state in the checkpoint, so the
+        remaining rounds have the same results as if the tournament had not been interrupted.
+        :param players: all players participating in the tournament, in the same order as given to run_tournament
+        :param tournament_map: the map the tournament is played on
+        :param checkpoint_path: the checkpoint file written by run_tournament, which is updated as the tournament goes
+        :param num_workers: the number of worker processes to run the games of each round in (see run_rounds)
+        :param report_path: if given, the file to write TIMINGS to as a JSON report when the tournament ends
+        :return: a result of a tournament represented as a tuple of lists of winner and cheaters
+        :raise ValueError: if the checkpoint is of a tournament with a different number of players or another map
+        """
+        checkpoint = TournamentCheckpoint.read(checkpoint_path)
+        if checkpoint.num_players != len(players):
+            raise ValueError("The checkpoint is of a tournament with a different number of players")
+        if checkpoint.map_fingerprint != tournament_map.fingerprint():
+            raise ValueError("The checkpoint is of a tournament on a different map")
+
+        registry = PlayerRegistry.from_ids(players, checkpoint.active_ids, checkpoint.cheater_ids)
+        random.setstate(checkpoint.rng_state)
+        winners = Manager.__run_registered_rounds(registry, tournament_map, num_workers, checkpoint_path, checkpoint)
+        return Manager.__finish_tournament(registry, winners, report_path)
+
+    @staticmethod
+    def __finish_tournament(registry: PlayerRegistry, winners: List[IPlayer],
+                            report_path: Optional[str]) -> Tuple[List[IPlayer], List[IPlayer]]:
+        """
+        Ends the tournament (see end_tournament).
+        SIDE-EFFECTS:
+            - Eliminates every participant that did not win
+            - Writes TIMINGS to report_path, if given
+        :param registry: the participants of the tournament
+        :param winners: the winners of the final round
+        :param report_path: the file to write the timings report to, if any
+        :return: a result of a tournament represented as a tuple of lists of winner and cheaters
+        """
+        registry.keep_winners(winners)
+        Manager.end_tournament(registry.get_losers(), winners)
+        if report_path is not None:
+            TIMINGS.write_report(report_path)
+        return winners, registry.get_cheaters()
 
     @staticmethod
     def setup_tournament(players: List[IPlayer], map_generator: IMapGenerator) -> Tuple[Map, List[IPlayer]]:
@@ -47,70 +131,193 @@ class Manager:
         cheaters = []
         for player in players:
             try:
-                player_maps.append(player.start(True))
+                with TIMINGS.measure(*Timings.player_key(player, "start")):
+                    player_maps.append(player.start(True))
             except:
                 cheaters.append(player)
-        tournament_map = Manager.__select_map(player_maps, map_generator)
+        with TIMINGS.measure("tournament", "map_selection"):
+            tournament_map = Manager.__select_map(player_maps, map_generator)
 
         return tournament_map, cheaters
 
     @staticmethod
     def __select_map(player_maps: List[Map], map_generator: IMapGenerator) -> Map:
         """
+        Maps are checked in the order they were given until one is valid. Maps with the same fingerprint as a map
+        that was already found invalid are skipped, so each distinct map is checked at most once.
         :param player_maps: maps to select from
         :param map_generator: the strategy to generate a map
-        :return: a valid map from the given list of maps. If none valid then return a default map
+        :return: the first valid map from the given list of maps. If none valid then return a default map
         """
-        valid_maps = [trains_map for trains_map in player_maps if
-                      admin_utils.check_valid_map(trains_map, admin_utils.MAX_NUM_PLAYERS)]
-        if valid_maps:
-            return valid_maps[0]
-        else:
-            return map_generator.generate_map()
+        invalid_fingerprints = set()
+        for trains_map in player_maps:
+            fingerprint = trains_map.fingerprint()
+            if fingerprint in invalid_fingerprints:
+                continue
+            if admin_utils.has_enough_destinations(trains_map, admin_utils.MAX_NUM_PLAYERS):
+                return trains_map
+            invalid_fingerprints.add(fingerprint)
+        return map_generator.generate_map()
 
     @staticmethod
-    def run_rounds(players: List[IPlayer], tournament_map: Map) -> Tuple[List[IPlayer], List[IPlayer]]:
+    def run_rounds(players: List[IPlayer], tournament_map: Map,
+                   num_workers: int = 1) -> Tuple[List[IPlayer], List[IPlayer]]:
         """
         Runs all round of the tournament. Distributes the number of players per game per round.
         :param players: all players participating in the tournament
         :param tournament_map: a map on which is used for all games in the tournament
+        :param num_workers: the number of worker processes to run the games of each round in. If 1, the games are run
+                            one after the other in this process. Otherwise, the players' attributes must be
+                            picklable (see Manager)
         :return: the tournaments winners and cheaters
         """
-        last_round_winners = []
-        active_players = players
-        all_cheaters = []
-        while not Manager.__should_end_tournament(last_round_winners, active_players):
-            winners, cheaters = Manager.__run_round(active_players, tournament_map)
-            last_round_winners = active_players
-            losers = Manager.__remove_players(active_players, winners)
-            active_players = Manager.__remove_players(active_players, losers)
-            all_cheaters += cheaters
-        if admin_utils.check_enough_players(len(active_players)):
-            winners, cheaters = Manager.__run_round(active_players, tournament_map)
-            all_cheaters += cheaters
-        return winners, all_cheaters
+        registry = PlayerRegistry(players)
+        winners = Manager.__run_registered_rounds(registry, tournament_map, num_workers)
+        return winners, registry.get_cheaters()
 
     @staticmethod
-    def __remove_players(original_players: List[IPlayer], players_to_remove: List[IPlayer]) -> List[IPlayer]:
+    def __run_registered_rounds(registry: PlayerRegistry, tournament_map: Map, num_workers: int,
+                                checkpoint_path: Optional[str] = None,
+                                checkpoint: Optional[TournamentCheckpoint] = None) -> List[IPlayer]:
         """
-        :return: the original players without players to remove 
+        Runs the rounds of the tournament that have not been played yet
+        SIDE-EFFECTS:
+            - Marks the cheaters of each round and eliminates the players that did not win it
+            - Writes a checkpoint to checkpoint_path after each round, if given
+        :param registry: the participants of the tournament
+        :param tournament_map: a map on which is used for all games in the tournament
+        :param num_workers: the number of worker processes to run the games of each round in
+        :param checkpoint_path: the file to write a checkpoint to after each round, if any
+        :param checkpoint: the checkpoint of the rounds that have already been played, if any
+        :return: the winners of the final round
         """
-        return [player for player in original_players if player not in players_to_remove]
+        if checkpoint is None:
+            num_rounds, last_round_num_players, is_finished, winners = 0, 0, False, []
+        else:
+            num_rounds, last_round_num_players, is_finished = \
+                checkpoint.num_rounds, checkpoint.last_round_num_players, checkpoint.is_finished
+            winners = registry.get_players(checkpoint.winner_ids)
+        if is_finished:
+            return winners
+
+        while not Manager.__should_end_tournament(last_round_num_players, registry.get_num_active()):
+            last_round_num_players = registry.get_num_active()
+            winners = Manager.__run_registered_round(registry, tournament_map, num_workers)
+            num_rounds += 1
+            if checkpoint_path is not None:
+                Manager.__make_checkpoint(registry, tournament_map, num_rounds, last_round_num_players, False,
+                                          winners).write(checkpoint_path)
+        if admin_utils.check_enough_players(registry.get_num_active()):
+            winners = Manager.__run_registered_round(registry, tournament_map, num_workers)
+            num_rounds += 1
+            if checkpoint_path is not None:
+                Manager.__make_checkpoint(registry, tournament_map, num_rounds, registry.get_num_active(), True,
+                                          winners).write(checkpoint_path)
+        return winners
+
+    @staticmethod
+    def __run_registered_round(registry: PlayerRegistry, tournament_map: Map, num_workers: int) -> List[IPlayer]:
+        """
+        Runs a single round of the tournament with the active participants
+        SIDE-EFFECTS:
+            - Marks the round's cheaters and eliminates the players that did not win it
+        :param registry: the participants of the tournament
+        :param tournament_map: a map on which is used for all games in this round
+        :param num_workers: the number of worker processes to run the games in
+        :return: the round's winners
+        """
+        with TIMINGS.measure("tournament", "round"):
+            winners, cheaters = Manager.__run_round(registry.get_active_players(), tournament_map, num_workers)
+        registry.mark_cheaters(cheaters)
+        registry.keep_winners(winners)
+        return winners
+
+    @staticmethod
+    def __make_checkpoint(registry: PlayerRegistry, tournament_map: Map, num_rounds: int,
+                          last_round_num_players: int, is_finished: bool,
+                          winners: List[IPlayer]) -> TournamentCheckpoint:
+        """
+        :param registry: the participants of the tournament
+        :param tournament_map: the map the tournament is played on
+        :param num_rounds: the number of rounds that have been completed
+        :param last_round_num_players: the number of players that played in the last completed round
+        :param is_finished: whether the final round has been played
+        :param winners: the winners of the last completed round
+        :return: a checkpoint of the tournament as it is now
+        """
+        return TournamentCheckpoint(registry.get_num_players(), tournament_map.fingerprint(), num_rounds,
+                                    last_round_num_players, is_finished, registry.get_active_ids(),
+                                    registry.get_cheater_ids(), registry.get_ids(winners), random.getstate())
 
     @staticmethod
-    def __run_round(active_players: List[IPlayer], tournament_map: Map) -> Tuple[List[IPlayer], List[IPlayer]]:
+    def __run_round(active_players: List[IPlayer], tournament_map: Map,
+                    num_workers: int) -> Tuple[List[IPlayer], List[IPlayer]]:
         """
         Runs a single round of the tournament.
         :param active_players: all currently active players
         :param tournament_map: a map on which is used for all games in this round
+        :param num_workers: the number of worker processes to run the games in
         :return: the round's winners in name order and cheaters in no order
         """
         player_groups = Manager.__distribute_players(active_players)
-        round_game_results = [Referee.run_game(tournament_map, group) for group in player_groups]
+        seeds = [random.getrandbits(Manager.SEED_BITS) for _ in player_groups]
+        if num_workers > 1 and len(player_groups) > 1:
+            return Manager.__run_round_in_workers(player_groups, seeds, tournament_map, num_workers)
+
+        round_game_results = [Manager.run_game(tournament_map, group, seed)
+                              for group, seed in zip(player_groups, seeds)]
         winners = list(itertools.chain(*[game_result.get_winners() for game_result in round_game_results]))
         cheaters = list(itertools.chain(*[game_result.get_cheaters() for game_result in round_game_results]))
         return winners, cheaters
 
+    @staticmethod
+    def __run_round_in_workers(player_groups: List[List[IPlayer]], seeds: List[int], tournament_map: Map,
+                               num_workers: int) -> Tuple[List[IPlayer], List[IPlayer]]:
+        """
+        Runs the games of a round in a pool of worker processes, which each receive the map and the groups once. The
+        map's feasible destinations are computed (and cached) before the workers start, so forked workers inherit them
+        instead of each searching the map again, possibly in a process pool of their own
+        SIDE-EFFECTS:
+            - Computes the feasible destinations of the map, if they are not cached yet
+            - Sets the attributes of each player to those of its copy at the end of its game
+        :param player_groups: the groups of players, one per game
+        :param seeds: the random seed of each game
+        :param tournament_map: a map on which is used for all games in this round
+        :param num_workers: the number of worker processes to run the games in
+        :return: the round's winners and cheaters, in the same order as if the games were run one after the other
+        """
+        admin_utils.get_feasible_destinations(tournament_map)
+        mp_context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() \
+            else None
+        with ProcessPoolExecutor(min(num_workers, len(player_groups)), mp_context,
+                                 initializer=_initialize_round_worker,
+                                 initargs=(tournament_map, player_groups)) as executor:
+            game_outcomes = list(executor.map(_run_game_in_worker, range(len(player_groups)), seeds))
+
+        winners = []
+        cheaters = []
+        for group, (winner_positions, cheater_positions, game_timings, player_states) in zip(player_groups,
+                                                                                             game_outcomes):
+            TIMINGS.merge(game_timings)
+            for player, player_state in zip(group, _RoundUnpickler(player_states, tournament_map).load()):
+                player.__dict__.update(player_state)
+            winners += [group[position] for position in winner_positions]
+            cheaters += [group[position] for position in cheater_positions]
+        return winners, cheaters
+
+    @staticmethod
+    def run_game(tournament_map: Map, players: List[IPlayer], seed: int) -> GameResult:
+        """
+        Runs a game of the tournament, whose deck and destination options are drawn from the given seed
+        :param tournament_map: a map on which is used for all games in the tournament
+        :param players: the players of the game
+        :param seed: the random seed of the game
+        :return: the result of the game
+        """
+        with TIMINGS.measure("tournament", "table"):
+            return Referee.run_game(tournament_map, players, admin_utils.STARTING_NUM_RAILS,
+                                    RandomDeckCreationStrategy(seed), RandomDestinationOptionsStrategy(seed))
+
     @staticmethod
     def __distribute_players(active_players: List[IPlayer]) -> List[List[IPlayer]]:
         """
@@ -119,23 +326,28 @@ class Manager:
         If the final group of players has less than the minimum number of players required to play the game, then pull players 
         from the previous group until the minimum requirement is satisfied
         """
-        player_groups = [active_players[i:i + admin_utils.MAX_NUM_PLAYERS] for i in
-                         range(0, len(active_players), admin_utils.MAX_NUM_PLAYERS)]
-        while len(player_groups[-1]) < admin_utils.MIN_NUM_PLAYERS:
-            player_groups[-1].insert(0, player_groups[-2].pop())
-        return player_groups
+        group_sizes = [admin_utils.MAX_NUM_PLAYERS] * (len(active_players) // admin_utils.MAX_NUM_PLAYERS)
+        if len(active_players) % admin_utils.MAX_NUM_PLAYERS:
+            group_sizes.append(len(active_players) % admin_utils.MAX_NUM_PLAYERS)
+        if len(group_sizes) > 1 and group_sizes[-1] < admin_utils.MIN_NUM_PLAYERS:
+            group_sizes[-2] -= admin_utils.MIN_NUM_PLAYERS - group_sizes[-1]
+            group_sizes[-1] = admin_utils.MIN_NUM_PLAYERS
+
+        group_ends = list(itertools.accumulate(group_sizes))
+        return [active_players[group_end - group_size:group_end]
+                for group_size, group_end in zip(group_sizes, group_ends)]
 
     @staticmethod
-    def __should_end_tournament(last_round_winners: List[IPlayer], active_players: List[IPlayer]) -> bool:
+    def __should_end_tournament(last_round_num_players: int, num_active_players: int) -> bool:
         """
-        Determines whether the tournament should end or not. If the length of two lists is the same or
-        the number of players is less than or equal to the minimum number of players required to play a game, 
+        Determines whether the tournament should end or not. If the two numbers are the same or
+        the number of players is less than or equal to the maximum number of players allowed in a game,
         the tournament should end.
-        :param last_round_winners: players that have won during the last round
-        :param active_players: all currently active players
+        :param last_round_num_players: the number of players that played in the last round
+        :param num_active_players: the number of currently active players
         :return: whether the tournament should end
         """
-        return len(last_round_winners) == len(active_players) or len(active_players) <= admin_utils.MAX_NUM_PLAYERS
+        return last_round_num_players == num_active_players or num_active_players <= admin_utils.MAX_NUM_PLAYERS
 
     @staticmethod
     def end_tournament(losers: List[IPlayer], winners: List[IPlayer]) -> None:
@@ -145,7 +357,79 @@ class Manager:
         :param winners: the players that have won
         """
         for loser in losers:
-            loser.end(False)
+            with TIMINGS.measure(*Timings.player_key(loser, "end")):
+                loser.end(False)
 
         for winner in winners:
-            winner.end(True)
+            with TIMINGS.measure(*Timings.player_key(winner, "end")):
+                winner.end(True)
+
+
+_round_map: Union[None, Map] = None
+_round_player_groups: List[List[IPlayer]] = []
+
+
+def _initialize_round_worker(tournament_map: Map, player_groups: List[List[IPlayer]]) -> None:
+    """
+    SIDE-EFFECTS:
+        - Stores the map and the groups of players of the round for the games this worker process runs
+    :param tournament_map: a map on which is used for all games in the round
+    :param player_groups: the groups of players of the round, one per game
+    """
+    global _round_map, _round_player_groups
+    _round_map = tournament_map
+    _round_player_groups = player_groups
+
+
+def _run_game_in_worker(group_index: int, seed: int) -> Tuple[List[int], List[int], Timings, bytes]:
+    """
+    Runs a game of the round in a worker process. The worker's players are copies of the manager's, so the results
+    are returned as positions in the group rather than as players, and the players' states are returned for the
+    manager to copy onto its players
+    SIDE-EFFECTS:
+        - Clears this worker's TIMINGS before the game
+    :param group_index: the index of the game's group of players
+    :param seed: the random seed of the game
+    :return: the positions in the group of the game's winners and of its cheaters, the timings of the game, and the
+             attributes of each player of the group after the game, pickled without the map (see _RoundPickler)
+    """
+    group = _round_player_groups[group_index]
+    positions: Dict[int, int] = {id(player): position for position, player in enumerate(group)}
+    TIMINGS.clear()
+    game_result = Manager.run_game(_round_map, group, seed)
+    player_states = io.BytesIO()
+    _RoundPickler(player_states).dump([vars(player) for player in group])
+    return [positions[id(player)] for player in game_result.get_winners()], \
+           [positions[id(player)] for player in game_result.get_cheaters()], TIMINGS, player_states.getvalue()
+
+
+class _RoundPickler(pickle.Pickler):
+    """
+    Pickles the states of a worker's players, referring to the round's map by a persistent id rather than copying it
+    """
+    MAP_ID = "map"
+
+    # Override
+    def persistent_id(self, obj: Any) -> Union[None, str]:
+        return _RoundPickler.MAP_ID if obj is _round_map else None
+
+
+class _RoundUnpickler(pickle.Unpickler):
+    """
+    Unpickles the states of a worker's players, resolving the round's map to the manager's map
+
+    Args:
+        data (bytes): the states pickled by a _RoundPickler
+        tournament_map (Map): the manager's map of the round
+    """
+    __tournament_map: Map
+
+    def __init__(self, data: bytes, tournament_map: Map):
+        super().__init__(io.BytesIO(data))
+        self.__tournament_map = tournament_map
+
+    # Override
+    def persistent_load(self, pid: Any) -> Map:
+        if pid != _RoundPickler.MAP_ID:
+            raise pickle.UnpicklingError(f"Unknown persistent id {pid}")
+        return self.__tournament_map
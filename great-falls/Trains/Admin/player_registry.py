@@ -0,0 +1,154 @@
+from typing import Dict, Iterable, List
+
+from Trains.Other.interfaces.i_player import IPlayer
+
+
+class PlayerRegistry:
+    """
+    Represents the participants of a Trains tournament, whether each of them is still active, and whether each of them
+    has cheated. Each participant is given a compact id, its position in the list of participants, and its status is
+    kept as bit flags in a bytearray indexed by id, so updating the status of k players takes O(k) time and listing
+    the players with a status takes time linear in the number of participants. Participants are identified by
+    identity, so players do not need to be hashable or comparable.
+
+    Args:
+        players (List[IPlayer]): the participants of the tournament, all of which start out active
+
+    Attributes:
+        __players (List[IPlayer]): the participants, indexed by id
+        __ids (Dict[int, int]): a mapping from the id() of each participant to its participant id
+        __statuses (bytearray): the status flags (ELIMINATED and CHEATER) of each participant, indexed by id
+        __active_ids (List[int]): the ids of the participants that are not eliminated, in increasing order
+        __cheater_ids (List[int]): the ids of the cheaters, in the order they were found cheating
+    """
+    ELIMINATED = 1
+    CHEATER = 2
+
+    __players: List[IPlayer]
+    __ids: Dict[int, int]
+    __statuses: bytearray
+    __active_ids: List[int]
+    __cheater_ids: List[int]
+
+    def __init__(self, players: List[IPlayer]):
+        self.__players = list(players)
+        self.__ids = {id(player): participant_id for participant_id, player in enumerate(self.__players)}
+        self.__statuses = bytearray(len(self.__players))
+        self.__active_ids = list(range(len(self.__players)))
+        self.__cheater_ids = []
+
+    @staticmethod
+    def from_ids(players: List[IPlayer], active_ids: Iterable[int], cheater_ids: Iterable[int]) -> 'PlayerRegistry':
+        """
+        :param players: the participants of the tournament
+        :param active_ids: the ids of the participants that are still active
+        :param cheater_ids: the ids of the participants that cheated, in the order they were found cheating
+        :return: a registry of the given participants with the given statuses
+        """
+        registry = PlayerRegistry(players)
+        registry.mark_cheaters(registry.get_players(cheater_ids))
+        active_ids = set(active_ids)
+        registry.eliminate(player for participant_id, player in enumerate(registry.__players)
+                           if participant_id not in active_ids)
+        return registry
+
+    def get_num_players(self) -> int:
+        """
+        :return: the number of participants
+        """
+        return len(self.__players)
+
+    def get_num_active(self) -> int:
+        """
+        :return: the number of active participants
+        """
+        return len(self.__active_ids)
+
+    def get_active_players(self) -> List[IPlayer]:
+        """
+        :return: the active participants, in the order they were registered
+        """
+        return [self.__players[participant_id] for participant_id in self.__active_ids]
+
+    def get_cheaters(self) -> List[IPlayer]:
+        """
+        :return: the participants that cheated, in the order they were found cheating
+        """
+        return [self.__players[participant_id] for participant_id in self.__cheater_ids]
+
+    def get_losers(self) -> List[IPlayer]:
+        """
+        :return: the eliminated participants that did not cheat, in the order they were registered
+        """
+        return [player for player, status in zip(self.__players, self.__statuses) if status == self.ELIMINATED]
+
+    def get_active_ids(self) -> List[int]:
+        """
+        :return: the ids of the active participants, in increasing order
+        """
+        return list(self.__active_ids)
+
+    def get_cheater_ids(self) -> List[int]:
+        """
+        :return: the ids of the participants that cheated, in the order they were found cheating
+        """
+        return list(self.__cheater_ids)
+
+    def get_ids(self, players: Iterable[IPlayer]) -> List[int]:
+        """
+        :param players: participants of the tournament
+        :return: the ids of the given participants, in the same order
+        """
+        return [self.__ids[id(player)] for player in players]
+
+    def get_players(self, participant_ids: Iterable[int]) -> List[IPlayer]:
+        """
+        :param participant_ids: ids of participants of the tournament
+        :return: the participants with the given ids, in the same order
+        """
+        return [self.__players[participant_id] for participant_id in participant_ids]
+
+    def mark_cheaters(self, cheaters: Iterable[IPlayer]) -> None:
+        """
+        SIDE-EFFECTS:
+            - Marks the given participants as cheaters. Players that are not participants or are already marked are
+              ignored
+        :param cheaters: the players who cheated
+        """
+        for cheater in cheaters:
+            participant_id = self.__ids.get(id(cheater))
+            if participant_id is not None and not self.__statuses[participant_id] & self.CHEATER:
+                self.__statuses[participant_id] |= self.CHEATER
+                self.__cheater_ids.append(participant_id)
+
+    def eliminate(self, players: Iterable[IPlayer]) -> None:
+        """
+        SIDE-EFFECTS:
+            - Marks the given participants as eliminated. Players that are not participants are ignored
+        :param players: the players to eliminate
+        """
+        for player in players:
+            participant_id = self.__ids.get(id(player))
+            if participant_id is not None:
+                self.__statuses[participant_id] |= self.ELIMINATED
+        self.__update_active_ids()
+
+    def keep_winners(self, winners: Iterable[IPlayer]) -> None:
+        """
+        SIDE-EFFECTS:
+            - Marks every active participant that is not one of the given winners as eliminated
+        :param winners: the players who stay active
+        """
+        winner_ids = {self.__ids.get(id(winner)) for winner in winners}
+        for participant_id in self.__active_ids:
+            if participant_id not in winner_ids:
+                self.__statuses[participant_id] |= self.ELIMINATED
+        self.__update_active_ids()
+
+    def __update_active_ids(self) -> None:
+        """
+        SIDE-EFFECTS:
+            - Drops the participants that are no longer active from __active_ids
+        """
+        self.__active_ids = [participant_id for participant_id in self.__active_ids
+                             if not self.__statuses[participant_id] & self.ELIMINATED]
@@ -1,11 +1,13 @@
 from collections import deque
-from typing import Iterable, List, Set, Deque
+from typing import List, Set, Deque
 
 from Trains.Admin.referee_game_state import RefereeGameState
 from Trains.Common.map import Map
 from Trains.Other.cards import Cards
 from Trains.Other.color import Color
+from Trains.Other.deck import Deck
 from Trains.Other.destination import Destination
+from Trains.Other.destination_pool import DestinationPool
 from Trains.Other.game_result import GameResult
 import Trains.Other.admin_utils as admin_utils
 from Trains.Other.interfaces.i_player import IPlayer
@@ -15,6 +17,7 @@ from Trains.Other.player_state import PrivatePlayerState, PublicPlayerState
 from Trains.Other.ref_deck_strategies.random_deck_creation_strategy import RandomDeckCreationStrategy
 from Trains.Other.ref_destination_options_strategies.random_destination_options_strategy import \
     RandomDestinationOptionsStrategy
+from Trains.Other.timings import TIMINGS, Timings
 
 
 class IllegalTurnError(Exception):
@@ -35,6 +38,8 @@ class Referee:
     an issue, so the Referee does not handle it currently. The Referee also handles illegal turns, such as acquiring a
     connection that does not exist or invalid return destinations.
 
+    The Referee records the time of each phase of the game and of each call to a player in TIMINGS.
+
     Args:
         trains_map (Map): the map for the Trains game
         starting_rails_count (int): the number of rails each player gets. The default is 45
@@ -83,21 +88,14 @@ class Referee:
         valid_game = referee.__check_valid_game(map, players)
         if not valid_game:
             raise ValueError("Game was invalid")
-        referee.setup_game(players)
-        referee.run_turns()
+        with TIMINGS.measure("referee", "setup"):
+            referee.setup_game(players)
+        with TIMINGS.measure("referee", "turns"):
+            referee.run_turns()
         game_result = referee.end_game()
 
         return game_result
 
-    def __remove_destinations(self, destinations: List[Destination], destinations_to_remove: Iterable[Destination]) -> \
-            List[Destination]:
-        """
-        :param destinations: a list of destinations
-        :param destinations_to_remove: the destinations to be removed
-        :return given destinations list after removing the given destinations
-        """
-        return [destination for destination in destinations if destination not in destinations_to_remove]
-
     def setup_game(self, players: List[IPlayer]) -> None:
         """
         Setup a Trains game by giving all players their initial pieces and getting their destination choices.
@@ -107,16 +105,16 @@ class Referee:
             - Side-effects from __setup_player
         :param players: a list of players in turn order
         """
-        destinations = self.__generate_destination_ordering()
+        destination_pool = self.__create_destination_pool()
         final_states_and_players = []
-        card_deck = self.__deck_creation_strategy.create_deck(admin_utils.STARTING_DECK_SIZE)
+        card_deck = Deck(self.__deck_creation_strategy.create_deck(admin_utils.STARTING_DECK_SIZE))
         for player in players:
             try:
                 # todo: simplify try/except
-                private_player_state, selected_destinations = self.__setup_player(player, destinations,
-                                                                                  card_deck[:admin_utils.STARTING_NUM_CARDS])
-                card_deck = card_deck[admin_utils.STARTING_NUM_CARDS:]
-                destinations = self.__remove_destinations(destinations, selected_destinations)
+                private_player_state, selected_destinations = self.__setup_player(
+                    player, destination_pool, card_deck.peek(admin_utils.STARTING_NUM_CARDS))
+                card_deck = card_deck.draw(admin_utils.STARTING_NUM_CARDS)
+                destination_pool.remove(selected_destinations)
                 final_states_and_players.append((private_player_state, player))
             except:
                 self.__cheaters.append(player)
@@ -149,7 +147,8 @@ class Referee:
         """
         remaining_players = self.__game_state.get_players()
         if remaining_players:
-            scores = self.__game_state.count_scores()
+            with TIMINGS.measure("referee", "scoring"):
+                scores = self.__game_state.count_scores()
             game_result = GameResult(remaining_players, scores, self.__cheaters)
         else:
             game_result = GameResult([], [], self.__cheaters)
@@ -157,28 +156,30 @@ class Referee:
         game_winners = game_result.get_winners()
         #todo: handle errors from player
         for player in remaining_players:
-            player.win(player in game_winners)
+            with TIMINGS.measure(*Timings.player_key(player, "win")):
+                player.win(player in game_winners)
 
         return game_result
 
-    def __setup_player(self, player: IPlayer, destinations: List[Destination], cards: List[Color]) \
-            -> (PrivatePlayerState, List[Destination]):
+    def __setup_player(self, player: IPlayer, destination_pool: DestinationPool, cards: List[Color]) \
+            -> (PrivatePlayerState, Set[Destination]):
         """
         Setup a given player for the game by passing them their initial pieces and getting their destination choices.
         :param player: the player to setup
-        :param destinations: the destinations to pick from
+        :param destination_pool: the destinations to offer the player
         :param cards: the cards this player starts with
-        :return: the player's state and the destinations it did not pick
+        :return: the player's state and the destinations it picked
         """
-        player.setup(self.__trains_map, self.__starting_rails_count, cards)
-        offered_destinations = destinations[:5]
-        offered_destinations_set = set(offered_destinations)
-        unwanted_destinations = player.pick(offered_destinations_set)
+        with TIMINGS.measure(*Timings.player_key(player, "setup")):
+            player.setup(self.__trains_map, self.__starting_rails_count, cards)
+        offered_destinations_set = set(destination_pool.offer(admin_utils.NUM_DESTINATION_OPTIONS))
+        with TIMINGS.measure(*Timings.player_key(player, "pick")):
+            unwanted_destinations = player.pick(offered_destinations_set)
         self.__check_returned_destinations(unwanted_destinations, offered_destinations_set)
         picked_destinations = offered_destinations_set - unwanted_destinations
         return PrivatePlayerState(Cards.from_list(cards), picked_destinations, self.__starting_rails_count,
-                                  PublicPlayerState(set())), self.__remove_destinations(offered_destinations,
-                                                                                        unwanted_destinations)
+                                  PublicPlayerState(set(), connection_index=self.__trains_map.get_connection_index())), \
+            picked_destinations
 
     def __should_continue_turns(self, previous_game_states: Deque[RefereeGameState]) -> bool:
         """
@@ -201,7 +202,10 @@ class Referee:
         :return: whether the turn was successful (aka whether the player's turn was legal)
         """
         try:
-            player_turn = self.__game_state.get_current_player().play(self.__game_state.create_player_game_state())
+            current_player = self.__game_state.get_current_player()
+            player_game_state = self.__game_state.create_player_game_state()
+            with TIMINGS.measure(*Timings.player_key(current_player, "play")):
+                player_turn = current_player.play(player_game_state)
             self.__perform_player_turn(player_turn)
             self.__progress_turn()
             return True
@@ -221,7 +225,8 @@ class Referee:
             current_player = self.__game_state.get_current_player()
             drawn_cards = self.__game_state.get_cards_to_draw()
             self.__game_state = self.__game_state.draw_cards(drawn_cards)
-            current_player.more_cards(drawn_cards)
+            with TIMINGS.measure(*Timings.player_key(current_player, "more_cards")):
+                current_player.more_cards(drawn_cards)
         else:
             if not self.__game_state.can_acquire_connection(player_turn):
                 raise IllegalTurnError("Current player attempting to illegally acquire a connection")
@@ -269,9 +274,14 @@ class Referee:
         self.__cheaters.append(cheater)
         self.__game_state = self.__game_state.remove_cheater()
 
-    def __generate_destination_ordering(self) -> List[Destination]:
-        destinations = self.__trains_map.get_feasible_destinations(admin_utils.STARTING_NUM_RAILS)
-        return self.__destination_options_strategy.order_destinations(destinations)
+    def __create_destination_pool(self) -> DestinationPool:
+        """
+        The feasible destinations are handed to the destination options strategy in lexicographic order, which is
+        cached for the map, so that the ordering does not depend on set iteration order
+        :return: a pool of the feasible destinations, lazily ordered by the destination options strategy
+        """
+        destinations = self.__trains_map.get_sorted_feasible_destinations(admin_utils.STARTING_NUM_RAILS)
+        return DestinationPool(self.__destination_options_strategy.iter_destinations(destinations))
 
     def __check_returned_destinations(self, returned_destinations: Set[Destination],
                                       offered_destinations: Set[Destination]) -> None:
@@ -1,16 +1,19 @@
 from collections import deque
 from itertools import islice
-from typing import List, Set, Deque, Tuple
+from typing import List, Deque, Tuple, Union
 
+from Trains.Common.acquirable_connections import AcquirableConnections
 from Trains.Common.map import Map
+from Trains.Common.owned_subgraph import OwnedSubgraph
 from Trains.Common.player_game_state import PlayerGameState
 from Trains.Other.cards import Cards
 from Trains.Other.color import Color
-from Trains.Other.destination import Destination
-from Trains.Other.directed_connection import DirectedConnection
+from Trains.Other.deck import Deck
 from Trains.Other.interfaces.i_player import IPlayer
 from Trains.Other.player_state import PrivatePlayerState
+from Trains.Other.score_breakdown import ScoreBreakdown
 from Trains.Other.undirected_connection import UndirectedConnection
+from Trains.Other.zobrist_keys import HASH_BITS, HASH_MASK
 
 
 class RefereeGameState:
@@ -18,37 +21,107 @@ class RefereeGameState:
     Represents the knowledge the referee has for a Trains game. All methods in the RefereeGameState assume that there
     is at least 1 player in the game.
 
+    Every game state carries a 64-bit hash that is updated incrementally as turns are played, so comparing game states
+    only compares their contents when their hashes are equal. The hash combines:
+     -- a polynomial hash over the hashes of the (player state, player) pairs in turn order, with the first pair having
+        weight 1, so rotating the players or replacing the current player's state takes O(1) work
+     -- the Zobrist hash of the deck (see Deck), so drawing cards only removes the keys of the drawn cards
+
     Args:
         map (Map): the map of the game
         states_and_players (Deque[Tuple[PrivatePlayerState, IPlayer]]: the private player states tupled with their
             player in turn order
-        cards (List[Color]): the deck of colored cards the ref can give to players
+        cards (Union[List[Color], Deck]): the deck of colored cards the ref can give to players
 
     Attributes:
         __map (Map): the map of the game
         __states_and_players (Deque[Tuple[PrivatePlayerState, IPlayer]]): the private player states tupled with the owning
             Player
           The list rotates so the first element is always the player whose turn it is
-        __cards (List[Color]): the deck of colored cards the ref can give to players
+        __deck (Deck): the deck of colored cards the ref can give to players
+        __players_hash (int): the polynomial hash of __states_and_players
+        __acquirable_connections (AcquirableConnections): the connections of the map nobody owns, bucketed by color and
+            length. Each player's acquirable connections are read from it, and it is the only record of whether a
+            connection is still available
     """
     MIN_RAILS = 3
     CARDS_PER_REQUEST = 2
+    CONNECTED_DESTINATION_POINTS = 10
+    LONGEST_ROUTE_POINTS = 20
+    HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+    HASH_MULTIPLIER_INVERSE = pow(HASH_MULTIPLIER, -1, 1 << HASH_BITS)
     __map: Map
     __states_and_players: Deque[Tuple[PrivatePlayerState, IPlayer]]
+    __deck: Deck
+    __players_hash: int
+    __acquirable_connections: AcquirableConnections
 
-    def __init__(self, map: Map, states_and_players: Deque[Tuple[PrivatePlayerState, IPlayer]], cards: List[Color]):
+    def __init__(self, map: Map, states_and_players: Deque[Tuple[PrivatePlayerState, IPlayer]],
+                 cards: Union[List[Color], Deck]):
         self.__map = map
         self.__states_and_players = states_and_players
-        self.__cards = cards
+        self.__deck = cards if isinstance(cards, Deck) else Deck(cards)
+        self.__players_hash = 0
+        for state_and_player in reversed(states_and_players):
+            self.__players_hash = (self.__players_hash * self.HASH_MULTIPLIER + self.__hash_slot(state_and_player)) \
+                & HASH_MASK
+        owned_connections = {connection for player_state, _ in states_and_players
+                             for connection in player_state.public_state.acquired_connections}
+        self.__acquirable_connections = AcquirableConnections(
+            map.get_connection_index(),
+            (connection for connection in map.get_sorted_undirected_connections()
+             if connection not in owned_connections))
 
     def __eq__(self, other):
         # ignore map, even though we shouldn't
         return isinstance(other, RefereeGameState) and \
-               self.__states_and_players == other.__states_and_players and \
-               self.__cards == other.__cards
+               self.__players_hash == other.__players_hash and \
+               self.__deck == other.__deck and \
+               self.__states_and_players == other.__states_and_players
 
     def __hash__(self):
-        return hash((tuple(self.__cards), tuple(self.__states_and_players)))
+        return self.__players_hash ^ hash(self.__deck)
+
+    @staticmethod
+    def __hash_slot(state_and_player: Tuple[PrivatePlayerState, IPlayer]) -> int:
+        """
+        :param state_and_player: a player state tupled with its player
+        :return: the 64-bit hash of the pair
+        """
+        return hash(state_and_player) & HASH_MASK
+
+    def __derive(self, states_and_players: Deque[Tuple[PrivatePlayerState, IPlayer]], deck: Deck,
+                 players_hash: int, acquirable_connections: AcquirableConnections) -> 'RefereeGameState':
+        """
+        Creates a game state on the same map whose hashes and ownership have already been computed incrementally
+        :param states_and_players: the player states tupled with their players in turn order
+        :param deck: the deck of cards
+        :param players_hash: the polynomial hash of states_and_players
+        :param acquirable_connections: the connections of the map nobody owns
+        :return: the new game state
+        """
+        new_game_state = RefereeGameState.__new__(RefereeGameState)
+        new_game_state.__map = self.__map
+        new_game_state.__states_and_players = states_and_players
+        new_game_state.__deck = deck
+        new_game_state.__players_hash = players_hash
+        new_game_state.__acquirable_connections = acquirable_connections
+        return new_game_state
+
+    def __replace_current_player_state(self, new_player_state: PrivatePlayerState, deck: Deck,
+                                       acquirable_connections: AcquirableConnections) -> 'RefereeGameState':
+        """
+        :param new_player_state: the new state of the current player
+        :param deck: the deck of cards of the new game state
+        :param acquirable_connections: the connections of the map nobody owns in the new game state
+        :return: a new game state where the current player has the new state
+        """
+        new_states_and_players = deque(self.__states_and_players)
+        old_slot = new_states_and_players[0]
+        new_states_and_players[0] = new_player_state, old_slot[1]
+        players_hash = (self.__players_hash - self.__hash_slot(old_slot) + self.__hash_slot(new_states_and_players[0])) \
+            & HASH_MASK
+        return self.__derive(new_states_and_players, deck, players_hash, acquirable_connections)
 
     def get_players(self) -> List[IPlayer]:
         return [player_and_state[1] for player_and_state in self.__states_and_players]
@@ -69,16 +142,20 @@ class RefereeGameState:
         private_other_states = islice(all_private_states, 1, len(all_private_states))
         public_other_states = [player_state.public_state for player_state in private_other_states]
 
-        return PlayerGameState(self.__map, own_state, public_other_states)
+        return PlayerGameState(self.__map, own_state, public_other_states, self.__acquirable_connections)
 
     def can_acquire_connection(self, connection: UndirectedConnection) -> bool:
         """
-        Checks if the connection can be acquired based on the current state of the game
+        Checks if the connection can be acquired based on the current state of the game. A connection is acquirable if
+        it is a connection of the map, nobody owns it (i.e. it is one of the unowned connections), and the active player
+        has enough cards and rails for it
         :param connection: the connection to be acquired
         :return: whether the connection is acquirable
         """
-        player_game_state = self.create_player_game_state()
-        return connection in player_game_state.get_acquirable_connections()
+        current_player_state = self.__states_and_players[0][0]
+        return self.__acquirable_connections.is_unowned(connection) and \
+            current_player_state.cards.get_card_count(connection.color) >= connection.length and \
+            current_player_state.num_rails >= connection.length
 
     def acquire_connection(self, connection: UndirectedConnection) -> 'RefereeGameState':
         """
@@ -90,8 +167,8 @@ class RefereeGameState:
         """
         current_player_state = self.__states_and_players[0][0]
         new_player_state = current_player_state.buy_connection(connection)
-        self.__states_and_players[0] = new_player_state, self.__states_and_players[0][1]
-        return RefereeGameState(self.__map, self.__states_and_players, self.__cards)
+        return self.__replace_current_player_state(new_player_state, self.__deck,
+                                                   self.__acquirable_connections.claim(connection))
 
     def reached_termination_condition(self) -> bool:
         """
@@ -107,36 +184,42 @@ class RefereeGameState:
         """
         new_states_and_players = deque(self.__states_and_players)
         new_states_and_players.rotate(-1)
-        return RefereeGameState(self.__map, new_states_and_players, self.__cards)
+        first_slot_hash = self.__hash_slot(self.__states_and_players[0])
+        last_slot_weight = pow(self.HASH_MULTIPLIER, len(new_states_and_players) - 1, 1 << HASH_BITS)
+        players_hash = ((self.__players_hash - first_slot_hash) * self.HASH_MULTIPLIER_INVERSE +
+                        first_slot_hash * last_slot_weight) & HASH_MASK
+        return self.__derive(new_states_and_players, self.__deck, players_hash, self.__acquirable_connections)
 
     def remove_cheater(self) -> 'RefereeGameState':
         """
-        Removes the current active player because it cheated
+        Removes the current active player because it cheated. The connections it acquired become available again
         :return: a new game state with the current player removed
         """
-        self.__states_and_players.popleft()
-        return RefereeGameState(self.__map, self.__states_and_players, self.__cards)
+        new_states_and_players = deque(self.__states_and_players)
+        cheater_slot = new_states_and_players.popleft()
+        players_hash = ((self.__players_hash - self.__hash_slot(cheater_slot)) * self.HASH_MULTIPLIER_INVERSE) \
+            & HASH_MASK
+        cheater_connections = cheater_slot[0].public_state.acquired_connections
+        map_connections = self.__map.get_undirected_connections()
+        new_acquirable_connections = self.__acquirable_connections.release(
+            connection for connection in cheater_connections if connection in map_connections)
+        return self.__derive(new_states_and_players, self.__deck, players_hash, new_acquirable_connections)
 
     def draw_cards(self, drawn_cards: List[Color]) -> 'RefereeGameState':
         """
         Add the drawn cards to the current active player
         :return: a new game state with the current player having received the drawn cards
         """
-        remaining_cards = self.__cards[len(drawn_cards):]
         current_player_state = self.__states_and_players[0][0]
         new_player_state = current_player_state.draw_cards(Cards.from_list(drawn_cards))
-        self.__states_and_players[0] = new_player_state, self.__states_and_players[0][1]
-        return RefereeGameState(self.__map, self.__states_and_players, remaining_cards)
+        return self.__replace_current_player_state(new_player_state, self.__deck.draw(len(drawn_cards)),
+                                                   self.__acquirable_connections)
 
     def get_cards_to_draw(self) -> List[Color]:
         """
         :return: the cards to give to a player when they request cards
         """
-        if len(self.__cards) >= self.CARDS_PER_REQUEST:
-            drawn_cards = self.__cards[:self.CARDS_PER_REQUEST]
-        else:
-            drawn_cards = self.__cards.copy()
-        return drawn_cards
+        return self.__deck.peek(self.CARDS_PER_REQUEST)
 
     def count_scores(self) -> List[int]:
         """
@@ -145,58 +228,34 @@ class RefereeGameState:
         holding the longest continuous path (which multiple players can have).
         :return: a list of scores, where the ordering mirrors the ordering of self.player_states
         """
-        player_segment_counts = [self.__count_segment_score(player_state) for player_state in
-                                 self.__get_player_states()]
-        player_destination_scores = [self.__count_connected_destinations_score(player_state) for player_state in
-                                     self.__get_player_states()]
-        player_longest_path_scores = self.__count_longest_path_score()
-
-        return [player_segment_counts[i] + player_destination_scores[i] + player_longest_path_scores[i] for i in
-                range(len(player_segment_counts))]
+        return [score_breakdown.get_total() for score_breakdown in self.get_score_breakdowns()]
 
-    def __count_segment_score(self, player_state: PrivatePlayerState) -> int:
+    def get_score_breakdowns(self) -> List[ScoreBreakdown]:
         """
-        :param player_state: the player to compute the score for
-        :return: the score for the player's acquired segments
+        Computes the parts of each player's score (see count_scores) in a single pass over the players. Each player's
+        owned subgraph is built once, and its segments, destination connectivity and longest route all come from it
+        :return: a list of score breakdowns, where the ordering mirrors the ordering of self.player_states
         """
-        acquired_connections_segment_count = map(lambda undirected_connection: undirected_connection.length,
-                                                 player_state.public_state.acquired_connections)
+        player_states = self.__get_player_states()
+        owned_subgraphs = [self.__map.get_owned_subgraph(player_state.public_state.acquired_connections)
+                           for player_state in player_states]
+        longest_routes = [owned_subgraph.get_longest_route() for owned_subgraph in owned_subgraphs]
+        longest_route = max(longest_routes, default=0)
 
-        return sum(acquired_connections_segment_count)
+        return [ScoreBreakdown(owned_subgraph.get_num_segments(),
+                               self.__count_destination_score(player_state, owned_subgraph),
+                               player_longest_route,
+                               self.LONGEST_ROUTE_POINTS if player_longest_route == longest_route else 0)
+                for player_state, owned_subgraph, player_longest_route in
+                zip(player_states, owned_subgraphs, longest_routes)]
 
-    def __count_connected_destinations_score(self, player_state: PrivatePlayerState) -> int:
+    def __count_destination_score(self, player_state: PrivatePlayerState, owned_subgraph: OwnedSubgraph) -> int:
         """
         :param player_state: the player to compute the score for
+        :param owned_subgraph: the subgraph of the connections the player acquired
         :return: the total score for the connections (or lack thereof) of the player's destinations
         """
-        player_directed_connections = DirectedConnection.convert_undirected_connections(
-            player_state.public_state.acquired_connections)
-        player_destination_scores = map(
-            lambda destination: self.__get_destination_score(destination, player_directed_connections),
-            player_state.destinations)
-
-        return sum(player_destination_scores)
-
-    def __get_destination_score(self, destination: Destination,
-                                acquired_directed_connections: Set[DirectedConnection]) -> int:
-        """
-        :param destination: the destination to check connection for
-        :param acquired_directed_connections: the acquired connections
-        :return: 10 if the destination is connected, -10 otherwise
-        """
-        if self.__map.are_cities_connected(destination.city_1, destination.city_2, acquired_directed_connections):
-            return 10
-        return -10
-
-    def __count_longest_path_score(self) -> List[int]:
-        """
-        :return: a list of scores, where the player(s) who holds the longest continuous path has 20 and everyone else
-        has 0. The ordering of this list mirrors the ordering of self.player_states
-        """
-        longest_continuous_path_per_player = [
-            self.__map.longest_continuous_route(
-                DirectedConnection.convert_undirected_connections(player.public_state.acquired_connections)) for
-            player in self.__get_player_states()]
-        longest_continuous_path = max(longest_continuous_path_per_player)
-        return [20 if longest_continuous_path == player_longest_continuous_path else 0 for
-                player_longest_continuous_path in longest_continuous_path_per_player]
+        return sum(self.CONNECTED_DESTINATION_POINTS
+                   if owned_subgraph.are_cities_connected(destination.city_1, destination.city_2)
+                   else -self.CONNECTED_DESTINATION_POINTS
+                   for destination in player_state.destinations)
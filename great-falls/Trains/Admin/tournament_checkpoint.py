@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+
+class TournamentCheckpoint:
+    """
+    Represents the progress of a Trains tournament after a completed round, which is enough to continue the tournament
+    from the next round. Participants are referred to by their ids in the tournament's PlayerRegistry, i.e. their
+    positions in the list of participants, so a checkpoint stays small however the players are implemented.
+
+    Args:
+        num_players (int): the number of participants of the tournament
+        map_fingerprint (str): the fingerprint of the tournament's map (see Map.fingerprint)
+        num_rounds (int): the number of rounds that have been completed
+        last_round_num_players (int): the number of players that played in the last completed round
+        is_finished (bool): whether the final round has been played
+        active_ids (List[int]): the ids of the participants that are still active
+        cheater_ids (List[int]): the ids of the cheaters, in the order they were found cheating
+        winner_ids (List[int]): the ids of the winners of the last completed round, in the order they were returned
+        rng_state (Tuple): the state of the random module (see random.getstate), from which the seeds of the
+                           remaining games are drawn
+
+    Attributes:
+        num_players (int): the number of participants of the tournament
+        map_fingerprint (str): the fingerprint of the tournament's map
+        num_rounds (int): the number of rounds that have been completed
+        last_round_num_players (int): the number of players that played in the last completed round
+        is_finished (bool): whether the final round has been played
+        active_ids (List[int]): the ids of the participants that are still active
+        cheater_ids (List[int]): the ids of the cheaters, in the order they were found cheating
+        winner_ids (List[int]): the ids of the winners of the last completed round
+        rng_state (Tuple): the state of the random module
+    """
+    num_players: int
+    map_fingerprint: str
+    num_rounds: int
+    last_round_num_players: int
+    is_finished: bool
+    active_ids: List[int]
+    cheater_ids: List[int]
+    winner_ids: List[int]
+    rng_state: Tuple
+
+    def __init__(self, num_players: int, map_fingerprint: str, num_rounds: int, last_round_num_players: int,
+                 is_finished: bool, active_ids: List[int], cheater_ids: List[int], winner_ids: List[int],
+                 rng_state: Tuple):
+        self.num_players = num_players
+        self.map_fingerprint = map_fingerprint
+        self.num_rounds = num_rounds
+        self.last_round_num_players = last_round_num_players
+        self.is_finished = is_finished
+        self.active_ids = active_ids
+        self.cheater_ids = cheater_ids
+        self.winner_ids = winner_ids
+        self.rng_state = rng_state
+
+    def __eq__(self, other):
+        return isinstance(other, TournamentCheckpoint) and self.to_dict() == other.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: a JSON serializable dictionary with the fields of the checkpoint
+        """
+        version, internal_state, gauss_next = self.rng_state
+        return {"num_players": self.num_players, "map_fingerprint": self.map_fingerprint,
+                "num_rounds": self.num_rounds, "last_round_num_players": self.last_round_num_players,
+                "is_finished": self.is_finished, "active_ids": list(self.active_ids),
+                "cheater_ids": list(self.cheater_ids), "winner_ids": list(self.winner_ids),
+                "rng_state": [version, list(internal_state), gauss_next]}
+
+    @staticmethod
+    def from_dict(checkpoint_dict: Dict[str, Any]) -> 'TournamentCheckpoint':
+        """
+        :param checkpoint_dict: a dictionary from to_dict
+        :return: the checkpoint the dictionary represents
+        """
+        version, internal_state, gauss_next = checkpoint_dict["rng_state"]
+        return TournamentCheckpoint(checkpoint_dict["num_players"], checkpoint_dict["map_fingerprint"],
+                                    checkpoint_dict["num_rounds"], checkpoint_dict["last_round_num_players"],
+                                    checkpoint_dict["is_finished"], checkpoint_dict["active_ids"],
+                                    checkpoint_dict["cheater_ids"], checkpoint_dict["winner_ids"],
+                                    (version, tuple(internal_state), gauss_next))
+
+    def write(self, path: str) -> None:
+        """
+        Writes the checkpoint to a temporary file next to the given path and then renames it over the path, so the
+        file at the path always holds a complete checkpoint, even if the process dies while writing
+        SIDE-EFFECTS:
+            - Replaces the file at the given path
+        :param path: the path of the checkpoint file
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w") as output:
+                json.dump(self.to_dict(), output, separators=(",", ":"))
+                output.flush()
+                os.fsync(output.fileno())
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    @staticmethod
+    def read(path: str) -> 'TournamentCheckpoint':
+        """
+        :param path: the path of a checkpoint file written by write
+        :return: the checkpoint in the file
+        """
+        with open(path) as checkpoint_file:
+            return TournamentCheckpoint.from_dict(json.load(checkpoint_file))
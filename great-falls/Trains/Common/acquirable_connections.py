@@ -0,0 +1,97 @@
+from typing import Callable, Dict, Iterable, Set, Tuple
+from Trains.Other.cards import Cards
+from Trains.Other.color import Color
+from Trains.Other.connection_index import ConnectionIndex
+from Trains.Other.undirected_connection import UndirectedConnection
+
+Bucket = Tuple[Color, int]
+"""
+Represents a group of connections with the same (color, length)
+"""
+
+
+class AcquirableConnections:
+    """
+    Represents the connections of a map that nobody owns, bucketed by color and length. A player can acquire every
+    connection in a bucket or none of them, as that only depends on the player's cards of the bucket's color and rails,
+    so a player's acquirable connections are the union of the buckets it can afford. Claiming or releasing a connection
+    only updates the connection's bucket. This class is immutable.
+
+    Args:
+        connection_index (ConnectionIndex): the index of the map's connections (see Map.get_connection_index)
+        connections (Iterable[UndirectedConnection]): the connections nobody owns
+
+    Attributes:
+        __connection_index (ConnectionIndex): the index of the map's connections
+        __buckets (Dict[Bucket, int]): a mapping from each (color, length) to the bitset over __connection_index of the
+                                       unowned connections with that color and length
+    """
+    __connection_index: ConnectionIndex
+    __buckets: Dict[Bucket, int]
+
+    def __init__(self, connection_index: ConnectionIndex, connections: Iterable[UndirectedConnection]):
+        self.__connection_index = connection_index
+        self.__buckets = {}
+        for connection in connections:
+            bucket = (connection.color, connection.length)
+            self.__buckets[bucket] = self.__buckets.get(bucket, 0) | 1 << connection_index.get_id(connection)
+
+    def get_unowned_connections(self) -> Set[UndirectedConnection]:
+        """
+        :return: every connection nobody owns
+        """
+        unowned = 0
+        for bitset in self.__buckets.values():
+            unowned |= bitset
+        return self.__connection_index.to_connections(unowned)
+
+    def get_acquirable_connections(self, cards: Cards, num_rails: int) -> Set[UndirectedConnection]:
+        """
+        :param cards: the cards of the player
+        :param num_rails: the rails of the player
+        :return: the unowned connections the player has enough cards and rails for
+        """
+        acquirable = 0
+        for (color, length), bitset in self.__buckets.items():
+            if num_rails >= length and cards.get_card_count(color) >= length:
+                acquirable |= bitset
+        return self.__connection_index.to_connections(acquirable)
+
+    def is_unowned(self, connection: UndirectedConnection) -> bool:
+        """
+        :param connection: the connection to check
+        :return: whether the connection is one of the unowned connections
+        """
+        bitset = self.__buckets.get((connection.color, connection.length), 0)
+        return self.__connection_index.contains(bitset, connection)
+
+    def claim(self, connection: UndirectedConnection) -> 'AcquirableConnections':
+        """
+        :param connection: the connection a player acquired
+        :return: new acquirable connections without the given connection
+        """
+        return self.__update_bucket(connection, lambda bitset, bit: bitset & ~bit)
+
+    def release(self, connections: Iterable[UndirectedConnection]) -> 'AcquirableConnections':
+        """
+        :param connections: connections nobody owns anymore, e.g. those of a removed player
+        :return: new acquirable connections with the given connections added
+        """
+        acquirable_connections = self
+        for connection in connections:
+            acquirable_connections = acquirable_connections.__update_bucket(connection, lambda bitset, bit: bitset | bit)
+        return acquirable_connections
+
+    def __update_bucket(self, connection: UndirectedConnection,
+                        update: Callable[[int, int], int]) -> 'AcquirableConnections':
+        """
+        :param connection: the connection whose bucket changes
+        :param update: a function from the bucket's bitset and the connection's bit to the bucket's new bitset
+        :return: new acquirable connections where the connection's bucket is updated
+        """
+        bucket = (connection.color, connection.length)
+        new_acquirable_connections = AcquirableConnections(self.__connection_index, ())
+        new_acquirable_connections.__buckets = self.__buckets.copy()
+        new_acquirable_connections.__buckets[bucket] = update(self.__buckets.get(bucket, 0),
+                                                              1 << self.__connection_index.get_id(connection))
+        return new_acquirable_connections
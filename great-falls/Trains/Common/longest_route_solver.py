@@ -0,0 +1,217 @@
+from collections import OrderedDict, defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+Edge = Tuple[int, int, int]
+"""
+Represents an undirected edge between two city ordinals as (smaller ordinal, larger ordinal, length)
+"""
+
+
+class LongestRouteSolver:
+    """
+    Computes the length of the longest continuous route (a path that does not visit a city twice) through a set of
+    undirected edges. The edges are split into connected components, and each component is solved on its own:
+     -- components without cycles are trees, whose longest route is found in linear time
+     -- other components are searched exhaustively with a depth first search over bitmasks of visited cities. The
+        longest extension from each (city, visited cities) pair is memoized, and the search stops early whenever a
+        route reaches the upper bound for the component
+    Results for cyclic components are kept in a bounded cache keyed by the component's edges, so components that do
+    not change between calls (e.g. from turn to turn, or from game to game on the same map) are not searched again.
+
+    Args:
+        cache_size (int): the maximum number of component results to keep
+
+    Attributes:
+        __cache_size (int): the maximum number of component results to keep
+        __component_cache (OrderedDict[FrozenSet[Edge], int]): the longest route of recently solved cyclic components,
+                                                             in least recently used order
+    """
+    DEFAULT_CACHE_SIZE = 1024
+
+    __cache_size: int
+    __component_cache: 'OrderedDict[FrozenSet[Edge], int]'
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.__cache_size = cache_size
+        self.__component_cache = OrderedDict()
+
+    def longest_route(self, edges: Iterable[Edge]) -> int:
+        """
+        :param edges: the edges available for traversal. Parallel edges between the same two cities are allowed
+        :return: the length of the longest continuous route
+        """
+        return self.longest_route_of_components(self.get_components(edges))
+
+    @staticmethod
+    def get_components(edges: Iterable[Edge]) -> List[FrozenSet[Edge]]:
+        """
+        :param edges: the edges to split. Parallel edges between the same two cities are allowed
+        :return: the edges of each connected component, where only the longest of any parallel edges is kept
+        """
+        return LongestRouteSolver.__get_components(LongestRouteSolver.__collapse_parallel_edges(edges))
+
+    def longest_route_of_components(self, components: Iterable[FrozenSet[Edge]]) -> int:
+        """
+        :param components: the connected components to search, as returned by get_components
+        :return: the length of the longest continuous route in any of the components
+        """
+        components = sorted(components, key=self.__upper_bound, reverse=True)
+
+        longest_route = 0
+        for component in components:
+            if self.__upper_bound(component) <= longest_route:
+                break
+            longest_route = max(longest_route, self.__solve_component(component))
+
+        return longest_route
+
+    @staticmethod
+    def __collapse_parallel_edges(edges: Iterable[Edge]) -> Dict[Tuple[int, int], int]:
+        """
+        A route can use at most one of the edges between two cities, so only the longest of them matters
+        :param edges: the edges to collapse
+        :return: a mapping from each pair of connected cities to the length of the longest edge between them
+        """
+        longest_edges = {}
+        for city_1, city_2, length in edges:
+            key = (city_1, city_2) if city_1 < city_2 else (city_2, city_1)
+            longest_edges[key] = max(length, longest_edges.get(key, 0))
+        return longest_edges
+
+    @staticmethod
+    def __get_components(longest_edges: Dict[Tuple[int, int], int]) -> List[FrozenSet[Edge]]:
+        """
+        :param longest_edges: a mapping from each pair of connected cities to the length of the edge between them
+        :return: the edges of each connected component
+        """
+        adjacency = defaultdict(list)
+        for city_1, city_2 in longest_edges:
+            adjacency[city_1].append(city_2)
+            adjacency[city_2].append(city_1)
+
+        component_of = {}
+        for start in adjacency:
+            if start in component_of:
+                continue
+            component_of[start] = start
+            stack = [start]
+            while stack:
+                city = stack.pop()
+                for neighbor in adjacency[city]:
+                    if neighbor not in component_of:
+                        component_of[neighbor] = start
+                        stack.append(neighbor)
+
+        components = defaultdict(list)
+        for (city_1, city_2), length in longest_edges.items():
+            components[component_of[city_1]].append((city_1, city_2, length))
+        return [frozenset(component) for component in components.values()]
+
+    @staticmethod
+    def __upper_bound(component: FrozenSet[Edge]) -> int:
+        """
+        A route through a component with n cities uses at most n - 1 edges
+        :param component: the edges of a connected component
+        :return: an upper bound on the longest route in the component
+        """
+        num_cities = len({city for edge in component for city in edge[:2]})
+        lengths = sorted((edge[2] for edge in component), reverse=True)
+        return sum(lengths[:num_cities - 1])
+
+    def __solve_component(self, component: FrozenSet[Edge]) -> int:
+        """
+        :param component: the edges of a connected component
+        :return: the length of the longest continuous route in the component
+        """
+        cities = sorted({city for edge in component for city in edge[:2]})
+        if len(component) == len(cities) - 1:
+            return self.__longest_route_in_tree(component)
+
+        if component in self.__component_cache:
+            self.__component_cache.move_to_end(component)
+            return self.__component_cache[component]
+
+        longest_route = self.__longest_route_in_cyclic_component(component, cities)
+        self.__component_cache[component] = longest_route
+        if len(self.__component_cache) > self.__cache_size:
+            self.__component_cache.popitem(last=False)
+        return longest_route
+
+    @staticmethod
+    def __longest_route_in_tree(component: FrozenSet[Edge]) -> int:
+        """
+        Finds the longest route of a tree by finding the farthest city from any city, and then the farthest city from
+        that one
+        :param component: the edges of a connected component without cycles
+        :return: the length of the longest continuous route in the tree
+        """
+        adjacency = defaultdict(list)
+        for city_1, city_2, length in component:
+            adjacency[city_1].append((city_2, length))
+            adjacency[city_2].append((city_1, length))
+
+        def farthest_from(start: int) -> Tuple[int, int]:
+            distances = {start: 0}
+            stack = [start]
+            while stack:
+                city = stack.pop()
+                for neighbor, length in adjacency[city]:
+                    if neighbor not in distances:
+                        distances[neighbor] = distances[city] + length
+                        stack.append(neighbor)
+            farthest_city = max(distances, key=distances.get)
+            return farthest_city, distances[farthest_city]
+
+        end_city, _ = farthest_from(next(iter(adjacency)))
+        return farthest_from(end_city)[1]
+
+    @staticmethod
+    def __longest_route_in_cyclic_component(component: FrozenSet[Edge], cities: List[int]) -> int:
+        """
+        Searches every route in the component with a memoized depth first search, where the cities on the route so far
+        are a bitmask over the component's cities
+        :param component: the edges of a connected component
+        :param cities: the sorted ordinals of the cities in the component
+        :return: the length of the longest continuous route in the component
+        """
+        indices = {city: index for index, city in enumerate(cities)}
+        neighbors = [[] for _ in cities]
+        for city_1, city_2, length in component:
+            neighbors[indices[city_1]].append((indices[city_2], length))
+            neighbors[indices[city_2]].append((indices[city_1], length))
+        for city_neighbors in neighbors:
+            city_neighbors.sort(key=lambda neighbor: neighbor[1], reverse=True)
+
+        # most_remaining[k] is the most that k more edges could add to a route
+        lengths = sorted((edge[2] for edge in component), reverse=True)
+        most_remaining = [0]
+        for length in lengths:
+            most_remaining.append(most_remaining[-1] + length)
+        max_edges = len(cities) - 1
+        upper_bound = most_remaining[min(max_edges, len(lengths))]
+
+        memo = {}
+
+        def longest_extension(city: int, visited: int, num_visited: int) -> int:
+            key = (city, visited)
+            if key in memo:
+                return memo[key]
+
+            bound = most_remaining[min(len(cities) - num_visited, len(lengths))]
+            longest = 0
+            for neighbor, length in neighbors[city]:
+                bit = 1 << neighbor
+                if not visited & bit:
+                    longest = max(longest, length + longest_extension(neighbor, visited | bit, num_visited + 1))
+                    if longest == bound:
+                        break
+
+            memo[key] = longest
+            return longest
+
+        longest_route = 0
+        for start in range(len(cities)):
+            longest_route = max(longest_route, longest_extension(start, 1 << start, 1))
+            if longest_route == upper_bound:
+                break
+        return longest_route
@@ -1,10 +1,19 @@
-from typing import List, Dict, Set
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Dict, FrozenSet, Hashable, Iterable, Iterator, Tuple, Union
+import hashlib
 import heapq
+import itertools
 
-from collections import defaultdict
+from Trains.Common.longest_route_solver import LongestRouteSolver
+from Trains.Common.map_cache import MAP_CACHE
+from Trains.Common.owned_subgraph import OwnedSubgraph
+from Trains.Other.color import COLOR_ORDINALS
+from Trains.Other.connection_index import ConnectionIndex
 from Trains.Other.destination import Destination
-from Trains.Other.city import City
+from Trains.Other.city import City, CityTable
 from Trains.Other.directed_connection import DirectedConnection
+from Trains.Other.undirected_connection import UndirectedConnection
 
 
 class Map:
@@ -20,8 +29,22 @@ class Map:
     Attributes:
         width (int): the width of the map in pixels
         height (int): the height of the map in pixels
-        __adj_list (Dict[City, List[DirectedConnection]]): The graph of cities and connections as an adjacency list. As
-        the actual Trains map has no notion of direction, for each edge A -> B, there should be an edge B -> A.
+        __city_table (CityTable): the interned cities of the map. The map's cities and the cities of its connections
+                                  are the interned instances, so comparing them compares small integers
+        __cities (List[City]): the cities of the map, where the position of a city is its ordinal
+        __city_ordinals (Dict[City, int]): a mapping from each city to its ordinal
+        The graph of cities and connections is stored in compressed sparse row form. As the actual Trains map has no
+        notion of direction, for each edge A -> B, there should be an edge B -> A. The outgoing connections of the city
+        with ordinal i are the edges with ids in range(__offsets[i], __offsets[i + 1]), and for each edge id:
+        __origins (array): the ordinal of the city the edge comes from
+        __targets (array): the ordinal of the city the edge goes to
+        __lengths (array): the length of the edge
+        __colors (array): the ordinal of the color of the edge (see COLOR_ORDINALS)
+        __connections (List[DirectedConnection]): the connection the edge represents
+        __fingerprint (Union[None, str]): the fingerprint of the map. It is None until it is first needed
+    Data derived from the graph (feasible destinations, the undirected connections and their lexicographic orderings,
+    the connection index, and the longest route solver) is kept in MAP_CACHE under the map's fingerprint, so it is
+    computed once for all maps with the same cities and connections.
     """
 
     MIN_WIDTH = 10
@@ -29,9 +52,20 @@ class Map:
     MAX_WIDTH = 800
     MAX_HEIGHT = 800
 
+    SHARDS_PER_WORKER = 4
+
     width = int
     height = int
-    __adj_list: Dict[City, List[DirectedConnection]]
+    __city_table: CityTable
+    __cities: List[City]
+    __city_ordinals: Dict[City, int]
+    __offsets: array
+    __origins: array
+    __targets: array
+    __lengths: array
+    __colors: array
+    __connections: List[DirectedConnection]
+    __fingerprint: Union[None, str]
 
     def __init__(self, width: int, height: int, cities: List[City], connections: List[DirectedConnection]):
         """
@@ -52,210 +86,272 @@ class Map:
         self.width = width
         self.height = height
 
-        self.__adj_list = {}
-
-        if not Map.__connections_are_mirrored(connections):
-            raise ValueError("The list of directed connections must be symmetric")
-
+        self.__city_table = CityTable(cities)
+        self.__city_ordinals = {}
         for city in cities:
             if not Map.__city_in_bounds(city, width, height):
                 raise ValueError("City outside of board")
 
-            self.__adj_list[city] = list(filter(lambda connection: connection.from_city == city, connections))
+            self.__city_ordinals.setdefault(self.__city_table.intern(city), len(self.__city_ordinals))
+        self.__cities = list(self.__city_ordinals)
 
-            if not Map.__has_unique_color_connections(self.__adj_list[city]):
-                raise ValueError("A city's outgoing connections to the same city must have distinct colors")
-
-        if not all(map(lambda connection: self.__verify_cities_in_connection(cities, connection), connections)):
+        cities_in_map, mirrored, unique_colors = self.__validate_connections(connections)
+        if not cities_in_map:
             raise ValueError("Connections must use cities in the given list of cities")
 
+        if not mirrored:
+            raise ValueError("The list of directed connections must be symmetric")
+
+        if not unique_colors:
+            raise ValueError("A city's outgoing connections to the same city must have distinct colors")
+
+        intern = self.__city_table.intern
+        self.__build_graph([DirectedConnection(intern(connection.from_city), intern(connection.to_city),
+                                               connection.length, connection.color) for connection in connections])
+        self.__fingerprint = None
+
+    def __build_graph(self, connections: List[DirectedConnection]) -> None:
+        """
+        Builds the compressed sparse row graph using a counting sort on the origin city of each connection, so that the
+        outgoing connections of each city keep the order they were given in
+        SIDE-EFFECTS:
+            - Sets the graph attributes (see class docs)
+        :param connections: the validated connections of the map
+        """
+        num_cities = len(self.__cities)
+        origins = [self.__city_ordinals[connection.from_city] for connection in connections]
+
+        offsets = array('l', [0]) * (num_cities + 1)
+        for origin in origins:
+            offsets[origin + 1] += 1
+        for i in range(num_cities):
+            offsets[i + 1] += offsets[i]
+
+        next_slots = offsets[:num_cities]
+        ordered_connections = [None] * len(connections)
+        for origin, connection in zip(origins, connections):
+            ordered_connections[next_slots[origin]] = connection
+            next_slots[origin] += 1
+
+        self.__offsets = offsets
+        self.__connections = ordered_connections
+        self.__targets = array('l', [self.__city_ordinals[connection.to_city] for connection in ordered_connections])
+        self.__lengths = array('b', [connection.length for connection in ordered_connections])
+        self.__colors = array('b', [COLOR_ORDINALS[connection.color] for connection in ordered_connections])
+        self.__origins = array('l', [self.__city_ordinals[connection.from_city] for connection in ordered_connections])
+
     def get_cities(self) -> List[City]:
         """
         :return: a list of all the cities in the map
         """
-        return list(self.__adj_list.keys())
+        return self.__cities.copy()
+
+    def get_city_table(self) -> CityTable:
+        """
+        :return: the interned cities of the map
+        """
+        return self.__city_table
 
     def get_city_names(self) -> List[str]:
         """
         :return: the names of all the cities in the map
         """
-        return list(map(lambda city: city.name, self.get_cities()))
+        return [city.name for city in self.__cities]
 
     def get_outgoing_connections(self, city: City) -> List[DirectedConnection]:
         """
         :param city: the city to get the outgoing connections for
         :return: the outgoing connections for a given city
         """
-        return self.__adj_list[city]
+        ordinal = self.__city_ordinals[city]
+        return self.__connections[self.__offsets[ordinal]:self.__offsets[ordinal + 1]]
 
     def get_all_directed_connections(self) -> List[DirectedConnection]:
         """
         :return: all of the map's connections
         """
-        return [connection for connections in self.__adj_list.values() for connection in connections]
+        return self.__connections.copy()
 
-    def get_feasible_destinations(self, max_player_rails: int) -> Set[Destination]:
+    def get_feasible_destinations(self, max_player_rails: int, num_workers: int = 1) -> FrozenSet[Destination]:
         """
         Finds all pairs of cities that could be connected to each other by acquiring connections.
         :param max_player_rails: the max number of segments the player can acquire
+        :param num_workers: the number of processes to shard the search across. Only worth more than 1 for very large
+                            maps, as starting the processes takes a while
         :return: set of Destination
         """
-        feasible_destinations = set()
-        cities = self.get_cities()
-        for i in range(len(cities)):
-            origin_city = cities[i]
-            distances = self.__get_min_distances(origin_city)
-
-            for j in range(i + 1, len(cities)):
-                dest_city = cities[j]
-                if distances[dest_city] == float("inf") or distances[dest_city] > max_player_rails:
-                    continue
+        return self.__get_artifact(("feasible_destinations", max_player_rails),
+                                   lambda: self.__compute_feasible_destinations(max_player_rails, num_workers))
 
-                feasible_destinations.add(Destination(origin_city, dest_city))
-
-        return feasible_destinations
-
-    def are_cities_connected(self, city_1: City, city_2: City, acquired: Set[DirectedConnection]) -> bool:
+    def has_feasible_destinations(self, max_player_rails: int, num_destinations: int) -> bool:
         """
-        Uses recursive DFS to determine whether two cities are connected using only the set of acquired connections
-        :param city_1: one city
-        :param city_2: the other city
-        :param acquired: acquired connections available for traversal
-        :return: whether the two given cities are connected using the connections that have been acquired
-        """
-        return self.__are_cities_connected_helper(city_1, city_2, acquired, set())
-
-    def __are_cities_connected_helper(self, city_1: City, city_2: City, acquired: Set[DirectedConnection],
-                                      visited_cities: Set[City]):
-        """
-        A helper method for are_cities_connected that keeps an accumulated set of visited cities to avoid cycles
-        :param city_1: one city
-        :param city_2: the other city
-        :param acquired: acquired connections available for traversal
-        :param visited_cities: cities that have already been visited by the graph search
-        :return: whether the two given cities are connected using the connections that have been acquired and
-                 visited cities
+        Searches for feasible destinations (see get_feasible_destinations) one city at a time, stopping as soon as
+        num_destinations of them are found, so a map with plenty of destinations is checked without searching from
+        every city.
+        :param max_player_rails: the max number of segments the player can acquire
+        :param num_destinations: the number of feasible destinations to look for
+        :return: whether the map has at least num_destinations feasible destinations
         """
-        if city_1 == city_2:
+        if num_destinations <= 0:
             return True
+        return self.__get_artifact(("has_feasible_destinations", max_player_rails, num_destinations),
+                                   lambda: next(itertools.islice(
+                                       _iter_feasible_pairs(self.__offsets, self.__targets, self.__lengths,
+                                                            range(len(self.__cities)), max_player_rails),
+                                       num_destinations - 1, None), None) is not None)
 
-        reachable_neighbor_cities = self.__get_reachable_neighbor_cities(city_1, acquired)
-        for city in reachable_neighbor_cities:
-            visited_cities = visited_cities.union({city_1})
-            if city not in visited_cities and self.__are_cities_connected_helper(city, city_2, acquired, visited_cities):
-                return True
-
-        return False
-
-    def longest_continuous_route(self, acquired_connections: Set[DirectedConnection]) -> int:
+    def get_sorted_feasible_destinations(self, max_player_rails: int) -> Tuple[Destination, ...]:
         """
-        Computes the longest continuous route using the connections that have been acquired.
-        Longest continuous route is defined as a simple, acyclic path whose length is the value of all the segments in
-        the path added together
-        :param acquired_connections: acquired connections available for traversal
-        :return: the length of the longest continuous route
-        """
-        reachable_cities = {connection.from_city for connection in acquired_connections}
-        longest_path = 0
-        for city in reachable_cities:
-            city_longest_path = self.__longest_path_from_city(city, acquired_connections, set())
-            longest_path = max(longest_path, city_longest_path)
-
-        return longest_path
-
-    def __longest_path_from_city(self, city: City, acquired_connections: Set[DirectedConnection],
-                                 visited_cities: Set[City]) -> int:
-        """
-        Uses recursive DFS to determine the length of the longest continuous path starting from the given city, keeping
-        an accumulated set of all visited cities to avoid cycles
-        :param city: the city to start from
-        :param acquired_connections: acquired connections available for traversal
-        :param visited_cities: cities that have already been visited by the graph search
-        :return: the length of the longest continuous path starting from the given city
+        :param max_player_rails: the max number of segments the player can acquire
+        :return: the feasible destinations (see get_feasible_destinations) in lexicographic order
         """
-        usable_connections = self.__get_usable_outgoing_connections(city, acquired_connections)
-        longest_path = 0
-        for connection in usable_connections:
-            if connection.to_city not in visited_cities:
-                visited_cities = visited_cities.union({connection.from_city})
-                longest_path = max(longest_path, connection.length + self.__longest_path_from_city(connection.to_city,
-                                                                                                   acquired_connections,
-                                                                                                   visited_cities))
+        return self.__get_artifact(("sorted_feasible_destinations", max_player_rails),
+                                   lambda: Map.__sort_lexicographically(
+                                       self.get_feasible_destinations(max_player_rails),
+                                       lambda destination: destination.table_id,
+                                       lambda destination: destination.ordinals))
 
-        return longest_path
-
-    def __get_reachable_neighbor_cities(self, starting_city: City, acquired: Set[DirectedConnection]) -> Set[City]:
+    def get_undirected_connections(self) -> FrozenSet[UndirectedConnection]:
         """
-        Gets the neighboring cities of the given city, only considering the connections that have been acquired.
-        :param starting_city: the starting city
-        :param acquired: acquired connections available for traversal
-        :return: the set of reachable cities from the given city
+        :return: every connection of the map without direction
         """
-        usable_connections = self.__get_usable_outgoing_connections(starting_city, acquired)
-        return {owned_connection.to_city for owned_connection in usable_connections}
+        return self.__get_artifact("undirected_connections",
+                                   lambda: frozenset(connection.make_undirected() for connection in self.__connections))
 
-    def __get_usable_outgoing_connections(self, city: City, acquired_connections: Set[DirectedConnection]) -> Set[
-        DirectedConnection]:
+    def get_sorted_undirected_connections(self) -> Tuple[UndirectedConnection, ...]:
         """
-        :param city: city to get outgoing connections for
-        :param acquired_connections: acquired connections available for traversal
-        :return: the outgoing connections from the given city, filtering out connections that have not been acquired
+        :return: every connection of the map without direction, in lexicographic order
         """
-        outgoing_connections = set(self.__adj_list[city])
-        return outgoing_connections.intersection(acquired_connections)
+        return self.__get_artifact("sorted_undirected_connections",
+                                   lambda: Map.__sort_lexicographically(self.get_undirected_connections(),
+                                                                        UndirectedConnection.get_table_id,
+                                                                        UndirectedConnection.get_sort_key))
 
     @staticmethod
-    def __connections_are_mirrored(connections: List[DirectedConnection]) -> bool:
+    def __sort_lexicographically(items: Iterable[Any], get_table_id: Callable[[Any], Union[None, object]],
+                                 get_sort_key: Callable[[Any], Any]) -> Tuple[Any, ...]:
+        """
+        Sorts destinations or connections in lexicographic order. If the cities of all of them were interned in the
+        same CityTable, they are sorted by their ordinal keys, which compares tuples of small integers instead of calling
+        __lt__ for every comparison
+        :param items: the destinations or connections to sort
+        :param get_table_id: gets the id of the table the cities of an item were interned in
+        :param get_sort_key: gets the ordinal key of an item
+        :return: the items in lexicographic order
+        """
+        items = list(items)
+        table_ids = {get_table_id(item) for item in items}
+        if len(table_ids) == 1 and None not in table_ids:
+            items.sort(key=get_sort_key)
+        else:
+            items.sort()
+        return tuple(items)
+
+    def get_connection_index(self) -> ConnectionIndex:
+        """
+        The index assigns ids 0 to n - 1 to the map's n undirected connections in lexicographic order, so it is the same
+        for every map with the same connections, and the map's connections are exactly the bits of (1 << n) - 1. The
+        index is shared through MAP_CACHE, so it is lookup-only: it never gives ids to connections that are not on the
+        map
+        :return: the index used to encode sets of the map's connections as bitsets
+        """
+        return self.__get_artifact("connection_index",
+                                   lambda: ConnectionIndex(self.get_sorted_undirected_connections(), extendable=False))
+
+    def fingerprint(self) -> str:
+        """
+        The fingerprint identifies the map's cities and connections, including their order, so two maps with the same
+        fingerprint have the same city ordinals and edge ids
+        :return: a hex digest of the map's cities and connections
+        """
+        if self.__fingerprint is None:
+            digest = hashlib.sha256()
+            for city in self.__cities:
+                digest.update(f"{city.name}@{city.position[0]},{city.position[1]};".encode())
+            for edge in range(len(self.__connections)):
+                digest.update(f"{self.__origins[edge]}>{self.__targets[edge]}:{self.__lengths[edge]}"
+                              f"/{self.__colors[edge]};".encode())
+            self.__fingerprint = digest.hexdigest()
+        return self.__fingerprint
+
+    def __compute_feasible_destinations(self, max_player_rails: int, num_workers: int) -> FrozenSet[Destination]:
+        """
+        Runs a search bounded by max_player_rails from every city. With more than one worker, the cities are split into
+        interleaved shards that are searched in a process pool
+        :param max_player_rails: the max number of segments the player can acquire
+        :param num_workers: the number of processes to shard the search across
+        :return: set of Destination
         """
+        num_cities = len(self.__cities)
+        if num_workers > 1 and num_cities > 1:
+            num_shards = min(num_cities, num_workers * self.SHARDS_PER_WORKER)
+            shards = [range(shard, num_cities, num_shards) for shard in range(num_shards)]
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                shard_pairs = list(executor.map(_find_feasible_pairs, itertools.repeat(self.__offsets),
+                                                itertools.repeat(self.__targets), itertools.repeat(self.__lengths),
+                                                shards, itertools.repeat(max_player_rails)))
+            feasible_pairs = itertools.chain.from_iterable(shard_pairs)
+        else:
+            feasible_pairs = _find_feasible_pairs(self.__offsets, self.__targets, self.__lengths, range(num_cities),
+                                                  max_player_rails)
+
+        cities = self.__cities
+        return frozenset(Destination(cities[origin], cities[target]) for origin, target in feasible_pairs)
+
+    def get_owned_subgraph(self, acquired_connections: Iterable[UndirectedConnection]) -> OwnedSubgraph:
+        """
+        Builds the subgraph of the connections one player acquired, which answers every scoring question about the
+        player from a single component structure
+        :param acquired_connections: the connections the player acquired. Connections whose cities are not both on
+                                     this map are ignored
+        :return: the player's owned subgraph
+        """
+        city_ordinals = self.__city_ordinals
+        edges = []
+        for connection in acquired_connections:
+            city_1 = city_ordinals.get(connection.get_city_1())
+            city_2 = city_ordinals.get(connection.get_city_2())
+            if city_1 is not None and city_2 is not None:
+                edges.append((city_1, city_2, connection.length))
+
+        longest_route_solver = self.__get_artifact("longest_route_solver", LongestRouteSolver)
+        return OwnedSubgraph(edges, city_ordinals, longest_route_solver)
+
+    def __validate_connections(self, connections: List[DirectedConnection]) -> Tuple[bool, bool, bool]:
+        """
+        Checks every condition on the connections in a single pass. A connection is mirrored by a connection with the
+        same length and color, but with from_city and to_city switched. Each connection is matched with its mirror as
+        soon as both have been seen, so the connections are mirrored when no connection is left unmatched. A
+        connection that repeats the color of an earlier connection between the same cities breaks the distinct colors
+        condition and is not matched, so it cannot complete a pair
         :param connections: the list of connections to check
-        :return: whether each connection in the list has a mirrored connection in the list, where a
-        "mirrored connection" is a connection with the same length and color, but with from_city and to_city switched
-        """
-        return all(map(lambda connection: Map.__connection_has_mirror(connection, connections), connections))
-
-    @staticmethod
-    def __connection_has_mirror(connection: DirectedConnection, connections: List[DirectedConnection]) -> bool:
-        """
-        :param connection: the connection to look for a mirror of
-        :param connections: the connections to find a mirror in
-        :return: whether the given connection has a mirror connection in the given list of connections
-        """
-        return any(map(lambda connection_to_search: Map.__is_mirror(connection, connection_to_search), connections))
-
-    @staticmethod
-    def __is_mirror(connection_1: DirectedConnection, connection_2: DirectedConnection) -> bool:
-        """
-        :param connection_1: the first connection
-        :param connection_2: the second connection
-        :return: whether the given connections are mirrors of each other
-        """
-        return connection_1.to_city == connection_2.from_city \
-               and connection_1.from_city == connection_2.to_city \
-               and connection_1.color == connection_2.color \
-               and connection_1.length == connection_2.length
-
-    @staticmethod
-    def __has_unique_color_connections(connections: List[DirectedConnection]) -> bool:
-        """
-        :param connections: list of connections to check the colors of
-        :return: whether all the connections to any outgoing city have unique colors
-        """
-        occurred_colors = defaultdict(set)
+        :return: whether both cities of every connection are cities of this map, whether every connection has a
+                 mirrored connection in the list, and whether all the connections from any city to any other city
+                 have distinct colors
+        """
+        city_ordinals = self.__city_ordinals
+        cities_in_map = True
+        unique_colors = True
+        occurred_colors = set()
+        unmatched = set()
         for connection in connections:
-            if connection.color in occurred_colors[connection.to_city]:
-                return False
+            from_city, to_city, length, color = \
+                connection.from_city, connection.to_city, connection.length, connection.color
+            if from_city not in city_ordinals or to_city not in city_ordinals:
+                cities_in_map = False
+
+            color_key = (from_city, to_city, color)
+            if color_key in occurred_colors:
+                unique_colors = False
+                continue
+            occurred_colors.add(color_key)
+
+            mirrored_key = (to_city, from_city, length, color)
+            if mirrored_key in unmatched:
+                unmatched.remove(mirrored_key)
             else:
-                occurred_colors[connection.to_city].add(connection.color)
-        return True
-
-    @staticmethod
-    def __verify_cities_in_connection(possible_cities: List[City], connection: DirectedConnection) -> bool:
-        """
-        :param possible_cities: the cities that can be used in the connection
-        :param connection: the connection to check the cities of
-        :return: whether the
-        """
-        return connection.from_city in possible_cities and connection.to_city in possible_cities
+                unmatched.add((from_city, to_city, length, color))
+        return cities_in_map, not unmatched, unique_colors
 
     @staticmethod
     def __city_in_bounds(city: City, width: int, height: int) -> bool:
@@ -269,28 +365,56 @@ class Map:
         y_coordinate = city.position[1]
         return 0 <= x_coordinate <= width and 0 <= y_coordinate <= height
 
-    def __get_min_distances(self, origin_city: City) -> Dict[City, float]:
+    def __get_artifact(self, artifact: Hashable, compute: Callable[[], Any]) -> Any:
         """
-        Uses Dijkstra's and a priority queue to determine min paths from the origin city to all other cities
-        :param origin_city: the city to get the paths for
-        :return: a mapping from city to their distance from the origin city, with float('inf') representing no path
+        :param artifact: the name of the derived artifact, along with any arguments it depends on
+        :param compute: a function that computes the artifact
+        :return: the artifact for this map from MAP_CACHE, computing it if it is not cached
         """
-        distances = {city: float("inf") for city in self.get_cities()}
-        completed = set()
-        distances[origin_city] = 0
+        return MAP_CACHE.get_or_compute(self.fingerprint(), artifact, compute)
 
-        priority_queue = [(0, origin_city)]
-        while priority_queue:
-            shortest_distance, current_city = heapq.heappop(priority_queue)
-
-            if current_city not in completed:
-                for connection in self.__adj_list[current_city]:
-                    distance = shortest_distance + connection.length
 
-                    if distance < distances[connection.to_city]:
-                        distances[connection.to_city] = distance
-                        heapq.heappush(priority_queue, (distance, connection.to_city))
+def _find_feasible_pairs(offsets: array, targets: array, lengths: array, origins: range,
+                         max_distance: int) -> List[Tuple[int, int]]:
+    """
+    Runs Dijkstra's from each origin over the compressed sparse row graph of a map, never expanding past max_distance,
+    so only the cities that are close enough are ever visited. It is a module level function so it can be run in a
+    process pool
+    :param offsets: the offsets of each city's outgoing edges
+    :param targets: the ordinal of the city each edge goes to
+    :param lengths: the length of each edge
+    :param origins: the ordinals of the cities to search from
+    :param max_distance: the greatest distance to search
+    :return: the pairs (origin, target) with origin < target whose shortest distance is at most max_distance
+    """
+    return list(_iter_feasible_pairs(offsets, targets, lengths, origins, max_distance))
 
-            completed.add(current_city)
 
-        return distances
+def _iter_feasible_pairs(offsets: array, targets: array, lengths: array, origins: range,
+                         max_distance: int) -> Iterator[Tuple[int, int]]:
+    """
+    Lazily runs the searches of _find_feasible_pairs, one origin at a time
+    :param offsets: the offsets of each city's outgoing edges
+    :param targets: the ordinal of the city each edge goes to
+    :param lengths: the length of each edge
+    :param origins: the ordinals of the cities to search from
+    :param max_distance: the greatest distance to search
+    :return: the pairs (origin, target) with origin < target whose shortest distance is at most max_distance, in order
+             of origin
+    """
+    for origin in origins:
+        distances = {origin: 0}
+        priority_queue = [(0, origin)]
+        while priority_queue:
+            shortest_distance, current = heapq.heappop(priority_queue)
+            if shortest_distance > distances[current]:
+                continue
+            if current > origin:
+                yield origin, current
+
+            for edge in range(offsets[current], offsets[current + 1]):
+                distance = shortest_distance + lengths[edge]
+                neighbor = targets[edge]
+                if distance <= max_distance and distance < distances.get(neighbor, distance + 1):
+                    distances[neighbor] = distance
+                    heapq.heappush(priority_queue, (distance, neighbor))
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class MapCache:
+    """
+    Represents a bounded, least recently used cache of data derived from maps. Entries are keyed by a map's
+    fingerprint (see Map.fingerprint) and the name of the derived artifact, so every map with the same cities and
+    connections shares the same artifacts, whether or not they are the same Map object.
+
+    Args:
+        max_size (int): the maximum number of artifacts to keep
+
+    Attributes:
+        max_size (int): the maximum number of artifacts to keep
+        hits (int): the number of lookups that found a cached artifact
+        misses (int): the number of lookups that had to compute the artifact
+        __entries (OrderedDict[Tuple[str, Hashable], Any]): the cached artifacts, in least recently used order
+    """
+    DEFAULT_MAX_SIZE = 256
+
+    max_size: int
+    hits: int
+    misses: int
+    __entries: 'OrderedDict[Tuple[str, Hashable], Any]'
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+
+    def get_or_compute(self, fingerprint: str, artifact: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Looks up an artifact for a map, computing and caching it if it is not cached. If the cache is full, the least
+        recently used artifact is evicted
+        :param fingerprint: the fingerprint of the map
+        :param artifact: the name of the artifact, along with any arguments it depends on
+        :param compute: a function that computes the artifact
+        :return: the artifact
+        """
+        key = (fingerprint, artifact)
+        if key in self.__entries:
+            self.hits += 1
+            self.__entries.move_to_end(key)
+            return self.__entries[key]
+
+        self.misses += 1
+        value = compute()
+        self.__entries[key] = value
+        if len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+        return value
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        :return: the number of hits, misses and currently cached artifacts
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.__entries)}
+
+    def clear(self) -> None:
+        """
+        Removes every cached artifact and resets the hit and miss counters
+        """
+        self.__entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+MAP_CACHE = MapCache()
+"""
+The cache shared by every map, so that all games of a tournament reuse the same derived map data
+"""
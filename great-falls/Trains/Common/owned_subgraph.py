@@ -0,0 +1,75 @@
+from typing import Dict, FrozenSet, Iterable, List, Union
+
+from Trains.Common.longest_route_solver import Edge, LongestRouteSolver
+from Trains.Other.city import City
+
+
+class OwnedSubgraph:
+    """
+    Represents the subgraph of a map made of the connections one player owns. The owned edges are split into connected
+    components once, and every end of game question about the player is answered from those components: the number of
+    segments the player owns, whether two cities are connected, and the longest continuous route.
+
+    Args:
+        edges (Iterable[Edge]): the owned connections as edges between city ordinals
+        city_ordinals (Dict[City, int]): a mapping from each city of the map to its ordinal. It is not copied, and must
+                                         not be modified
+        longest_route_solver (LongestRouteSolver): the solver of the map, whose cached results are reused
+
+    Attributes:
+        __num_segments (int): the total length of the owned connections, counting parallel connections separately
+        __components (List[FrozenSet[Edge]]): the edges of each connected component
+        __component_of (Dict[int, int]): a mapping from the ordinal of each city on an owned connection to the index of
+                                         its component
+        __city_ordinals (Dict[City, int]): a mapping from each city of the map to its ordinal
+        __longest_route_solver (LongestRouteSolver): the solver of the map
+        __longest_route (Union[None, int]): the length of the longest continuous route, or None if it is not computed yet
+    """
+    __num_segments: int
+    __components: List[FrozenSet[Edge]]
+    __component_of: Dict[int, int]
+    __city_ordinals: Dict[City, int]
+    __longest_route_solver: LongestRouteSolver
+    __longest_route: Union[None, int]
+
+    def __init__(self, edges: Iterable[Edge], city_ordinals: Dict[City, int],
+                 longest_route_solver: LongestRouteSolver):
+        edges = list(edges)
+        self.__num_segments = sum(length for _, _, length in edges)
+        self.__components = LongestRouteSolver.get_components(edges)
+        self.__component_of = {}
+        for component_index, component in enumerate(self.__components):
+            for city_1, city_2, _ in component:
+                self.__component_of[city_1] = component_index
+                self.__component_of[city_2] = component_index
+        self.__city_ordinals = city_ordinals
+        self.__longest_route_solver = longest_route_solver
+        self.__longest_route = None
+
+    def get_num_segments(self) -> int:
+        """
+        :return: the total length of the owned connections
+        """
+        return self.__num_segments
+
+    def are_cities_connected(self, city_1: City, city_2: City) -> bool:
+        """
+        :param city_1: one city
+        :param city_2: the other city
+        :return: whether the two cities are connected using only the owned connections
+        """
+        if city_1 == city_2:
+            return True
+
+        component_1 = self.__component_of.get(self.__city_ordinals.get(city_1))
+        return component_1 is not None and component_1 == self.__component_of.get(self.__city_ordinals.get(city_2))
+
+    def get_longest_route(self) -> int:
+        """
+        SIDE-EFFECTS:
+            - Computes and keeps the longest route the first time it is called
+        :return: the length of the longest continuous route using only the owned connections
+        """
+        if self.__longest_route is None:
+            self.__longest_route = self.__longest_route_solver.longest_route_of_components(self.__components)
+        return self.__longest_route
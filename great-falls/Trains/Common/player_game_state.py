@@ -1,5 +1,7 @@
-from typing import List, Set
+from typing import List, Set, Union
+from Trains.Common.acquirable_connections import AcquirableConnections
 from Trains.Common.map import Map
+from Trains.Other.connection_index import ConnectionIndex
 from Trains.Other.player_state import PrivatePlayerState, PublicPlayerState
 from Trains.Other.undirected_connection import UndirectedConnection
 
@@ -12,6 +14,9 @@ class PlayerGameState:
         map (Map): the map of the game
         own_state (PrivatePlayerState): the state of the player for which the game state is for
         other_player_states (List[PublicPlayerState]): the public state of the other players in the game
+        acquirable_connections (Union[None, AcquirableConnections]): the connections nobody owns, as maintained by the
+                                                                     referee. If None, they are computed from the map
+                                                                     and the player states when first needed
 
     Attributes:
         __map (Map): the map of the game
@@ -19,21 +24,27 @@ class PlayerGameState:
         other_player_states (List[PublicPlayerState]): the public state of the other players in the game, in relative
          turn order (the first element is the player to go after this player, second element is second after this
          player, etc)
+        __acquirable_connections (Union[None, AcquirableConnections]): the connections nobody owns, bucketed by color
+                                                                       and length
     """
     __map: Map
     own_state: PrivatePlayerState
     other_player_states: List[PublicPlayerState]
+    __acquirable_connections: Union[None, AcquirableConnections]
 
-    def __init__(self, map: Map, own_state: PrivatePlayerState, other_player_states: List[PublicPlayerState]):
+    def __init__(self, map: Map, own_state: PrivatePlayerState, other_player_states: List[PublicPlayerState],
+                 acquirable_connections: Union[None, AcquirableConnections] = None):
         """
         Constructs an instance of a PlayerGameState
         :param map: the map of the game
         :param own_state: the state of the player for which the game state is for
         :param other_player_states: the public state of the other players in the game
+        :param acquirable_connections: the connections nobody owns, if they are already known
         """
         self.__map = map
         self.own_state = own_state
         self.other_player_states = other_player_states.copy()
+        self.__acquirable_connections = acquirable_connections
 
     def get_acquirable_connections(self) -> Set[UndirectedConnection]:
         """
@@ -45,34 +56,25 @@ class PlayerGameState:
           -- enough rails to occupy it
         :return: all acquirable connections
         """
-        unacquired_connections = self.__get_unacquired_connections()
+        if self.__acquirable_connections is None:
+            self.__acquirable_connections = AcquirableConnections(self.__map.get_connection_index(),
+                                                                  self.__get_unacquired_connections())
 
-        return self.__legally_acquirable_connections(unacquired_connections)
+        return self.__acquirable_connections.get_acquirable_connections(self.own_state.cards, self.own_state.num_rails)
 
     def __get_unacquired_connections(self) -> Set[UndirectedConnection]:
-        all_acquired_connections = self.__get_all_acquired_connections()
-        possible_connections = self.__map.get_all_directed_connections()
-        possible_undirected_connections = {con.make_undirected() for con in
-                                           possible_connections}
+        connection_index = self.__map.get_connection_index()
+        map_connections_bitset = (1 << len(self.__map.get_undirected_connections())) - 1
+        all_acquired_connections = self.__get_all_acquired_connections(connection_index)
+        return connection_index.to_connections(map_connections_bitset & ~all_acquired_connections)
 
-        return possible_undirected_connections - all_acquired_connections
-
-    def __legally_acquirable_connections(self, connections: Set[UndirectedConnection]) -> Set[UndirectedConnection]:
-        return {connection for connection in connections if
-                self.__has_sufficient_cards(connection) and self.__has_sufficient_rails(connection)}
-
-    def __get_all_acquired_connections(self) -> Set[UndirectedConnection]:
+    def __get_all_acquired_connections(self, connection_index: ConnectionIndex) -> int:
         """
         Get all connections acquired by all the players in the game
-        :return: a set of all acquired connections
+        :param connection_index: the index of the map's connections
+        :return: a bitset of all acquired connections
         """
-        other_player_acquired_connections = set().union(
-            *[player_state.acquired_connections for player_state in self.other_player_states])
-
-        return other_player_acquired_connections.union(self.own_state.public_state.acquired_connections)
-
-    def __has_sufficient_cards(self, connection: UndirectedConnection) -> bool:
-        return self.own_state.cards.get_card_count(connection.color) >= connection.length
-
-    def __has_sufficient_rails(self, connection: UndirectedConnection) -> bool:
-        return self.own_state.num_rails >= connection.length
+        all_acquired_connections = self.own_state.public_state.get_acquired_bitset(connection_index)
+        for player_state in self.other_player_states:
+            all_acquired_connections |= player_state.get_acquired_bitset(connection_index)
+        return all_acquired_connections
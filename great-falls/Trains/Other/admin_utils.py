@@ -1,4 +1,8 @@
+import os
+from typing import FrozenSet
+
 from Trains.Common.map import Map
+from Trains.Other.destination import Destination
 
 NUM_DESTINATION_OPTIONS = 5
 NUM_DESTINATIONS_RETURNED = 3
@@ -7,6 +11,7 @@ STARTING_NUM_RAILS = 45
 STARTING_NUM_CARDS = 4
 MIN_NUM_PLAYERS = 2
 MAX_NUM_PLAYERS = 8
+PARALLEL_FEASIBILITY_MIN_CITIES = 1500
 
 def check_valid_map(trains_map: Map, num_players: int) -> bool:
     """
@@ -14,8 +19,27 @@ def check_valid_map(trains_map: Map, num_players: int) -> bool:
     :param num_players: number of players that would play a game with this map
     :return: whether the map contains enough destinations to offer all players the same amount
     """
-    num_feasible_destinations = len(trains_map.get_feasible_destinations(STARTING_NUM_RAILS))
-    return num_feasible_destinations >= _get_min_num_destinations(num_players)
+    return len(get_feasible_destinations(trains_map)) >= _get_min_num_destinations(num_players)
+
+def get_feasible_destinations(trains_map: Map) -> FrozenSet[Destination]:
+    """
+    Computes the feasible destinations of a map for the starting number of rails, sharding the search across every
+    CPU for maps with at least PARALLEL_FEASIBILITY_MIN_CITIES cities. The result is cached (see Map)
+    :param trains_map: the map
+    :return: the feasible destinations of the map
+    """
+    num_workers = (os.cpu_count() or 1) if len(trains_map.get_cities()) >= PARALLEL_FEASIBILITY_MIN_CITIES else 1
+    return trains_map.get_feasible_destinations(STARTING_NUM_RAILS, num_workers)
+
+def has_enough_destinations(trains_map: Map, num_players: int) -> bool:
+    """
+    Checks the same condition as check_valid_map, but stops searching for destinations as soon as there are enough,
+    so it is cheaper for picking a map that has not been played on yet
+    :param trains_map: the map to check
+    :param num_players: number of players that would play a game with this map
+    :return: whether the map contains enough destinations to offer all players the same amount
+    """
+    return trains_map.has_feasible_destinations(STARTING_NUM_RAILS, _get_min_num_destinations(num_players))
 
 def _get_min_num_destinations(num_players):
     num_destinations_selected = NUM_DESTINATION_OPTIONS - NUM_DESTINATIONS_RETURNED
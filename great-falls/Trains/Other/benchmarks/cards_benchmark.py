@@ -0,0 +1,106 @@
+import random
+import timeit
+from collections import Counter
+from typing import Callable, Dict, List
+
+from Trains.Other.cards import Cards
+from Trains.Other.color import Color
+
+NUM_TURNS = 10000
+CARDS_PER_DRAW = 2
+MAX_CONNECTION_LENGTH = 5
+REPEATS = 5
+SEED = 0
+
+
+class LegacyCards:
+    """
+    The original Cards, which stores a dictionary over every Color and rebuilds it, checks it and hashes it again on
+    every operation
+    """
+
+    def __init__(self, card_dict: Dict[Color, int]):
+        if any(map(lambda count: count < 0, card_dict.values())):
+            raise ValueError("Card counts must be non-negative")
+        self.__card_dict = {c: card_dict.get(c, 0) for c in Color}
+
+    def __hash__(self):
+        return hash(tuple([(c, self.__card_dict[c]) for c in Color]))
+
+    @staticmethod
+    def from_list(card_list: List[Color]) -> 'LegacyCards':
+        return LegacyCards(Counter(card_list))
+
+    def get_card_count(self, color: Color) -> int:
+        return self.__card_dict[color]
+
+    def get_total_count(self) -> int:
+        return sum(self.__card_dict.values())
+
+    def add_cards(self, cards_to_add: 'LegacyCards') -> 'LegacyCards':
+        return LegacyCards({color: count + cards_to_add.get_card_count(color)
+                            for color, count in self.__card_dict.items()})
+
+    def subtract_cards(self, color: Color, count: int) -> 'LegacyCards':
+        return LegacyCards({existing_color: existing_count - count if existing_color == color else existing_count
+                            for existing_color, existing_count in self.__card_dict.items()})
+
+
+def build_turns(num_turns: int, seed: int) -> List[List[Color]]:
+    """
+    :param num_turns: the number of turns
+    :param seed: the seed for the random number generator
+    :return: the cards drawn in each turn
+    """
+    rng = random.Random(seed)
+    colors = list(Color)
+    return [[rng.choice(colors) for _ in range(CARDS_PER_DRAW)] for _ in range(num_turns)]
+
+
+def play_turns(cards_class: Callable, turns: List[List[Color]]) -> int:
+    """
+    Replays the card handling of the referee's turns: each turn draws cards, as RefereeGameState.draw_cards does, and
+    then buys a connection of the most plentiful color if the player has enough cards, as can_acquire_connection and
+    acquire_connection do. Each new hand is hashed, as the referee's state hashing does
+    :param cards_class: Cards or LegacyCards
+    :param turns: the cards drawn in each turn
+    :return: the number of cards left at the end
+    """
+    cards = cards_class({})
+    colors = list(Color)
+    for drawn_cards in turns:
+        cards = cards.add_cards(cards_class.from_list(drawn_cards))
+        hash(cards)
+        color = max(colors, key=cards.get_card_count)
+        length = min(cards.get_card_count(color), MAX_CONNECTION_LENGTH)
+        if length >= 3 and cards.get_card_count(color) >= length:
+            cards = cards.subtract_cards(color, length)
+            hash(cards)
+        cards.get_total_count()
+    return cards.get_total_count()
+
+
+def benchmark_cards() -> None:
+    """
+    Times the draw and buy paths of the referee's turns, and hashing and counting a hand, with the legacy and compact
+    Cards, and checks that both end up with the same cards
+    """
+    turns = build_turns(NUM_TURNS, SEED)
+    assert play_turns(Cards, turns) == play_turns(LegacyCards, turns)
+    hand = {Color.RED: 3, Color.BLUE: 4, Color.GREEN: 10}
+    legacy_hand, compact_hand = LegacyCards(hand), Cards(hand)
+
+    benchmarks = [
+        (f"{NUM_TURNS} turns", lambda: play_turns(LegacyCards, turns), lambda: play_turns(Cards, turns), 1),
+        ("100k hashes", lambda: hash(legacy_hand), lambda: hash(compact_hand), 100000),
+        ("100k total counts", legacy_hand.get_total_count, compact_hand.get_total_count, 100000),
+    ]
+    print(f"{'operation':>18} {'legacy (ms)':>12} {'compact (ms)':>13}")
+    for name, legacy, compact, number in benchmarks:
+        legacy_time = min(timeit.repeat(legacy, number=number, repeat=REPEATS))
+        compact_time = min(timeit.repeat(compact, number=number, repeat=REPEATS))
+        print(f"{name:>18} {legacy_time * 1000:>12.2f} {compact_time * 1000:>13.2f}")
+
+
+if __name__ == '__main__':
+    benchmark_cards()
@@ -0,0 +1,71 @@
+import random
+import timeit
+from typing import Dict, List
+
+from Trains.Other.city import City
+from Trains.Other.destination import Destination
+from Trains.Other.map_generator import MapGeneratorProcedural
+from Trains.Other.undirected_connection import UndirectedConnection
+
+NUM_CITIES = 1000
+CONNECTIONS_PER_CITY = 3
+MAX_PLAYER_RAILS = 45
+NUM_DESTINATIONS = 100000
+NUM_TURNS = 1000
+ACQUIRABLE_PER_TURN = 200
+REPEATS = 5
+SEED = 0
+
+
+def copy_cities(cities: List[City]) -> Dict[City, City]:
+    """
+    :param cities: interned cities
+    :return: a mapping from each city to a copy of it that is not interned, like the cities the map is built from
+    """
+    return {city: City(city.name, city.position) for city in cities}
+
+
+def benchmark_cities() -> None:
+    """
+    Times sorting, hashing and taking the least of destinations and connections whose cities are interned in the
+    map's CityTable against the same destinations and connections built from copies of the cities that are not
+    interned, which are compared by name
+    """
+    trains_map = MapGeneratorProcedural(NUM_CITIES, CONNECTIONS_PER_CITY, SEED).generate_map()
+    rng = random.Random(SEED)
+    copies = copy_cities(trains_map.get_cities())
+
+    connections = list(trains_map.get_undirected_connections())
+    plain_connections = [UndirectedConnection(copies[connection.get_city_1()], copies[connection.get_city_2()],
+                                              connection.length, connection.color) for connection in connections]
+    destinations = [Destination(destination.city_1, destination.city_2) for destination in
+                    rng.sample(sorted(trains_map.get_feasible_destinations(MAX_PLAYER_RAILS)), NUM_DESTINATIONS)]
+    plain_destinations = [Destination(copies[destination.city_1], copies[destination.city_2])
+                          for destination in destinations]
+    turns = [rng.sample(range(len(connections)), ACQUIRABLE_PER_TURN) for _ in range(NUM_TURNS)]
+
+    def least_acquirable(turn_connections: List[UndirectedConnection]) -> None:
+        for turn in turns:
+            min(turn_connections[index] for index in turn)
+
+    assert sorted(destinations) == sorted(plain_destinations)
+    assert sorted(destinations, key=lambda destination: destination.ordinals) == sorted(destinations)
+    benchmarks = [
+        (f"sort {len(connections)} connections", sorted, connections, plain_connections),
+        (f"sort {NUM_DESTINATIONS} destinations", sorted, destinations, plain_destinations),
+        (f"sort {NUM_DESTINATIONS} destinations by ordinals",
+         lambda items: sorted(items, key=lambda destination: destination.ordinals), destinations, None),
+        (f"hash {NUM_DESTINATIONS} destinations", set, destinations, plain_destinations),
+        (f"least of {ACQUIRABLE_PER_TURN} connections x {NUM_TURNS}", least_acquirable, connections,
+         plain_connections),
+    ]
+    print(f"{'operation':>44} {'by name (ms)':>13} {'interned (ms)':>14}")
+    for name, operation, interned, plain in benchmarks:
+        interned_time = min(timeit.repeat(lambda: operation(interned), number=1, repeat=REPEATS))
+        plain_time = "" if plain is None else \
+            f"{min(timeit.repeat(lambda: operation(plain), number=1, repeat=REPEATS)) * 1000:.2f}"
+        print(f"{name:>44} {plain_time:>13} {interned_time * 1000:>14.2f}")
+
+
+if __name__ == '__main__':
+    benchmark_cities()
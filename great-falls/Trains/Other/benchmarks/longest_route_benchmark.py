@@ -0,0 +1,149 @@
+import itertools
+import random
+import time
+from typing import Callable, Dict, List, Set, Tuple
+
+from Trains.Common.map import Map
+from Trains.Other.city import City
+from Trains.Other.color import Color
+from Trains.Other.directed_connection import DirectedConnection
+
+SEED = 0
+LEGACY_TIME_LIMIT = 5.0
+
+
+def build_map(num_cities: int, edges: List[Tuple[int, int, int, Color]]) -> Map:
+    """
+    :param num_cities: the number of cities, placed along a line
+    :param edges: the connections of the map as (city index, city index, length, color)
+    :return: a map with the given connections
+    """
+    cities = [City(f"city{i}", (i, i)) for i in range(num_cities)]
+    connections = []
+    for city_1, city_2, length, color in edges:
+        connections.append(DirectedConnection(cities[city_1], cities[city_2], length, color))
+        connections.append(DirectedConnection(cities[city_2], cities[city_1], length, color))
+    return Map(Map.MAX_WIDTH, Map.MAX_HEIGHT, cities, connections)
+
+
+def clique(num_cities: int) -> Tuple[int, List[Tuple[int, int, int, Color]]]:
+    """
+    Every pair of cities is connected, so every ordering of the cities is a route
+    """
+    rng = random.Random(SEED)
+    return num_cities, [(i, j, rng.randint(3, 5), Color.RED) for i, j in itertools.combinations(range(num_cities), 2)]
+
+
+def double_clique(num_cities: int) -> Tuple[int, List[Tuple[int, int, int, Color]]]:
+    """
+    Every pair of cities is connected twice, which doubles the branching of searches over connections
+    """
+    _, edges = clique(num_cities)
+    return num_cities, edges + [(i, j, 3, Color.BLUE) for i, j, _, _ in edges]
+
+
+def grid(rows: int, columns: int) -> Tuple[int, List[Tuple[int, int, int, Color]]]:
+    """
+    A grid of cities where each city is connected to its right and lower neighbors
+    """
+    edges = []
+    for row in range(rows):
+        for column in range(columns):
+            city = row * columns + column
+            if column + 1 < columns:
+                edges.append((city, city + 1, 3 + (city % 3), Color.GREEN))
+            if row + 1 < rows:
+                edges.append((city, city + columns, 3 + ((city + 1) % 3), Color.WHITE))
+    return rows * columns, edges
+
+
+def wheel(num_spokes: int) -> Tuple[int, List[Tuple[int, int, int, Color]]]:
+    """
+    A hub connected to every city of a cycle
+    """
+    edges = [(0, i, 4, Color.RED) for i in range(1, num_spokes + 1)]
+    edges += [(i, i % num_spokes + 1, 5, Color.BLUE) for i in range(1, num_spokes + 1)]
+    return num_spokes + 1, edges
+
+
+def long_path(num_cities: int) -> Tuple[int, List[Tuple[int, int, int, Color]]]:
+    """
+    A single long route, which has no cycles at all
+    """
+    return num_cities, [(i, i + 1, 5, Color.WHITE) for i in range(num_cities - 1)]
+
+
+ADVERSARIAL_CASES: Dict[str, Callable[[], Tuple[int, List[Tuple[int, int, int, Color]]]]] = {
+    "clique-7 (21 conns)": lambda: clique(7),
+    "clique-8 (28 conns)": lambda: clique(8),
+    "clique-9 (36 conns)": lambda: clique(9),
+    "double-clique-7 (42 conns)": lambda: double_clique(7),
+    "grid-4x5 (31 conns)": lambda: grid(4, 5),
+    "grid-5x5 (40 conns)": lambda: grid(5, 5),
+    "wheel-15 (30 conns)": lambda: wheel(15),
+    "path-60 (59 conns)": lambda: long_path(60),
+}
+
+
+def legacy_longest_continuous_route(trains_map: Map, acquired_connections: Set[DirectedConnection]) -> int:
+    """
+    The original longest route search, which runs a DFS from every city copying the visited set on every step
+    """
+    reachable_cities = {connection.from_city for connection in acquired_connections}
+    return max([_legacy_longest_path_from_city(trains_map, city, acquired_connections, set())
+                for city in reachable_cities], default=0)
+
+
+def _legacy_longest_path_from_city(trains_map: Map, city: City, acquired_connections: Set[DirectedConnection],
+                                   visited_cities: Set[City]) -> int:
+    usable_connections = set(trains_map.get_outgoing_connections(city)).intersection(acquired_connections)
+    longest_path = 0
+    for connection in usable_connections:
+        if connection.to_city not in visited_cities:
+            visited_cities = visited_cities.union({connection.from_city})
+            longest_path = max(longest_path, connection.length + _legacy_longest_path_from_city(
+                trains_map, connection.to_city, acquired_connections, visited_cities))
+    return longest_path
+
+
+def timed(function: Callable[[], int]) -> Tuple[int, float]:
+    """
+    :param function: the function to call
+    :return: the function's result and how many seconds the call took
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def benchmark_longest_route() -> None:
+    """
+    Times the legacy search and the map's longest route solver (on a fresh map, and again on the same map to show the
+    effect of reusing results) for each adversarial set of acquired connections. Once the legacy search takes longer
+    than LEGACY_TIME_LIMIT on a family of cases, it is skipped for the larger cases of that family
+    """
+    print(f"{'case':>28} {'route':>6} {'legacy (s)':>11} {'solver (s)':>11} {'reused (s)':>11}")
+    slow_families = set()
+    for name, case in ADVERSARIAL_CASES.items():
+        num_cities, edges = case()
+        trains_map = build_map(num_cities, edges)
+        acquired_connections = set(trains_map.get_all_directed_connections())
+
+        owned_connections = trains_map.get_undirected_connections()
+        route, solver_time = timed(lambda: trains_map.get_owned_subgraph(owned_connections).get_longest_route())
+        _, reused_time = timed(lambda: trains_map.get_owned_subgraph(owned_connections).get_longest_route())
+
+        family = name.split("-")[0]
+        legacy = "skipped"
+        if family not in slow_families:
+            legacy_route, legacy_time = timed(lambda: legacy_longest_continuous_route(trains_map,
+                                                                                      acquired_connections))
+            assert route == legacy_route
+            if legacy_time > LEGACY_TIME_LIMIT:
+                slow_families.add(family)
+            legacy = f"{legacy_time:.3f}"
+        print(f"{name:>28} {route:>6} {legacy:>11} {solver_time:>11.4f} {reused_time:>11.4f}")
+
+
+if __name__ == '__main__':
+    benchmark_longest_route()
@@ -0,0 +1,100 @@
+import heapq
+import os
+import timeit
+from typing import Dict, List, Set
+
+from Trains.Common.map import Map
+from Trains.Common.map_cache import MAP_CACHE
+from Trains.Other.city import City
+from Trains.Other.destination import Destination
+from Trains.Other.map_generator import MapGeneratorProcedural
+
+CITY_COUNTS = [100, 250, 500, 750]
+CONSTRUCTION_CITY_COUNTS = [500, 1000, 2000, 4000]
+CONNECTIONS_PER_CITY = 4
+RAIL_BUDGETS = [3, 10, 20, 45]
+SEED = 0
+NUM_WORKERS = os.cpu_count() or 1
+
+
+def build_random_map(num_cities: int, connections_per_city: int, seed: int) -> Map:
+    """
+    :param num_cities: the number of cities in the map
+    :param connections_per_city: the average number of connections a city is part of
+    :param seed: the seed for the random number generator
+    :return: a valid, connected map with randomly placed cities and randomly chosen connections
+    """
+    return MapGeneratorProcedural(num_cities, connections_per_city, seed, min_feasible_destinations=0).generate_map()
+
+
+def legacy_feasible_destinations(trains_map: Map, max_player_rails: int) -> Set[Destination]:
+    """
+    The original feasible destinations search, which runs Dijkstra's over City keyed dicts from every city on
+    every call
+    """
+    feasible_destinations = set()
+    cities = trains_map.get_cities()
+    for i in range(len(cities)):
+        distances = _legacy_min_distances(trains_map, cities[i])
+        for j in range(i + 1, len(cities)):
+            if distances[cities[j]] <= max_player_rails:
+                feasible_destinations.add(Destination(cities[i], cities[j]))
+    return feasible_destinations
+
+
+def _legacy_min_distances(trains_map: Map, origin_city: City) -> Dict[City, float]:
+    distances = {city: float("inf") for city in trains_map.get_cities()}
+    completed = set()
+    distances[origin_city] = 0
+    priority_queue = [(0, origin_city)]
+    while priority_queue:
+        shortest_distance, current_city = heapq.heappop(priority_queue)
+        if current_city not in completed:
+            for connection in trains_map.get_outgoing_connections(current_city):
+                distance = shortest_distance + connection.length
+                if distance < distances[connection.to_city]:
+                    distances[connection.to_city] = distance
+                    heapq.heappush(priority_queue, (distance, connection.to_city))
+        completed.add(current_city)
+    return distances
+
+
+def benchmark_construction(city_counts: List[int]) -> None:
+    """
+    Times constructing (and so validating) maps with thousands of connections
+    """
+    print(f"{'cities':>8} {'connections':>12} {'construct (s)':>14}")
+    for num_cities in city_counts:
+        trains_map = build_random_map(num_cities, CONNECTIONS_PER_CITY, SEED)
+        cities = trains_map.get_cities()
+        connections = trains_map.get_all_directed_connections()
+        construction_time = timeit.timeit(lambda: Map(Map.MAX_WIDTH, Map.MAX_HEIGHT, cities, connections), number=1)
+        print(f"{num_cities:>8} {len(connections):>12} {construction_time:>14.3f}")
+
+
+def benchmark_feasible_destinations(city_counts: List[int]) -> None:
+    """
+    Times answering feasible destination queries for several rail budgets with the legacy per-call search, with the
+    map's bounded search, and with the bounded search sharded across a process pool of NUM_WORKERS processes. The
+    shared map cache is cleared before each timing so every query is computed
+    """
+    print(f"{'cities':>8} {'legacy (s)':>12} {'bounded (s)':>12} {'sharded (s)':>12} {'speedup':>9}")
+    for num_cities in city_counts:
+        trains_map = build_random_map(num_cities, CONNECTIONS_PER_CITY, SEED)
+        legacy_time = timeit.timeit(
+            lambda: [legacy_feasible_destinations(trains_map, budget) for budget in RAIL_BUDGETS], number=1)
+        MAP_CACHE.clear()
+        bounded_time = timeit.timeit(
+            lambda: [trains_map.get_feasible_destinations(budget) for budget in RAIL_BUDGETS], number=1)
+        MAP_CACHE.clear()
+        sharded_time = timeit.timeit(
+            lambda: [trains_map.get_feasible_destinations(budget, NUM_WORKERS) for budget in RAIL_BUDGETS], number=1)
+        for budget in RAIL_BUDGETS:
+            assert legacy_feasible_destinations(trains_map, budget) == trains_map.get_feasible_destinations(budget)
+        print(f"{num_cities:>8} {legacy_time:>12.3f} {bounded_time:>12.3f} {sharded_time:>12.3f} "
+              f"{legacy_time / bounded_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    benchmark_construction(CONSTRUCTION_CITY_COUNTS)
+    benchmark_feasible_destinations(CITY_COUNTS)
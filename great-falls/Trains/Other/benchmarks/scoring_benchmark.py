@@ -0,0 +1,111 @@
+import random
+import timeit
+from collections import deque
+from typing import Dict, List, Set
+
+from Trains.Admin.referee_game_state import RefereeGameState
+from Trains.Common.longest_route_solver import LongestRouteSolver
+from Trains.Common.map import Map
+from Trains.Other.city import City
+from Trains.Other.cards import Cards
+from Trains.Other.color import Color
+from Trains.Other.destination import Destination
+from Trains.Other.directed_connection import DirectedConnection
+from Trains.Other.map_generator import MapGeneratorProcedural
+from Trains.Other.player_state import PrivatePlayerState, PublicPlayerState
+
+NUM_CITIES = 1000
+CONNECTIONS_PER_CITY = 3
+NUM_PLAYERS = 4
+DESTINATIONS_PER_PLAYER = 2
+HOLDINGS = [10, 25, 50, 100, 200]
+REPEATS = 5
+SEED = 0
+
+
+def build_game_state(trains_map: Map, connections_per_player: int, seed: int) -> RefereeGameState:
+    """
+    :param trains_map: the map of the game
+    :param connections_per_player: the number of connections each player owns
+    :param seed: the seed for the random number generator
+    :return: a game state where each player owns its own random connections and has random feasible destinations
+    """
+    rng = random.Random(seed)
+    connections = rng.sample(trains_map.get_sorted_undirected_connections(), NUM_PLAYERS * connections_per_player)
+    destinations = rng.sample(trains_map.get_sorted_feasible_destinations(45),
+                              NUM_PLAYERS * DESTINATIONS_PER_PLAYER)
+    connection_index = trains_map.get_connection_index()
+
+    player_states = []
+    for player in range(NUM_PLAYERS):
+        owned = set(connections[player * connections_per_player:(player + 1) * connections_per_player])
+        player_destinations = set(destinations[player * DESTINATIONS_PER_PLAYER:
+                                               (player + 1) * DESTINATIONS_PER_PLAYER])
+        player_states.append(PrivatePlayerState(Cards({}), player_destinations, 0,
+                                                PublicPlayerState(owned, connection_index=connection_index)))
+    return RefereeGameState(trains_map, deque(zip(player_states, range(NUM_PLAYERS))), [Color.RED])
+
+
+def legacy_is_destination_connected(trains_map: Map, destination: Destination,
+                                    acquired_connections: Set[DirectedConnection]) -> bool:
+    """
+    The original destination check, which searches the map from one city of the destination using only the acquired
+    connections
+    """
+    visited: Set[City] = {destination.city_1}
+    stack = [destination.city_1]
+    while stack:
+        city = stack.pop()
+        if city == destination.city_2:
+            return True
+        for connection in trains_map.get_outgoing_connections(city):
+            if connection in acquired_connections and connection.to_city not in visited:
+                visited.add(connection.to_city)
+                stack.append(connection.to_city)
+    return False
+
+
+def legacy_count_scores(trains_map: Map, player_states: List[PrivatePlayerState],
+                        longest_route_solver: LongestRouteSolver) -> List[int]:
+    """
+    The original scoring, which walks the players three times and converts every player's connections to directed
+    connections for the destination checks and the longest route search
+    """
+    city_ordinals: Dict[City, int] = {city: ordinal for ordinal, city in enumerate(trains_map.get_cities())}
+    directed_connections = [
+        DirectedConnection.convert_undirected_connections(player_state.public_state.acquired_connections)
+        for player_state in player_states]
+    segment_scores = [sum(connection.length for connection in player_state.public_state.acquired_connections)
+                      for player_state in player_states]
+    destination_scores = [sum(10 if legacy_is_destination_connected(trains_map, destination, acquired) else -10
+                              for destination in player_state.destinations)
+                          for player_state, acquired in zip(player_states, directed_connections)]
+    longest_routes = [longest_route_solver.longest_route(
+        (city_ordinals[connection.from_city], city_ordinals[connection.to_city], connection.length)
+        for connection in acquired) for acquired in directed_connections]
+    longest_route = max(longest_routes)
+    return [segment_scores[i] + destination_scores[i] + (20 if longest_routes[i] == longest_route else 0)
+            for i in range(len(player_states))]
+
+
+def benchmark_scoring() -> None:
+    """
+    Times the legacy scoring and the single pass scoring pipeline at the end of games where players own more and more
+    connections. Each keeps its longest route solver across runs, so repeated runs measure the scoring itself
+    """
+    trains_map = MapGeneratorProcedural(NUM_CITIES, CONNECTIONS_PER_CITY, SEED).generate_map()
+    longest_route_solver = LongestRouteSolver()
+    print(f"{'connections/player':>18} {'legacy (ms)':>12} {'pipeline (ms)':>14}")
+    for connections_per_player in HOLDINGS:
+        game_state = build_game_state(trains_map, connections_per_player, SEED)
+        player_states = game_state._RefereeGameState__get_player_states()
+        assert game_state.count_scores() == legacy_count_scores(trains_map, player_states, longest_route_solver)
+
+        legacy_time = min(timeit.repeat(lambda: legacy_count_scores(trains_map, player_states, longest_route_solver),
+                                        number=1, repeat=REPEATS))
+        pipeline_time = min(timeit.repeat(game_state.count_scores, number=1, repeat=REPEATS))
+        print(f"{connections_per_player:>18} {legacy_time * 1000:>12.2f} {pipeline_time * 1000:>14.2f}")
+
+
+if __name__ == '__main__':
+    benchmark_scoring()
@@ -0,0 +1,63 @@
+import os
+import random
+import time
+from typing import List
+
+from Trains.Admin.manager import Manager
+from Trains.Other.interfaces.i_player import IPlayer
+from Trains.Other.map_generator import MapGeneratorProcedural
+from Trains.Player.buy_now import BuyNowStrategy
+from Trains.Player.hold_ten import HoldTenStrategy
+from Trains.Player.player import Player
+
+NUM_CITIES = 60
+PLAYER_COUNTS = [64, 256]
+SEED = 0
+
+
+def worker_counts() -> List[int]:
+    """
+    :return: 1 and the powers of two up to the number of CPUs, followed by the number of CPUs
+    """
+    num_cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= num_cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != num_cpus:
+        counts.append(num_cpus)
+    return counts
+
+
+def build_players(num_players: int) -> List[IPlayer]:
+    """
+    :param num_players: the number of players
+    :return: players alternating between the buy now and hold ten strategies
+    """
+    strategies = [BuyNowStrategy, HoldTenStrategy]
+    return [Player(strategies[i % len(strategies)], f"player{i}") for i in range(num_players)]
+
+
+def benchmark_tournament() -> None:
+    """
+    Times the rounds of tournaments of increasing size with the games of each round run one after the other and in
+    pools of worker processes, and checks that every run has the same winners and cheaters
+    """
+    tournament_map = MapGeneratorProcedural(NUM_CITIES, seed=SEED).generate_map()
+    print(f"{'players':>8} {'workers':>8} {'time (s)':>9} {'speedup':>8}")
+    for num_players in PLAYER_COUNTS:
+        players = build_players(num_players)
+        sequential_time = None
+        sequential_result = None
+        for num_workers in worker_counts():
+            random.seed(SEED)
+            start = time.perf_counter()
+            result = Manager.run_rounds(players, tournament_map, num_workers)
+            elapsed = time.perf_counter() - start
+            if sequential_result is None:
+                sequential_time, sequential_result = elapsed, result
+            assert result == sequential_result
+            print(f"{num_players:>8} {num_workers:>8} {elapsed:>9.3f} {sequential_time / elapsed:>8.2f}")
+
+
+if __name__ == '__main__':
+    benchmark_tournament()
@@ -1,57 +1,109 @@
-from collections import Counter
-from typing import Dict, List
-from Trains.Other.color import Color
+from operator import add
+from typing import Dict, List, Tuple
+from Trains.Other.color import Color, COLOR_ORDINALS
+
+NUM_COLORS = len(COLOR_ORDINALS)
 
 
 class Cards:
     """
-    Represents all the cards that a player or referee has
+    Represents all the cards that a player or referee has. Cards are immutable and store one count per Color in a
+    tuple indexed by the Color's ordinal (see COLOR_ORDINALS), along with their total and hash, so counting and hashing
+    cards take constant time however often a game state is hashed.
 
     Args:
         card_dict (Dict[Color, int]): a dictionary mapping the Color to its non-negative card count
 
     Attributes:
-        __card_dict (Dict[Color, int]): a dictionary mapping the Color to its non-negative card count
+        __counts (Tuple[int, ...]): the non-negative card count of each Color, indexed by its ordinal
+        __total (int): the sum of the card counts
+        __hash (int): the hash of the card counts
     """
-    __card_dict: Dict[Color, int]
+    __slots__ = ("__counts", "__total", "__hash")
+
+    __counts: Tuple[int, ...]
+    __total: int
+    __hash: int
 
     def __init__(self, card_dict: Dict[Color, int]):
         """
         Constructs an instance of Cards by copying the card_dict. If the card_dict is missing Colors, Cards will fill
-        them in will a value of 0
+        them in will a value of 0. Keys that are not Colors are ignored
         :param card_dict: a dictionary mapping the Color to its non-negative card count
+        :raise ValueError: if a count is negative
         """
-        if any(map(lambda count: count < 0, card_dict.values())):
-            raise ValueError("Card counts must be non-negative")
-
-        cards = {}
-        for c in Color:
-            cards[c] = card_dict.get(c, 0)
+        counts = [0] * NUM_COLORS
+        for color, count in card_dict.items():
+            if count < 0:
+                raise ValueError("Card counts must be non-negative")
+            ordinal = COLOR_ORDINALS.get(color)
+            if ordinal is not None:
+                counts[ordinal] = count
 
-        self.__card_dict = cards
+        self.__set_counts(tuple(counts), sum(counts))
 
     def __eq__(self, other):
-        return isinstance(other, Cards) and self.__card_dict == other.__card_dict
+        return isinstance(other, Cards) and self.__hash == other.__hash and self.__counts == other.__counts
 
     def __hash__(self):
-        return hash(tuple([(c, self.__card_dict[c]) for c in Color]))
+        return self.__hash
+
+    def __getstate__(self):
+        return self.__counts, self.__total
+
+    def __setstate__(self, state):
+        self.__set_counts(*state)
 
     @staticmethod
     def from_list(card_list: List[Color]) -> 'Cards':
-        return Cards(Counter(card_list))
+        counts = [0] * NUM_COLORS
+        for color in card_list:
+            counts[COLOR_ORDINALS[color]] += 1
+        return Cards.__from_counts(tuple(counts), len(card_list))
 
     def get_card_count(self, color: Color) -> int:
-        return self.__card_dict[color]
+        return self.__counts[COLOR_ORDINALS[color]]
 
     def get_total_count(self) -> int:
-        return sum(self.__card_dict.values())
+        return self.__total
 
     def add_cards(self, cards_to_add: 'Cards') -> 'Cards':
-        return Cards({color: count + cards_to_add.get_card_count(color) for color, count in self.__card_dict.items()})
+        return Cards.__from_counts(tuple(map(add, self.__counts, cards_to_add.__counts)),
+                                   self.__total + cards_to_add.__total)
 
     def subtract_cards(self, color: Color, count: int) -> 'Cards':
         """
-        This function assumes that there are sufficient cards to subtract from
+        :param color: the Color of the cards to subtract
+        :param count: the number of cards to subtract
+        :return: these cards with count fewer cards of the given Color
+        :raise ValueError: if there are not enough cards of the given Color
+        """
+        ordinal = COLOR_ORDINALS[color]
+        remaining = self.__counts[ordinal] - count
+        if remaining < 0:
+            raise ValueError("Card counts must be non-negative")
+        return Cards.__from_counts(self.__counts[:ordinal] + (remaining,) + self.__counts[ordinal + 1:],
+                                   self.__total - count)
+
+    @staticmethod
+    def __from_counts(counts: Tuple[int, ...], total: int) -> 'Cards':
+        """
+        Constructs Cards from counts that are known to be valid, without copying or checking them
+        :param counts: the non-negative card count of each Color, indexed by its ordinal
+        :param total: the sum of the counts
+        :return: the cards with the given counts
+        """
+        cards = object.__new__(Cards)
+        cards.__set_counts(counts, total)
+        return cards
+
+    def __set_counts(self, counts: Tuple[int, ...], total: int) -> None:
+        """
+        SIDE-EFFECTS:
+            - Sets the counts, total and hash of these cards
+        :param counts: the non-negative card count of each Color, indexed by its ordinal
+        :param total: the sum of the counts
         """
-        return Cards({existing_color: existing_count - count if existing_color == color else existing_count for
-                      existing_color, existing_count in self.__card_dict.items()})
+        self.__counts = counts
+        self.__total = total
+        self.__hash = hash(counts)
@@ -1,9 +1,15 @@
 import re
+from typing import Dict, Iterable, List, Union
+
+VALID_NAME = re.compile("[A-Za-z0-9., ]+")
 
 
 class City:
     """
-    Represents an immutable city in the Trains game map
+    Represents an immutable city in the Trains game map. Cities are equal if they have the same name and position, and
+    are ordered by name. The cities of a map are interned in the map's CityTable, which gives each of them its
+    lexicographic ordinal, so two cities of the same table are compared by their ordinals alone. The hash is computed
+    once, when the city is constructed.
 
     Args:
         name (str): the name of the city
@@ -12,9 +18,19 @@ class City:
     Attributes:
         name (str): the name of the city
         position (int, int): the position of the city on the map with positive coordinates
+        ordinal (Union[None, int]): the position of the city in its table's lexicographic order, None if the city has
+                                    not been interned
+        table_id (Union[None, object]): identifies the table the city was interned in, None if it has not been
+                                        interned. Only the identity of the object matters
+        __hash (int): the hash of the name and position
     """
+    __slots__ = ("name", "position", "ordinal", "table_id", "__hash")
+
     name: str
     position: (int, int)
+    ordinal: Union[None, int]
+    table_id: Union[None, object]
+    __hash: int
 
     def __init__(self, name: str, position: (int, int)):
         """
@@ -30,23 +46,123 @@ class City:
             raise ValueError("A city's name must be less than 26 characters and can only contain letters, digits, "
                              "spaces, commas, and periods")
 
-        self.name = name
-        self.position = position
+        self.__set_state(name, position, None, None)
 
     @staticmethod
     def __valid_name(name: str) -> bool:
-        return len(name) <= 25 and re.fullmatch("[A-Za-z0-9., ]+", name)
+        return len(name) <= 25 and VALID_NAME.fullmatch(name)
+
+    def intern(self, table_id: object, ordinal: int) -> 'City':
+        """
+        :param table_id: identifies the table the city is interned in
+        :param ordinal: the position of the city in the table's lexicographic order
+        :return: a copy of this city that belongs to the given table
+        """
+        city = object.__new__(City)
+        city.__set_state(self.name, self.position, table_id, ordinal)
+        return city
+
+    def __set_state(self, name: str, position: (int, int), table_id: Union[None, object],
+                    ordinal: Union[None, int]) -> None:
+        """
+        SIDE-EFFECTS:
+            - Sets the attributes of this city and computes its hash
+        """
+        self.name = name
+        self.position = position
+        self.table_id = table_id
+        self.ordinal = ordinal
+        self.__hash = hash((name, position))
+
+    # Override - the hash depends on the process' string hashing, so it is computed again after unpickling
+    def __getstate__(self):
+        return self.name, self.position, self.table_id, self.ordinal
+
+    # Override
+    def __setstate__(self, state):
+        self.__set_state(*state)
 
     # Override
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, City):
-            return self.name == other.name and self.position == other.position
+            if self.table_id is not None and self.table_id is other.table_id:
+                return self.ordinal == other.ordinal
+            return self.__hash == other.__hash and self.name == other.name and self.position == other.position
         return False
 
     # Override
     def __hash__(self):
-        return hash((self.name, self.position))
+        return self.__hash
 
     # Override - required for comparisons when used in a heap
     def __lt__(self, other):
-        return self.name < other.name
\ No newline at end of file
+        if self.table_id is not None and self.table_id is other.table_id:
+            return self.ordinal < other.ordinal
+        return self.name < other.name
+
+
+class CityTable:
+    """
+    Represents the interned cities of a map. Each distinct city is stored once, and is given its position in the
+    lexicographic order of the cities (by name, then position) as its ordinal, so cities of the same table are compared
+    by ordinal instead of by name. Several cities may share a name, so the cities are indexed by name as lists.
+
+    Args:
+        cities (Iterable[City]): the cities to intern, which may contain duplicates
+
+    Attributes:
+        __cities (List[City]): the interned cities in lexicographic order, where the position of a city is its ordinal
+        __interned (Dict[City, City]): a mapping from each city to its interned instance
+        __by_name (Dict[str, List[City]]): a mapping from each name to the interned cities with that name, in
+                                           lexicographic order
+    """
+    __cities: List[City]
+    __interned: Dict[City, City]
+    __by_name: Dict[str, List[City]]
+
+    def __init__(self, cities: Iterable[City]):
+        table_id = object()
+        distinct_cities = sorted(set(cities), key=lambda city: (city.name, city.position))
+        self.__cities = [city.intern(table_id, ordinal) for ordinal, city in enumerate(distinct_cities)]
+        self.__interned = {city: city for city in self.__cities}
+        self.__by_name = {}
+        for city in self.__cities:
+            self.__by_name.setdefault(city.name, []).append(city)
+
+    def __len__(self):
+        return len(self.__cities)
+
+    def intern(self, city: City) -> City:
+        """
+        :param city: a city of the table, possibly another instance of it
+        :return: the interned instance of the city
+        :raise KeyError: if the city is not in the table
+        """
+        return self.__interned[city]
+
+    def get_city(self, name: str) -> City:
+        """
+        :param name: the name of a city of the table
+        :return: the interned city with the name
+        :raise KeyError: if no city of the table has the name
+        :raise ValueError: if several cities of the table have the name
+        """
+        cities = self.__by_name[name]
+        if len(cities) > 1:
+            raise ValueError(f"Several cities are named {name}")
+        return cities[0]
+
+    def get_cities_named(self, name: str) -> List[City]:
+        """
+        :param name: a name
+        :return: the interned cities with the name, in lexicographic order, which is empty if there are none
+        """
+        return self.__by_name.get(name, []).copy()
+
+    def get_cities(self) -> List[City]:
+        """
+        :return: the interned cities in lexicographic order
+        """
+        return self.__cities.copy()
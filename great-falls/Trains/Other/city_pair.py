@@ -1,8 +1,11 @@
+from typing import Tuple, Union
+
 from Trains.Other.city import City
 
 class CityPair:
     """
-    Represents a pair of two cities. city_1 is always lexicographically less than city_2
+    Represents a pair of two cities. city_1 is always lexicographically less than city_2. The hash is computed once,
+    when the pair is constructed, and pairs of cities of the same CityTable are compared by the cities' ordinals.
 
     Args:
         city_1 (City): one city in the city pair
@@ -11,9 +14,18 @@ class CityPair:
     Attributes:
         city_1 (City): the city in the city pair that is lexicographically less
         city_2 (City): the other city in the destination pair
+        table_id (Union[None, object]): identifies the CityTable both cities were interned in, None if they were not
+                                        interned in the same table
+        ordinals (Union[None, Tuple[int, int]]): the ordinals of the two cities if they share a table, None otherwise
+        __hash (int): the hash of the two cities
     """
+    __slots__ = ("city_1", "city_2", "table_id", "ordinals", "__hash")
+
     city_1: City
     city_2: City
+    table_id: Union[None, object]
+    ordinals: Union[None, Tuple[int, int]]
+    __hash: int
 
     def __init__(self, city_1: City, city_2: City):
         """
@@ -23,11 +35,32 @@ class CityPair:
         :param city_2: the other city in the city pair
         """
         if city_1 < city_2:
-            self.city_1 = city_1
-            self.city_2 = city_2
+            self.__set_cities(city_1, city_2)
+        else:
+            self.__set_cities(city_2, city_1)
+
+    def __set_cities(self, city_1: City, city_2: City) -> None:
+        """
+        SIDE-EFFECTS:
+            - Sets the cities of this pair and computes its hash
+        """
+        self.city_1 = city_1
+        self.city_2 = city_2
+        if city_1.table_id is not None and city_1.table_id is city_2.table_id:
+            self.table_id = city_1.table_id
+            self.ordinals = (city_1.ordinal, city_2.ordinal)
         else:
-            self.city_1 = city_2
-            self.city_2 = city_1
+            self.table_id = None
+            self.ordinals = None
+        self.__hash = hash((city_1.__hash__(), city_2.__hash__()))
+
+    # Override - the hash depends on the cities' hashes, so it is computed again after unpickling
+    def __getstate__(self):
+        return self.city_1, self.city_2
+
+    # Override
+    def __setstate__(self, state):
+        self.__set_cities(*state)
 
     # Override
     def __eq__(self, other):
@@ -35,10 +68,13 @@ class CityPair:
 
     # Override
     def __hash__(self):
-        return hash((self.city_1.__hash__(), self.city_2.__hash__()))
+        return self.__hash
 
     # Override
     def __lt__(self, other):
+        if self.table_id is not None and self.table_id is other.table_id:
+            return self.ordinals < other.ordinals
+
         if self.city_1.name == other.city_1.name:
             return self.city_2 < other.city_2
         else:
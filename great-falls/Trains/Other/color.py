@@ -9,3 +9,9 @@ class Color(Enum):
     BLUE = "blue"
     GREEN = "green"
     WHITE = "white"
+
+
+COLOR_ORDINALS = {color: ordinal for ordinal, color in enumerate(Color)}
+"""
+Maps each Color to a small integer, in the order the colors are declared
+"""
@@ -0,0 +1,112 @@
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple, Union
+from Trains.Other.undirected_connection import UndirectedConnection
+
+
+class ConnectionIndex:
+    """
+    Represents an assignment of integer ids to undirected connections, so that a set of connections can be encoded as
+    a bitset: a Python int whose bit i is set exactly when the connection with id i is in the set. Unions, ownership
+    tests and equality of such sets are then single integer operations.
+
+    Ids are assigned in the order connections are first seen, starting with the given connections. If the index is
+    extendable, a connection that is not known yet is given the next free id when it is first encoded, so any set of
+    connections can be encoded. Otherwise the index is lookup-only once constructed, so it can be shared (e.g. by every
+    game on a map) without ever changing.
+
+    Args:
+        connections (Iterable[UndirectedConnection]): the connections to assign ids 0, 1, ... to, in order
+        extendable (bool): whether unknown connections are given new ids
+
+    Attributes:
+        __ids (Dict[UndirectedConnection, int]): a mapping from each known connection to its id
+        __connections (List[UndirectedConnection]): the known connections, indexed by id
+        __extendable (bool): whether unknown connections are given new ids
+    """
+    __ids: Dict[UndirectedConnection, int]
+    __connections: List[UndirectedConnection]
+    __extendable: bool
+
+    def __init__(self, connections: Iterable[UndirectedConnection] = (), extendable: bool = True):
+        self.__ids = {}
+        self.__connections = []
+        self.__extendable = True
+        for connection in connections:
+            self.get_id(connection)
+        self.__extendable = extendable
+
+    def __len__(self):
+        return len(self.__connections)
+
+    def get_id(self, connection: UndirectedConnection) -> int:
+        """
+        SIDE-EFFECTS:
+            - Assigns the next free id to the connection if it does not have one yet and the index is extendable
+        :param connection: the connection to look up
+        :return: the id of the connection
+        :raise KeyError: if the connection is not known and the index is not extendable
+        """
+        connection_id = self.__ids.get(connection)
+        if connection_id is None:
+            if not self.__extendable:
+                raise KeyError("The connection is not in the index")
+            connection_id = len(self.__connections)
+            self.__ids[connection] = connection_id
+            self.__connections.append(connection)
+        return connection_id
+
+    def find_id(self, connection: UndirectedConnection) -> Union[None, int]:
+        """
+        :param connection: the connection to look up
+        :return: the id of the connection, None if it is not known
+        """
+        return self.__ids.get(connection)
+
+    def to_bitset(self, connections: Iterable[UndirectedConnection]) -> int:
+        """
+        :param connections: the connections to encode
+        :return: the bitset with the bit of each of the given connections set
+        :raise KeyError: if a connection is not known and the index is not extendable
+        """
+        bitset = 0
+        for connection in connections:
+            bitset |= 1 << self.get_id(connection)
+        return bitset
+
+    def partition(self, connections: Iterable[UndirectedConnection]) -> Tuple[int, FrozenSet[UndirectedConnection]]:
+        """
+        Encodes the connections that have, or are given, an id and sets aside the ones that cannot be encoded
+        :param connections: the connections to encode
+        :return: the bitset of the encoded connections and the connections that are not in the index
+        """
+        bitset = 0
+        unknown = set()
+        for connection in connections:
+            connection_id = self.__ids.get(connection)
+            if connection_id is None and self.__extendable:
+                connection_id = self.get_id(connection)
+            if connection_id is None:
+                unknown.add(connection)
+            else:
+                bitset |= 1 << connection_id
+        return bitset, frozenset(unknown)
+
+    def to_connections(self, bitset: int) -> Set[UndirectedConnection]:
+        """
+        :param bitset: a bitset produced by this index
+        :return: the connections whose bits are set in the bitset
+        """
+        connections = set()
+        while bitset:
+            lowest_bit = bitset & -bitset
+            connections.add(self.__connections[lowest_bit.bit_length() - 1])
+            bitset ^= lowest_bit
+        return connections
+
+    def contains(self, bitset: int, connection: UndirectedConnection) -> bool:
+        """
+        :param bitset: a bitset produced by this index
+        :param connection: the connection to look for
+        :return: whether the connection's bit is set in the bitset
+        """
+        connection_id = self.__ids.get(connection)
+        return connection_id is not None and bool(bitset >> connection_id & 1)
@@ -0,0 +1,83 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+from Trains.Other.color import Color
+from Trains.Other.zobrist_keys import ZobristKeys
+
+
+class Deck:
+    """
+    Represents an immutable deck of colored cards, which cards are drawn from the top of. Every deck drawn from the
+    same deck shares one backing tuple of cards and only keeps the offset of its top card, so drawing cards takes time
+    proportional to the number of cards drawn rather than to the size of the deck.
+
+    Each deck carries a Zobrist hash of its cards, where the card at each position from the bottom of the deck has its
+    own key, so drawing cards only removes the keys of the drawn cards and unequal decks rarely need to be compared
+    card by card.
+
+    Args:
+        cards (Iterable[Color]): the cards of the deck, from top to bottom
+
+    Attributes:
+        __cards (Tuple[Color, ...]): the backing cards, from top to bottom, shared with every deck drawn from this one
+        __offset (int): the index in __cards of the top card of this deck
+        __hash (int): the Zobrist hash of the cards from __offset to the bottom of the deck
+    """
+    KEYS = ZobristKeys()
+
+    __cards: Tuple[Color, ...]
+    __offset: int
+    __hash: int
+
+    def __init__(self, cards: Iterable[Color] = ()):
+        self.__cards = tuple(cards)
+        self.__offset = 0
+        self.__hash = 0
+        for position, color in enumerate(reversed(self.__cards)):
+            self.__hash ^= self.KEYS.get_key((position, color))
+
+    def __len__(self):
+        return len(self.__cards) - self.__offset
+
+    def __iter__(self) -> Iterator[Color]:
+        return islice(self.__cards, self.__offset, None)
+
+    def __eq__(self, other):
+        if not isinstance(other, Deck):
+            return False
+        if self.__cards is other.__cards:
+            return self.__offset == other.__offset
+        return self.__hash == other.__hash and len(self) == len(other) and \
+            all(card == other_card for card, other_card in zip(self, other))
+
+    def __hash__(self):
+        return self.__hash
+
+    def peek(self, num_cards: int) -> List[Color]:
+        """
+        :param num_cards: the number of cards to look at
+        :return: the top num_cards cards of the deck, or every card if the deck has fewer
+        """
+        return list(self.__cards[self.__offset:self.__offset + num_cards])
+
+    def draw(self, num_cards: int) -> 'Deck':
+        """
+        :param num_cards: the number of cards to draw from the top of the deck
+        :return: a new deck without the drawn cards, sharing this deck's backing cards
+        """
+        new_offset = min(self.__offset + num_cards, len(self.__cards))
+        new_hash = self.__hash
+        for index in range(self.__offset, new_offset):
+            new_hash ^= self.KEYS.get_key((len(self.__cards) - 1 - index, self.__cards[index]))
+
+        new_deck = Deck.__new__(Deck)
+        new_deck.__cards = self.__cards
+        new_deck.__offset = new_offset
+        new_deck.__hash = new_hash
+        return new_deck
+
+    def to_list(self) -> List[Color]:
+        """
+        :return: the cards of the deck, from top to bottom
+        """
+        return list(self)
@@ -0,0 +1,64 @@
+from typing import Iterable, Iterator, List, Set
+
+from Trains.Other.destination import Destination
+
+
+class DestinationPool:
+    """
+    Represents the destinations that can still be offered to players while a game is set up. Destinations are drawn
+    from their ordering only when an offer needs them, so setting up a game draws a few destinations per player no
+    matter how many feasible destinations the map has. Destinations a player picks are removed with a set insertion,
+    and destinations a player returns stay in the pool at the position they were drawn from.
+
+    Args:
+        ordered_destinations (Iterable[Destination]): the destinations in the order they are offered, e.g. from
+                                                      IDestinationOptionsStrategy.iter_destinations
+
+    Attributes:
+        __ordering (Iterator[Destination]): the destinations that have not been drawn yet, in order
+        __drawn (List[Destination]): the destinations drawn so far, in order
+        __first (int): the index in __drawn before which every destination has been removed
+        __removed (Set[Destination]): the destinations that have been removed from the pool
+    """
+    __ordering: Iterator[Destination]
+    __drawn: List[Destination]
+    __first: int
+    __removed: Set[Destination]
+
+    def __init__(self, ordered_destinations: Iterable[Destination]):
+        self.__ordering = iter(ordered_destinations)
+        self.__drawn = []
+        self.__first = 0
+        self.__removed = set()
+
+    def offer(self, num_destinations: int) -> List[Destination]:
+        """
+        SIDE-EFFECTS:
+            - Draws destinations from the ordering until there are enough to offer
+        :param num_destinations: the number of destinations to offer
+        :return: the first num_destinations destinations of the pool in order, or every destination if the pool has
+                 fewer
+        """
+        while self.__first < len(self.__drawn) and self.__drawn[self.__first] in self.__removed:
+            self.__first += 1
+
+        offered = []
+        index = self.__first
+        while len(offered) < num_destinations:
+            if index == len(self.__drawn):
+                destination = next(self.__ordering, None)
+                if destination is None:
+                    break
+                self.__drawn.append(destination)
+            if self.__drawn[index] not in self.__removed:
+                offered.append(self.__drawn[index])
+            index += 1
+        return offered
+
+    def remove(self, destinations: Iterable[Destination]) -> None:
+        """
+        SIDE-EFFECTS:
+            - Removes the given destinations from the pool
+        :param destinations: the destinations to remove
+        """
+        self.__removed.update(destinations)
@@ -6,6 +6,8 @@ from Trains.Other.color import Color
 class IDeckCreationStrategy:
     """
     Represents a strategy to create a deck of colored cards. Extending classes must implement create_deck.
+    The Referee copies the created cards into a Deck once per game and only advances that Deck's offset as cards are
+    dealt and drawn, so large decks cost no more per draw than small ones.
     """
 
     def create_deck(self, num_cards: int) -> List[Color]:
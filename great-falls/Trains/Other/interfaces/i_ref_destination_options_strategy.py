@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import Collection, Iterator, List, Sequence
 
 from Trains.Other.destination import Destination
 
@@ -8,10 +8,20 @@ class IDestinationOptionsStrategy:
     A player_strategies to order the feasible destinations for a map for usage in proposing destinations to players
     """
 
-    def order_destinations(self, feasible_destinations: Set[Destination]) -> List[Destination]:
+    def order_destinations(self, feasible_destinations: Collection[Destination]) -> List[Destination]:
         """
         Order the given the destinations by some specified ordering.
-        :param feasible_destinations: a set of destinations to order
+        :param feasible_destinations: the distinct destinations to order
         :return: a list of destination in the desired order
         """
         raise NotImplementedError()
+
+    def iter_destinations(self, sorted_destinations: Sequence[Destination]) -> Iterator[Destination]:
+        """
+        Lazily order the given destinations by the same ordering as order_destinations, so that only the destinations
+        that are actually offered have to be ordered. By default, this orders every destination with
+        order_destinations; extending classes may override it to order destinations one at a time.
+        :param sorted_destinations: the distinct destinations to order, in lexicographic order
+        :return: an iterator over the destinations in the desired order
+        """
+        return iter(self.order_destinations(sorted_destinations))
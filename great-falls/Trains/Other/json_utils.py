@@ -1,8 +1,9 @@
 import inspect
+import itertools
 import json
 import os
 import sys
-from typing import List, Dict, Union, Tuple
+from typing import List, Dict, Iterable, TextIO, Union, Tuple
 from Trains.Common.map import Map
 from Trains.Other.game_result import GameResult
 from Trains.Other.interfaces.i_player import IPlayer
@@ -15,6 +16,11 @@ from Trains.Other.undirected_connection import UndirectedConnection
 from Trains.Other.color import Color
 from Trains.Player.player import Player
 
+CityLookup = Union[List[City], Dict[str, City]]
+"""
+The cities of a map, either as a list or as an index by name (see index_cities)
+"""
+
 
 def get_next_json_value(json_str: str) -> (Union[str, Dict, List], str):
     """
@@ -34,30 +40,42 @@ def dict_to_map(json_dict: Dict) -> Map:
     width = json_dict["width"]
     height = json_dict["height"]
     cities = [array_to_city(city_array) for city_array in json_dict["cities"]]
-    directed_connections = _get_directed_connections(json_dict, cities)
+    directed_connections = _get_directed_connections(json_dict, index_cities(cities))
 
     return Map(width, height, cities, directed_connections)
 
 
-def dict_to_player_states(player_state_dict: Dict, cities: List[City]) -> \
+def index_cities(cities: Iterable[City]) -> Dict[str, City]:
+    """
+    Cities are looked up by name while parsing connections and destinations, so documents with many of them should
+    build this index once and pass it to every parsing function instead of the list of cities
+    :param cities: the cities of a map
+    :return: a mapping from the name of each city to the city
+    """
+    return {city.name: city for city in cities}
+
+
+def dict_to_player_states(player_state_dict: Dict, cities: CityLookup) -> \
         Tuple[PrivatePlayerState, List[PublicPlayerState]]:
     """
     :param player_state_dict: dictionary with field for "this" and "acquired" (see spec)
-    :param cities: the list of cities in the map to verify all connections are valid
+    :param cities: the cities in the map to verify all connections are valid, as a list or an index (see index_cities)
     :return: a PrivatePlayerState and a list of PublicPlayerState from a "PlayerState" (see spec)
     """
+    cities = _as_city_index(cities)
     other_player_states = [array_to_public_state(player_array, cities) for player_array in
                            player_state_dict["acquired"]]
 
     return dict_to_private_player_state(player_state_dict["this"], cities), other_player_states
 
 
-def dict_to_private_player_state(private_player_state_dict: Dict, cities: List[City]) -> PrivatePlayerState:
+def dict_to_private_player_state(private_player_state_dict: Dict, cities: CityLookup) -> PrivatePlayerState:
     """
     :param private_player_state_dict: dict with fields for 2 destinations, rails, cards, and acquired connections
-    :param cities: the list of cities in the map to verify all connections are valid
+    :param cities: the cities in the map to verify all connections are valid, as a list or an index (see index_cities)
     :return: a PrivatePlayerState from a "ThisPlayer" (see spec)
     """
+    cities = _as_city_index(cities)
     destination_1 = array_to_destination(private_player_state_dict["destination1"], cities)
     destination_2 = array_to_destination(private_player_state_dict["destination2"], cities)
     rails = private_player_state_dict["rails"]
@@ -66,13 +84,14 @@ def dict_to_private_player_state(private_player_state_dict: Dict, cities: List[C
     return PrivatePlayerState(cards, {destination_1, destination_2}, rails, public_player_state)
 
 
-def array_to_destination(destination_array: List, cities: List[City]) -> Destination:
+def array_to_destination(destination_array: List, cities: CityLookup) -> Destination:
     """
     :param destination_array: array containing two names
-    :param cities: the list of cities in the map to verify all connections are valid
+    :param cities: the cities in the map to verify all connections are valid, as a list or an index (see index_cities)
     :return: a Destination from a "Destination" (see spec)
     """
-    return Destination(find_city(cities, destination_array[0]), find_city(cities, destination_array[1]))
+    cities = _as_city_index(cities)
+    return Destination(cities[destination_array[0]], cities[destination_array[1]])
 
 
 def array_to_city(city_array: List) -> City:
@@ -92,23 +111,25 @@ def dict_to_cards(cards_dict: Dict) -> Cards:
     return Cards(cards_dict_with_colors)
 
 
-def array_to_public_state(public_state_array: List, cities: List[City]) -> PublicPlayerState:
+def array_to_public_state(public_state_array: List, cities: CityLookup) -> PublicPlayerState:
     """
     :param public_state_array: an array containing a player's acquired connections
-    :param cities: the list of cities in the map to verify all connections are valid
+    :param cities: the cities in the map to verify all connections are valid, as a list or an index (see index_cities)
     :return: a PublicPlayerState from a "Player" (see spec)
     """
+    cities = _as_city_index(cities)
     return PublicPlayerState({array_to_undirected_connection(connection, cities) for connection in public_state_array})
 
 
-def array_to_undirected_connection(connection_array: List, cities: List[City]) -> UndirectedConnection:
+def array_to_undirected_connection(connection_array: List, cities: CityLookup) -> UndirectedConnection:
     """
     :param connection_array: an array containing two city names, a length, and a color
-    :param cities: the list of cities in the map to verify all connections are valid
+    :param cities: the cities in the map to verify all connections are valid, as a list or an index (see index_cities)
     :return: an UndirectedConnection from an "Acquired" (see spec)
     """
-    return UndirectedConnection(find_city(cities, connection_array[0]),
-                                find_city(cities, connection_array[1]),
+    cities = _as_city_index(cities)
+    return UndirectedConnection(cities[connection_array[0]],
+                                cities[connection_array[1]],
                                 connection_array[3],
                                 Color(connection_array[2]))
 
@@ -161,18 +182,26 @@ def _abs_path_to_file(filename):
     return os.path.abspath(os.path.join(os.path.dirname(inspect.getfile(sys._getframe(1))), filename))
 
 
-def _get_directed_connections(json_dict: Dict, cities: List[City]) -> List[DirectedConnection]:
+def _as_city_index(cities: CityLookup) -> Dict[str, City]:
+    """
+    :param cities: the cities of a map, as a list or an index (see index_cities)
+    :return: an index of the cities by name
+    """
+    return cities if isinstance(cities, dict) else index_cities(cities)
+
+
+def _get_directed_connections(json_dict: Dict, cities: Dict[str, City]) -> List[DirectedConnection]:
     """
     :param json_dict: a dict representing a map
-    :param cities: the list of cities in the map to verify all connections are valid
+    :param cities: an index of the cities in the map (see index_cities) to verify all connections are valid
     :return: a list of DirectedConnection from "Connections" (see spec)
     """
     directed_connections = []
     for origin_name, target in json_dict["connections"].items():
+        origin_city = cities[origin_name]
         for destination_name, segment in target.items():
+            destination_city = cities[destination_name]
             for color, length in segment.items():
-                origin_city = find_city(cities, origin_name)
-                destination_city = find_city(cities, destination_name)
                 directed_connections.append(DirectedConnection(origin_city, destination_city,
                                                                int(length), Color(color)))
                 directed_connections.append(DirectedConnection(destination_city, origin_city,
@@ -189,6 +218,30 @@ def serialize_undirected_connection(connection: UndirectedConnection) -> List:
     return [connection.get_city_1().name, connection.get_city_2().name, connection.color.value, connection.length]
 
 
+def write_map(trains_map: Map, output: TextIO) -> None:
+    """
+    Writes the map as a "Map" (see spec) one city and one origin's connections at a time, so large maps are never held
+    in memory as a single JSON value
+    SIDE-EFFECTS:
+        - Writes to output
+    :param trains_map: the map to write
+    :param output: the stream to write to
+    """
+    output.write(f'{{"width": {trains_map.width}, "height": {trains_map.height}, "cities": [')
+    for index, city in enumerate(trains_map.get_cities()):
+        output.write((", " if index else "") + json.dumps([city.name, list(city.position)]))
+
+    output.write('], "connections": {')
+    connections_by_origin = itertools.groupby(trains_map.get_sorted_undirected_connections(),
+                                              key=lambda connection: connection.get_city_1().name)
+    for index, (origin_name, connections) in enumerate(connections_by_origin):
+        targets = {}
+        for connection in connections:
+            targets.setdefault(connection.get_city_2().name, {})[connection.color.value] = connection.length
+        output.write((", " if index else "") + f"{json.dumps(origin_name)}: {json.dumps(targets)}")
+    output.write("}}")
+
+
 def serialize_game_result(game_result: GameResult) -> List:
     """
     :param game_result: the game result to serialize
@@ -1,5 +1,8 @@
+import random
+from typing import Dict, List, Set, Tuple, Union
 from Trains.Other.interfaces.i_map_generator import IMapGenerator
 from Trains.Common.map import Map
+from Trains.Other import admin_utils
 from Trains.Other.city import City
 from Trains.Other.directed_connection import DirectedConnection
 from Trains.Other.color import Color
@@ -64,4 +67,217 @@ class MapGeneratorDefault(IMapGenerator):
         Generates default map
         :return: the generated map
         """
-        return Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECETED_CONNECTION_LIST)
\ No newline at end of file
+        return Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECETED_CONNECTION_LIST)
+
+
+class MapGeneratorProcedural(IMapGenerator):
+    """
+    Generates large random maps for measuring how the rest of the code scales. The same arguments (including the
+    seed) always generate the same map. Every generated map is valid, connected and has at least
+    min_feasible_destinations feasible destinations for max_player_rails rails.
+
+    The cities are placed at distinct random positions. A random spanning tree connects all of them, then random
+    connections are added until the cities have connections_per_city connections on average. If that leaves too few
+    feasible destinations, a direct connection is added between enough infeasible pairs of cities.
+
+    Args:
+        num_cities (int): the number of cities
+        connections_per_city (float): the average number of connections a city is part of
+        seed (int): the seed for the random number generator
+        min_feasible_destinations (int): the least number of feasible destinations the map must have
+        max_player_rails (int): the number of rails feasible destinations are measured with
+        color_weights (Union[None, Dict[Color, int]]): the relative frequency of each color. If None, all colors are
+                                                       equally likely
+        length_weights (Union[None, Dict[int, int]]): the relative frequency of each length. If None, all lengths are
+                                                      equally likely
+        width (int): the width of the map
+        height (int): the height of the map
+
+    Attributes:
+        __num_cities (int): the number of cities
+        __num_connections (int): the number of undirected connections before destinations are topped up
+        __seed (int): the seed for the random number generator
+        __min_feasible_destinations (int): the least number of feasible destinations the map must have
+        __max_player_rails (int): the number of rails feasible destinations are measured with
+        __colors (List[Color]): the colors that can be picked, in Color order
+        __color_weights (List[int]): the relative frequency of each color in __colors
+        __lengths (List[int]): the lengths that can be picked, in increasing order
+        __length_weights (List[int]): the relative frequency of each length in __lengths
+        __width (int): the width of the map
+        __height (int): the height of the map
+    """
+    LENGTHS = [3, 4, 5]
+    DEFAULT_CONNECTIONS_PER_CITY = 3.0
+    DEFAULT_MIN_FEASIBLE_DESTINATIONS = admin_utils.MAX_NUM_PLAYERS * (
+            admin_utils.NUM_DESTINATION_OPTIONS - admin_utils.NUM_DESTINATIONS_RETURNED) + \
+        admin_utils.NUM_DESTINATIONS_RETURNED
+
+    __num_cities: int
+    __num_connections: int
+    __seed: int
+    __min_feasible_destinations: int
+    __max_player_rails: int
+    __colors: List[Color]
+    __color_weights: List[int]
+    __lengths: List[int]
+    __length_weights: List[int]
+    __width: int
+    __height: int
+
+    def __init__(self, num_cities: int, connections_per_city: float = DEFAULT_CONNECTIONS_PER_CITY, seed: int = 0,
+                 min_feasible_destinations: int = DEFAULT_MIN_FEASIBLE_DESTINATIONS,
+                 max_player_rails: int = admin_utils.STARTING_NUM_RAILS,
+                 color_weights: Union[None, Dict[Color, int]] = None,
+                 length_weights: Union[None, Dict[int, int]] = None,
+                 width: int = Map.MAX_WIDTH, height: int = Map.MAX_HEIGHT):
+        """
+        :raises ValueError: if the cities do not fit on the map, if the connections or feasible destinations asked for
+                            cannot fit between the cities, or if no color or length can be picked
+        """
+        if num_cities < 2 or num_cities > width * height:
+            raise ValueError("num_cities must be at least 2 and fit on the map")
+
+        color_weights = {color: 1 for color in Color} if color_weights is None else color_weights
+        length_weights = {length: 1 for length in self.LENGTHS} if length_weights is None else length_weights
+        self.__colors = [color for color in Color if color_weights.get(color, 0) > 0]
+        self.__color_weights = [color_weights[color] for color in self.__colors]
+        self.__lengths = [length for length in self.LENGTHS if length_weights.get(length, 0) > 0]
+        self.__length_weights = [length_weights[length] for length in self.__lengths]
+        if not self.__colors or not self.__lengths:
+            raise ValueError("At least one color and one length must have a positive weight")
+
+        num_pairs = num_cities * (num_cities - 1) // 2
+        self.__num_connections = max(num_cities - 1, round(num_cities * connections_per_city / 2))
+        if self.__num_connections > num_pairs * len(self.__colors):
+            raise ValueError("There are not enough pairs of cities and colors for connections_per_city")
+
+        if min_feasible_destinations > num_pairs or \
+                (min_feasible_destinations > 0 and min(self.__lengths) > max_player_rails):
+            raise ValueError("min_feasible_destinations cannot be reached with the given cities and rails")
+
+        self.__num_cities = num_cities
+        self.__seed = seed
+        self.__min_feasible_destinations = min_feasible_destinations
+        self.__max_player_rails = max_player_rails
+        self.__width = width
+        self.__height = height
+
+    def generate_map(self) -> Map:
+        """
+        Generates a random map from the seed
+        :return: the generated map
+        """
+        rng = random.Random(self.__seed)
+        cities = self.__place_cities(rng)
+        pair_colors = {}
+        self.__add_spanning_tree(rng, pair_colors)
+        self.__add_random_connections(rng, pair_colors)
+        trains_map = self.__build_map(cities, pair_colors)
+
+        feasible_destinations = trains_map.get_feasible_destinations(self.__max_player_rails)
+        num_missing_destinations = self.__min_feasible_destinations - len(feasible_destinations)
+        if num_missing_destinations > 0:
+            self.__add_destinations(rng, cities, pair_colors, feasible_destinations, num_missing_destinations)
+            trains_map = self.__build_map(cities, pair_colors)
+        return trains_map
+
+    def __place_cities(self, rng: random.Random) -> List[City]:
+        """
+        :param rng: the random number generator
+        :return: the cities, placed at distinct positions
+        """
+        positions = rng.sample(range(self.__width * self.__height), self.__num_cities)
+        return [City(f"city{index}", (position % self.__width, position // self.__width))
+                for index, position in enumerate(positions)]
+
+    def __add_spanning_tree(self, rng: random.Random, pair_colors: Dict[Tuple[int, int], Dict[Color, int]]) -> None:
+        """
+        Connects every city to a random city before it, so all cities are connected
+        SIDE-EFFECTS:
+            - Adds the connections to pair_colors
+        :param rng: the random number generator
+        :param pair_colors: a mapping from each connected pair of city indices to the length of its connection of
+                            each color
+        """
+        for city in range(1, self.__num_cities):
+            self.__add_connection(rng, pair_colors, rng.randrange(city), city, self.__lengths, self.__length_weights)
+
+    def __add_random_connections(self, rng: random.Random,
+                                 pair_colors: Dict[Tuple[int, int], Dict[Color, int]]) -> None:
+        """
+        Adds connections between random pairs of cities until there are self.__num_connections connections
+        SIDE-EFFECTS:
+            - Adds the connections to pair_colors
+        :param rng: the random number generator
+        :param pair_colors: a mapping from each connected pair of city indices to the length of its connection of
+                            each color
+        """
+        num_connections = self.__num_cities - 1
+        while num_connections < self.__num_connections:
+            city_1, city_2 = rng.sample(range(self.__num_cities), 2)
+            if self.__add_connection(rng, pair_colors, city_1, city_2, self.__lengths, self.__length_weights):
+                num_connections += 1
+
+    def __add_destinations(self, rng: random.Random, cities: List[City],
+                           pair_colors: Dict[Tuple[int, int], Dict[Color, int]],
+                           feasible_destinations: Set, num_missing_destinations: int) -> None:
+        """
+        Directly connects random infeasible pairs of cities with connections short enough to make them feasible
+        SIDE-EFFECTS:
+            - Adds the connections to pair_colors
+        :param rng: the random number generator
+        :param cities: the cities of the map
+        :param pair_colors: a mapping from each connected pair of city indices to the length of its connection of
+                            each color
+        :param feasible_destinations: the feasible destinations of the map so far
+        :param num_missing_destinations: how many more feasible destinations are needed
+        """
+        city_indices = {city: index for index, city in enumerate(cities)}
+        feasible_pairs = {tuple(sorted((city_indices[destination.city_1], city_indices[destination.city_2])))
+                          for destination in feasible_destinations}
+        infeasible_pairs = [(city_1, city_2) for city_1 in range(self.__num_cities)
+                            for city_2 in range(city_1 + 1, self.__num_cities)
+                            if (city_1, city_2) not in feasible_pairs]
+        short_lengths = [length for length in self.__lengths if length <= self.__max_player_rails]
+        short_length_weights = [self.__length_weights[self.__lengths.index(length)] for length in short_lengths]
+        for city_1, city_2 in rng.sample(infeasible_pairs, num_missing_destinations):
+            self.__add_connection(rng, pair_colors, city_1, city_2, short_lengths, short_length_weights)
+
+    def __add_connection(self, rng: random.Random, pair_colors: Dict[Tuple[int, int], Dict[Color, int]],
+                         city_1: int, city_2: int, lengths: List[int], length_weights: List[int]) -> bool:
+        """
+        Connects the two cities with a random color they are not connected with yet
+        SIDE-EFFECTS:
+            - Adds the connection to pair_colors
+        :param rng: the random number generator
+        :param pair_colors: a mapping from each connected pair of city indices to the length of its connection of
+                            each color
+        :param city_1: the index of one city
+        :param city_2: the index of the other city
+        :param lengths: the lengths to pick from
+        :param length_weights: the relative frequency of each length
+        :return: whether a connection was added, which is not the case if every color is already used
+        """
+        colors = pair_colors.setdefault((min(city_1, city_2), max(city_1, city_2)), {})
+        free_colors = [color for color in self.__colors if color not in colors]
+        if not free_colors:
+            return False
+
+        free_color_weights = [self.__color_weights[self.__colors.index(color)] for color in free_colors]
+        color = rng.choices(free_colors, free_color_weights)[0]
+        colors[color] = rng.choices(lengths, length_weights)[0]
+        return True
+
+    def __build_map(self, cities: List[City], pair_colors: Dict[Tuple[int, int], Dict[Color, int]]) -> Map:
+        """
+        :param cities: the cities of the map
+        :param pair_colors: a mapping from each connected pair of city indices to the length of its connection of
+                            each color
+        :return: the map with the given cities and connections
+        """
+        connections = []
+        for (city_1, city_2), colors in pair_colors.items():
+            for color, length in colors.items():
+                connections.append(DirectedConnection(cities[city_1], cities[city_2], length, color))
+                connections.append(DirectedConnection(cities[city_2], cities[city_1], length, color))
+        return Map(self.__width, self.__height, cities, connections)
@@ -1,4 +1,5 @@
-from typing import Set
+from typing import FrozenSet, Set, Union
+from Trains.Other.connection_index import ConnectionIndex
 from Trains.Other.undirected_connection import UndirectedConnection
 from Trains.Other.cards import Cards
 from Trains.Other.destination import Destination
@@ -6,32 +7,109 @@ from Trains.Other.destination import Destination
 
 class PublicPlayerState:
     """
-    Represents the portion of a player's state that is known to all players
+    Represents the portion of a player's state that is known to all players. The acquired connections are stored as a
+    bitset over a ConnectionIndex (normally the index of the game's map, see Map.get_connection_index), so states that
+    share an index can be combined and compared with integer operations. Acquired connections the index does not know,
+    e.g. connections that are not on the map, are kept in a separate set, as the map's index is never extended.
 
     Args:
         acquired_connections (Set[UndirectedConnection]): the connections a player has acquired
+        connection_index (Union[None, ConnectionIndex]): the ids of the connections. If None, a new index is used
 
     Attributes:
-        acquired_connections (Set[UndirectedConnection]): the connections a player has acquired
+        __connection_index (ConnectionIndex): the ids of the connections
+        __acquired_bitset (int): the connections a player has acquired, as a bitset over __connection_index
+        __unindexed_connections (FrozenSet[UndirectedConnection]): the acquired connections that are not in
+                                                                   __connection_index
+        __acquired_connections (Union[None, FrozenSet[UndirectedConnection]]): the acquired connections decoded from
+                                                                               the bitset, None until first needed
+        __acquired_hash (int): the exclusive or of the hashes of the acquired connections, which does not depend on the
+                               connection index
     """
-    acquired_connections: Set[UndirectedConnection]
-
-    def __init__(self, acquired_connections: Set[UndirectedConnection]):
-        self.acquired_connections = acquired_connections.copy()
+    __connection_index: ConnectionIndex
+    __acquired_bitset: int
+    __unindexed_connections: FrozenSet[UndirectedConnection]
+    __acquired_connections: Union[None, FrozenSet[UndirectedConnection]]
+    __acquired_hash: int
+
+    def __init__(self, acquired_connections: Set[UndirectedConnection],
+                 connection_index: Union[None, ConnectionIndex] = None):
+        if connection_index is None:
+            connection_index = ConnectionIndex()
+        self.__connection_index = connection_index
+        self.__acquired_bitset, self.__unindexed_connections = connection_index.partition(acquired_connections)
+        self.__acquired_connections = None
+        self.__acquired_hash = 0
+        for connection in set(acquired_connections):
+            self.__acquired_hash ^= hash(connection)
+
+    @property
+    def acquired_connections(self) -> FrozenSet[UndirectedConnection]:
+        """
+        The connections are decoded from the bitset on first access only, as the state never changes
+        :return: the connections a player has acquired
+        """
+        if self.__acquired_connections is None:
+            self.__acquired_connections = frozenset(
+                self.__connection_index.to_connections(self.__acquired_bitset)) | self.__unindexed_connections
+        return self.__acquired_connections
+
+    # Override - the hash of the acquired connections depends on the process' string hashing, so it is computed again
+    # after unpickling
+    def __getstate__(self):
+        return self.__connection_index, self.__acquired_bitset, self.__unindexed_connections
+
+    # Override
+    def __setstate__(self, state):
+        self.__connection_index, self.__acquired_bitset, self.__unindexed_connections = state
+        self.__acquired_connections = None
+        self.__acquired_hash = 0
+        for connection in self.acquired_connections:
+            self.__acquired_hash ^= hash(connection)
 
     def __eq__(self, other):
-        return isinstance(other, PublicPlayerState) and self.acquired_connections == other.acquired_connections
+        if not isinstance(other, PublicPlayerState):
+            return False
+        if self.__connection_index is other.__connection_index:
+            return self.__acquired_bitset == other.__acquired_bitset and \
+                self.__unindexed_connections == other.__unindexed_connections
+        return self.__acquired_hash == other.__acquired_hash and \
+            self.acquired_connections == other.acquired_connections
 
     def __hash__(self):
-        return hash(tuple(sorted(self.acquired_connections)))
+        return self.__acquired_hash
+
+    def get_acquired_bitset(self, connection_index: ConnectionIndex) -> int:
+        """
+        :param connection_index: the index to encode the acquired connections with
+        :return: the connections a player has acquired, as a bitset over the given index. Connections that the index
+                 does not know and cannot give ids to are left out
+        """
+        if connection_index is self.__connection_index and not self.__unindexed_connections:
+            return self.__acquired_bitset
+        return connection_index.partition(self.acquired_connections)[0]
+
+    def has_connection(self, connection: UndirectedConnection) -> bool:
+        """
+        :param connection: the connection to look for
+        :return: whether the player has acquired the connection
+        """
+        return self.__connection_index.contains(self.__acquired_bitset, connection) or \
+            connection in self.__unindexed_connections
 
     def add_connection(self, connection: UndirectedConnection) -> 'PublicPlayerState':
         """
         :param connection: connection to acquire
         :return: a new public player state with the given connection added to self.acquired_connections
         """
-        new_acquired_connections = self.acquired_connections.union({connection})
-        return PublicPlayerState(new_acquired_connections)
+        new_public_state = PublicPlayerState(set(), self.__connection_index)
+        new_public_state.__acquired_hash = self.__acquired_hash
+        if not self.has_connection(connection):
+            new_public_state.__acquired_hash ^= hash(connection)
+        connection_bitset, unindexed_connections = self.__connection_index.partition((connection,))
+        new_public_state.__acquired_bitset = self.__acquired_bitset | connection_bitset
+        new_public_state.__unindexed_connections = self.__unindexed_connections | unindexed_connections
+        return new_public_state
 
 
 class PrivatePlayerState:
@@ -82,7 +160,7 @@ class PrivatePlayerState:
                self.public_state == other.public_state
 
     def __hash__(self):
-        return hash((self.cards, tuple(self.destinations), self.num_rails, self.public_state))
+        return hash((self.cards, frozenset(self.destinations), self.num_rails, self.public_state))
 
     def draw_cards(self, drawn_cards: Cards) -> 'PrivatePlayerState':
         """
@@ -7,16 +7,20 @@ from Trains.Other.interfaces.i_ref_deck_creation_strategy import IDeckCreationSt
 
 class RandomDeckCreationStrategy(IDeckCreationStrategy):
     """
-    A strategy for generating a deck randomly using the possible Color values.
+    A strategy for generating a deck randomly using the possible Color values. Each strategy draws from its own random
+    number generator, so seeded strategies create the same decks no matter what else uses the random module.
+
+    Attributes:
+        __random (random.Random): the random number generator the decks are drawn from
     """
+    __random: random.Random
 
     def __init__(self, seed: Union[int, None] = None):
         """
         Create this strategy with a random number seed if desired
         :param seed: an optional number, representing a seed
         """
-        if seed:
-            random.seed(seed)
+        self.__random = random.Random(seed)
 
     def create_deck(self, num_cards: int) -> List[Color]:
         """
@@ -25,4 +29,4 @@ class RandomDeckCreationStrategy(IDeckCreationStrategy):
         :return: a random list of color of size num_cards
         """
         colors = [c for c in Color]
-        return [random.choice(colors) for _ in range(num_cards)]
+        return [self.__random.choice(colors) for _ in range(num_cards)]
@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import Collection, Iterator, List, Sequence
 
 from Trains.Other.destination import Destination
 from Trains.Other.interfaces.i_ref_destination_options_strategy import IDestinationOptionsStrategy
@@ -11,9 +11,16 @@ class LexiSortedDestinationOptionsStrategy(IDestinationOptionsStrategy):
     def __init__(self):
         pass
 
-    def order_destinations(self, feasible_destinations: Set[Destination]) -> List[Destination]:
+    def order_destinations(self, feasible_destinations: Collection[Destination]) -> List[Destination]:
         """
-        :param feasible_destinations: a set of destinations to order
+        :param feasible_destinations: the distinct destinations to order
         :return: a list of destinations in lexicographical order
         """
         return list(sorted(feasible_destinations))
+
+    def iter_destinations(self, sorted_destinations: Sequence[Destination]) -> Iterator[Destination]:
+        """
+        :param sorted_destinations: the distinct destinations to order, in lexicographic order
+        :return: an iterator over the destinations in lexicographical order, which they are already in
+        """
+        return iter(sorted_destinations)
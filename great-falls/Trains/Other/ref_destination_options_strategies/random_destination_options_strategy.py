@@ -1,5 +1,5 @@
 import random
-from typing import List, Set, Union
+from typing import Collection, Iterator, List, Sequence, Union
 
 from Trains.Other.destination import Destination
 from Trains.Other.interfaces.i_ref_destination_options_strategy import IDestinationOptionsStrategy
@@ -7,18 +7,39 @@ from Trains.Other.interfaces.i_ref_destination_options_strategy import IDestinat
 
 class RandomDestinationOptionsStrategy(IDestinationOptionsStrategy):
     """
-    A player_strategies for ordering destination options randomly
+    A player_strategies for ordering destination options randomly. Each strategy draws from its own random number
+    generator, so seeded strategies produce the same orderings no matter what else uses the random module.
+
+    Attributes:
+        __random (random.Random): the random number generator the orderings are drawn from
     """
+    __random: random.Random
+
     def __init__(self, seed: Union[int, None] = None):
-        if seed:
-            random.seed(seed)
+        self.__random = random.Random(seed)
 
-    def order_destinations(self, feasible_destinations: Set[Destination]) -> List[Destination]:
+    def order_destinations(self, feasible_destinations: Collection[Destination]) -> List[Destination]:
         """
         Order the given destinations in a random order
-        :param feasible_destinations: a set of destinations to order
+        :param feasible_destinations: the distinct destinations to order
         :return: a list of destinations in a random order
         """
         random_destinations = list(feasible_destinations)
-        random.shuffle(random_destinations)
+        self.__random.shuffle(random_destinations)
         return random_destinations
+
+    def iter_destinations(self, sorted_destinations: Sequence[Destination]) -> Iterator[Destination]:
+        """
+        Order the given destinations in a random order with a partial Fisher-Yates shuffle. The shuffle only records
+        the positions it has swapped, so drawing k destinations takes O(k) time and space and never copies the
+        given destinations
+        :param sorted_destinations: the distinct destinations to order, in lexicographic order
+        :return: an iterator over the destinations in a random order
+        """
+        num_destinations = len(sorted_destinations)
+        swapped_positions = {}
+        for position in range(num_destinations):
+            random_position = self.__random.randrange(position, num_destinations)
+            chosen_position = swapped_positions.get(random_position, random_position)
+            swapped_positions[random_position] = swapped_positions.pop(position, position)
+            yield sorted_destinations[chosen_position]
@@ -0,0 +1,39 @@
+class ScoreBreakdown:
+    """
+    Represents the parts of a player's score at the end of a Trains game
+
+    Args:
+        segment_score (int): the score for the segments the player acquired
+        destination_score (int): the score for the player's connected and unconnected destinations
+        longest_route (int): the length of the player's longest continuous route
+        longest_route_score (int): the score for holding the longest continuous route
+
+    Attributes:
+        segment_score (int): the score for the segments the player acquired
+        destination_score (int): the score for the player's connected and unconnected destinations
+        longest_route (int): the length of the player's longest continuous route
+        longest_route_score (int): the score for holding the longest continuous route
+    """
+    segment_score: int
+    destination_score: int
+    longest_route: int
+    longest_route_score: int
+
+    def __init__(self, segment_score: int, destination_score: int, longest_route: int, longest_route_score: int):
+        self.segment_score = segment_score
+        self.destination_score = destination_score
+        self.longest_route = longest_route
+        self.longest_route_score = longest_route_score
+
+    def __eq__(self, other):
+        return isinstance(other, ScoreBreakdown) and \
+               self.segment_score == other.segment_score and \
+               self.destination_score == other.destination_score and \
+               self.longest_route == other.longest_route and \
+               self.longest_route_score == other.longest_route_score
+
+    def get_total(self) -> int:
+        """
+        :return: the player's score
+        """
+        return self.segment_score + self.destination_score + self.longest_route_score
@@ -0,0 +1,93 @@
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+
+from Trains.Other.interfaces.i_strategy import MORE_CARDS_REQUEST
+from Trains.Player.strategy_registry import StrategyRegistry
+
+STRATEGY_SOURCE = '''
+from Trains.Other.interfaces.i_strategy import IStrategy, MORE_CARDS_REQUEST
+
+
+class FileStrategy(IStrategy):
+    @classmethod
+    def select_destinations(cls, _, possible_destinations):
+        return set()
+
+    @classmethod
+    def get_turn(cls, player_state):
+        return {turn!r}
+'''
+
+
+class StrategyRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.registry = StrategyRegistry()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_strategy(self, file_name: str, turn: str = MORE_CARDS_REQUEST) -> str:
+        path = os.path.join(self.directory.name, file_name)
+        with open(path, "w") as strategy_file:
+            strategy_file.write(STRATEGY_SOURCE.format(turn=turn))
+        return path
+
+    def test_load(self):
+        path = self.write_strategy("strategy.py")
+        strategy = self.registry.load(path)
+        self.assertEqual("FileStrategy", strategy.__name__)
+        self.assertEqual(MORE_CARDS_REQUEST, strategy.get_turn(None))
+        self.assertIs(sys.modules[StrategyRegistry.module_name(os.path.realpath(path))].FileStrategy, strategy)
+
+    def test_load_cached(self):
+        path = self.write_strategy("strategy.py")
+        strategy = self.registry.load(path)
+        self.assertIs(strategy, self.registry.load(path))
+        self.assertIs(strategy, self.registry.load(os.path.join(self.directory.name, ".", "strategy.py")))
+        self.assertEqual({"hits": 2, "misses": 1, "size": 1}, self.registry.get_stats())
+
+    def test_load_changed_file(self):
+        path = self.write_strategy("strategy.py")
+        strategy = self.registry.load(path)
+        self.write_strategy("strategy.py", "changed")
+        file_stat = os.stat(path)
+        os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+        changed_strategy = self.registry.load(path)
+        self.assertIsNot(strategy, changed_strategy)
+        self.assertEqual("changed", changed_strategy.get_turn(None))
+        self.assertEqual(MORE_CARDS_REQUEST, strategy.get_turn(None))
+
+    def test_load_same_class_name_in_different_files(self):
+        strategy_1 = self.registry.load(self.write_strategy("strategy_1.py", "one"))
+        strategy_2 = self.registry.load(self.write_strategy("strategy_2.py", "two"))
+        self.assertNotEqual(strategy_1.__module__, strategy_2.__module__)
+        self.assertEqual("one", strategy_1.get_turn(None))
+        self.assertEqual("two", strategy_2.get_turn(None))
+
+    def test_load_invalid(self):
+        path = os.path.join(self.directory.name, "invalid.py")
+        with open(path, "w") as strategy_file:
+            strategy_file.write("class NotAStrategy:\n    pass\n")
+        with self.assertRaises(ValueError):
+            self.registry.load(path)
+        self.assertNotIn(StrategyRegistry.module_name(os.path.realpath(path)), sys.modules)
+        self.assertEqual(0, self.registry.get_stats()["size"])
+
+    def test_pickle_strategy(self):
+        strategy = self.registry.load(self.write_strategy("strategy.py"))
+        self.assertIs(strategy, pickle.loads(pickle.dumps(strategy)))
+
+    def test_preload_and_clear(self):
+        paths = [self.write_strategy("strategy_1.py"), self.write_strategy("strategy_2.py")]
+        self.registry.preload(paths + paths)
+        self.assertEqual({"hits": 2, "misses": 2, "size": 2}, self.registry.get_stats())
+        self.registry.clear()
+        self.assertEqual({"hits": 0, "misses": 0, "size": 0}, self.registry.get_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
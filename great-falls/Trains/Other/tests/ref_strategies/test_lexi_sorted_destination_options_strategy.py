@@ -31,3 +31,10 @@ class RandomDestinationOptionsStrategyTests(unittest.TestCase):
         self.assertEqual(self.DEST_3, destinations[2])
         self.assertEqual(self.DEST_4, destinations[3])
         self.assertEqual(self.DEST_5, destinations[4])
+
+    def test_iter_destinations(self):
+        destinations = list(LexiSortedDestinationOptionsStrategy().iter_destinations(
+            [self.DEST_1, self.DEST_2, self.DEST_3, self.DEST_4, self.DEST_5]))
+
+        self.assertListEqual([self.DEST_1, self.DEST_2, self.DEST_3, self.DEST_4, self.DEST_5], destinations)
+
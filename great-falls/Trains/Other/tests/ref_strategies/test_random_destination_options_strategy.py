@@ -31,3 +31,16 @@ class RandomDestinationOptionsStrategyTests(unittest.TestCase):
         self.assertTrue(self.DEST_3 in destinations)
         self.assertTrue(self.DEST_4 in destinations)
         self.assertTrue(self.DEST_5 in destinations)
+
+    def test_iter_destinations(self):
+        destinations = list(RandomDestinationOptionsStrategy(1).iter_destinations(
+            [self.DEST_1, self.DEST_2, self.DEST_3, self.DEST_4, self.DEST_5]))
+
+        self.assertCountEqual([self.DEST_1, self.DEST_2, self.DEST_3, self.DEST_4, self.DEST_5], destinations)
+
+    def test_iter_destinations_is_lazy(self):
+        destinations = RandomDestinationOptionsStrategy(1).iter_destinations(range(10 ** 12))
+        first_destinations = [next(destinations) for _ in range(5)]
+
+        self.assertEqual(5, len(set(first_destinations)))
+
@@ -0,0 +1,58 @@
+import unittest
+from Trains.Common.acquirable_connections import AcquirableConnections
+from Trains.Other.cards import Cards
+from Trains.Other.city import City
+from Trains.Other.color import Color
+from Trains.Other.connection_index import ConnectionIndex
+from Trains.Other.undirected_connection import UndirectedConnection
+
+
+class AcquirableConnectionsTests(unittest.TestCase):
+    CITY_1 = City("city1", (0, 0))
+    CITY_2 = City("city2", (50, 50))
+    CITY_3 = City("city3", (75, 50))
+
+    CONNECTION_RED_3 = UndirectedConnection(CITY_1, CITY_2, 3, Color.RED)
+    CONNECTION_RED_5 = UndirectedConnection(CITY_2, CITY_3, 5, Color.RED)
+    CONNECTION_BLUE_3 = UndirectedConnection(CITY_1, CITY_3, 3, Color.BLUE)
+    CONNECTION_BLUE_3_OTHER = UndirectedConnection(CITY_2, CITY_3, 3, Color.BLUE)
+    ALL_CONNECTIONS = [CONNECTION_RED_3, CONNECTION_RED_5, CONNECTION_BLUE_3, CONNECTION_BLUE_3_OTHER]
+
+    CARDS = Cards({Color.RED: 4, Color.BLUE: 3})
+
+    def make_acquirable_connections(self) -> AcquirableConnections:
+        return AcquirableConnections(ConnectionIndex(self.ALL_CONNECTIONS), self.ALL_CONNECTIONS)
+
+    def test_get_unowned_connections(self):
+        self.assertEqual(set(self.ALL_CONNECTIONS), self.make_acquirable_connections().get_unowned_connections())
+
+    def test_get_acquirable_connections(self):
+        acquirable_connections = self.make_acquirable_connections()
+        self.assertEqual({self.CONNECTION_RED_3, self.CONNECTION_BLUE_3, self.CONNECTION_BLUE_3_OTHER},
+                         acquirable_connections.get_acquirable_connections(self.CARDS, 45))
+        self.assertEqual(set(), acquirable_connections.get_acquirable_connections(self.CARDS, 2))
+        self.assertEqual(set(), acquirable_connections.get_acquirable_connections(Cards({}), 45))
+
+    def test_claim(self):
+        acquirable_connections = self.make_acquirable_connections()
+        claimed_acquirable_connections = acquirable_connections.claim(self.CONNECTION_BLUE_3)
+        self.assertFalse(claimed_acquirable_connections.is_unowned(self.CONNECTION_BLUE_3))
+        self.assertTrue(claimed_acquirable_connections.is_unowned(self.CONNECTION_BLUE_3_OTHER))
+        self.assertEqual({self.CONNECTION_RED_3, self.CONNECTION_BLUE_3_OTHER},
+                         claimed_acquirable_connections.get_acquirable_connections(self.CARDS, 45))
+        self.assertTrue(acquirable_connections.is_unowned(self.CONNECTION_BLUE_3))
+
+    def test_release(self):
+        acquirable_connections = self.make_acquirable_connections().claim(self.CONNECTION_RED_3).claim(
+            self.CONNECTION_RED_5)
+        released_acquirable_connections = acquirable_connections.release([self.CONNECTION_RED_3, self.CONNECTION_RED_5])
+        self.assertEqual(set(self.ALL_CONNECTIONS), released_acquirable_connections.get_unowned_connections())
+        self.assertFalse(acquirable_connections.is_unowned(self.CONNECTION_RED_3))
+
+    def test_is_unowned_unknown_connection(self):
+        acquirable_connections = AcquirableConnections(ConnectionIndex(), [self.CONNECTION_RED_3])
+        self.assertFalse(acquirable_connections.is_unowned(self.CONNECTION_RED_5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from Trains.Other.cards import Cards
 from Trains.Other.color import Color
@@ -80,3 +81,30 @@ class CardTests(unittest.TestCase):
         self.assertEqual(4, new_cards.get_card_count(Color.BLUE))
         self.assertEqual(0, new_cards.get_card_count(Color.WHITE))
         self.assertEqual(10, new_cards.get_card_count(Color.GREEN))
+
+    def test_subtract_cards_insufficient(self):
+        with self.assertRaises(ValueError):
+            Cards(self.CARDS).subtract_cards(Color.RED, 4)
+
+    def test_cards_constructor_ignores_unknown_keys(self):
+        self.assertEqual(Cards({Color.RED: 2}), Cards({Color.RED: 2, "purple": 5}))
+
+    def test_total_count_after_add_and_subtract(self):
+        cards = Cards(self.CARDS).add_cards(Cards.from_list([Color.RED, Color.WHITE])).subtract_cards(Color.GREEN, 3)
+        self.assertEqual(16, cards.get_total_count())
+
+    def test_derived_cards_eq_constructed_cards(self):
+        cards = Cards({}).add_cards(Cards.from_list([Color.GREEN] * 12 + [Color.RED] * 3 + [Color.BLUE] * 4)) \
+            .subtract_cards(Color.GREEN, 2)
+        self.assertEqual(Cards(self.CARDS), cards)
+        self.assertEqual(hash(Cards(self.CARDS)), hash(cards))
+
+    def test_pickle(self):
+        cards = Cards(self.CARDS)
+        unpickled_cards = pickle.loads(pickle.dumps(cards))
+        self.assertEqual(cards, unpickled_cards)
+        self.assertEqual(hash(cards), hash(unpickled_cards))
+        self.assertEqual(17, unpickled_cards.get_total_count())
+
+    def test_slots(self):
+        self.assertFalse(hasattr(Cards(self.CARDS), "__dict__"))
@@ -1,5 +1,7 @@
+import copy
+import pickle
 import unittest
-from Trains.Other.city import City
+from Trains.Other.city import City, CityTable
 import importlib.util
 import inspect
 import pyclbr
@@ -34,4 +36,75 @@ class CityTests(unittest.TestCase):
         city_3 = City(self.CITY_NAME_1, (5, 5))
 
         self.assertTrue(city_1 == city_2)
-        self.assertFalse(city_1 == city_3)
\ No newline at end of file
+        self.assertFalse(city_1 == city_3)
+
+    def test_city_table_interns_duplicates(self):
+        city_1 = City(self.CITY_NAME_1, self.POSITION_1)
+        duplicate_city_1 = City(self.CITY_NAME_1, self.POSITION_1)
+        city_table = CityTable([City(self.CITY_NAME_2, self.POSITION_1), city_1, duplicate_city_1])
+
+        self.assertEqual(2, len(city_table))
+        self.assertIs(city_table.intern(city_1), city_table.intern(duplicate_city_1))
+        self.assertIs(city_table.get_city(self.CITY_NAME_1), city_table.intern(city_1))
+        self.assertEqual(city_1, city_table.intern(city_1))
+        self.assertEqual(hash(city_1), hash(city_table.intern(city_1)))
+
+    def test_city_table_lexicographic_ordinals(self):
+        city_table = CityTable([City("b", (0, 0)), City("c", (0, 0)), City("a", (1, 1)), City("a", (0, 5))])
+
+        self.assertEqual([City("a", (0, 5)), City("a", (1, 1)), City("b", (0, 0)), City("c", (0, 0))],
+                         city_table.get_cities())
+        self.assertEqual([0, 1, 2, 3], [city.ordinal for city in city_table.get_cities()])
+
+    def test_city_table_cities_with_same_name(self):
+        city_table = CityTable([City("b", (0, 0)), City("a", (1, 1)), City("a", (0, 5))])
+
+        self.assertEqual([City("a", (0, 5)), City("a", (1, 1))], city_table.get_cities_named("a"))
+        self.assertEqual([City("b", (0, 0))], city_table.get_cities_named("b"))
+        self.assertEqual([], city_table.get_cities_named("c"))
+        self.assertEqual(City("b", (0, 0)), city_table.get_city("b"))
+        with self.assertRaises(ValueError):
+            city_table.get_city("a")
+
+    def test_city_table_unknown_city(self):
+        city_table = CityTable([City(self.CITY_NAME_1, self.POSITION_1)])
+        with self.assertRaises(KeyError):
+            city_table.intern(City(self.CITY_NAME_2, self.POSITION_1))
+        with self.assertRaises(KeyError):
+            city_table.get_city(self.CITY_NAME_2)
+
+    def test_copied_interned_city_eq(self):
+        city_table = CityTable([City(self.CITY_NAME_1, self.POSITION_1), City(self.CITY_NAME_2, self.POSITION_1)])
+        city_1, city_2 = city_table.get_cities()
+
+        self.assertEqual(city_1, copy.copy(city_1))
+        self.assertEqual(city_1, copy.deepcopy(city_1))
+        self.assertNotEqual(city_1, copy.copy(city_2))
+        self.assertEqual(hash(city_1), hash(copy.copy(city_1)))
+
+    def test_interned_city_lt(self):
+        city_table = CityTable([City("b", (0, 0)), City("a", (0, 0))])
+        city_a, city_b = city_table.get_city("a"), city_table.get_city("b")
+
+        self.assertTrue(city_a < city_b)
+        self.assertFalse(city_b < city_a)
+        self.assertTrue(city_a < City("b", (0, 0)))
+        self.assertTrue(City("a", (0, 0)) < city_b)
+
+    def test_cities_of_different_tables(self):
+        city = City(self.CITY_NAME_1, self.POSITION_1)
+        city_table_1 = CityTable([city])
+        city_table_2 = CityTable([city])
+
+        self.assertIsNot(city_table_1.intern(city), city_table_2.intern(city))
+        self.assertEqual(city_table_1.intern(city), city_table_2.intern(city))
+        self.assertIsNone(city.ordinal)
+
+    def test_pickle_interned_cities(self):
+        city_table = CityTable([City(self.CITY_NAME_1, self.POSITION_1), City(self.CITY_NAME_2, self.POSITION_1)])
+        city_1, city_2 = pickle.loads(pickle.dumps(city_table.get_cities()))
+
+        self.assertIs(city_1.table_id, city_2.table_id)
+        self.assertTrue(city_1 < city_2)
+        self.assertEqual(city_table.get_city(self.CITY_NAME_1), city_1)
+        self.assertEqual(hash(city_table.get_city(self.CITY_NAME_1)), hash(city_1))
@@ -1,5 +1,6 @@
+import pickle
 import unittest
-from Trains.Other.city import City
+from Trains.Other.city import City, CityTable
 from Trains.Other.city_pair import CityPair
 
 class CityPairTests(unittest.TestCase):
@@ -44,4 +45,33 @@ class CityPairTests(unittest.TestCase):
         city_pair_1 = CityPair(self.CITY_1, self.CITY_2)
         city_pair_2 = CityPair(self.CITY_1, self.CITY_3)
 
-        self.assertTrue(city_pair_1 < city_pair_2)
\ No newline at end of file
+        self.assertTrue(city_pair_1 < city_pair_2)
+
+    def test_interned_city_pair(self):
+        city_table = CityTable([self.CITY_3, self.CITY_2, self.CITY_1])
+        city_pair = CityPair(city_table.intern(self.CITY_3), city_table.intern(self.CITY_1))
+
+        self.assertEqual((0, 2), city_pair.ordinals)
+        self.assertEqual(CityPair(self.CITY_1, self.CITY_3), city_pair)
+        self.assertEqual(hash(CityPair(self.CITY_1, self.CITY_3)), hash(city_pair))
+        self.assertIsNone(CityPair(self.CITY_1, self.CITY_3).ordinals)
+
+    def test_interned_city_pair_lt(self):
+        city_table = CityTable([self.CITY_1, self.CITY_2, self.CITY_3])
+        city_pairs = [CityPair(city_table.intern(city_1), city_table.intern(city_2))
+                      for city_1, city_2 in [(self.CITY_2, self.CITY_3), (self.CITY_1, self.CITY_3),
+                                             (self.CITY_1, self.CITY_2)]]
+        plain_city_pairs = [CityPair(self.CITY_1, self.CITY_3), CityPair(self.CITY_2, self.CITY_3)]
+
+        self.assertEqual([(0, 1), (0, 2), (1, 2)], [city_pair.ordinals for city_pair in sorted(city_pairs)])
+        self.assertTrue(city_pairs[2] < plain_city_pairs[0])
+        self.assertTrue(plain_city_pairs[0] < city_pairs[0])
+
+    def test_city_pair_pickle(self):
+        city_table = CityTable([self.CITY_1, self.CITY_2])
+        city_pair = CityPair(city_table.intern(self.CITY_1), city_table.intern(self.CITY_2))
+        unpickled_city_pair = pickle.loads(pickle.dumps(city_pair))
+
+        self.assertEqual(city_pair, unpickled_city_pair)
+        self.assertEqual(hash(city_pair), hash(unpickled_city_pair))
+        self.assertEqual((0, 1), unpickled_city_pair.ordinals)
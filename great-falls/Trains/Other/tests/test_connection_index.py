@@ -0,0 +1,75 @@
+import unittest
+from Trains.Other.city import City
+from Trains.Other.color import Color
+from Trains.Other.connection_index import ConnectionIndex
+from Trains.Other.undirected_connection import UndirectedConnection
+
+
+class ConnectionIndexTests(unittest.TestCase):
+    CITY_1 = City("city1", (0, 0))
+    CITY_2 = City("city2", (50, 50))
+    CITY_3 = City("city3", (75, 50))
+
+    CONNECTION_1 = UndirectedConnection(CITY_1, CITY_2, 3, Color.RED)
+    CONNECTION_2 = UndirectedConnection(CITY_2, CITY_3, 4, Color.BLUE)
+    CONNECTION_3 = UndirectedConnection(CITY_1, CITY_3, 5, Color.GREEN)
+
+    def test_constructor_assigns_ids_in_order(self):
+        connection_index = ConnectionIndex([self.CONNECTION_2, self.CONNECTION_1])
+        self.assertEqual(2, len(connection_index))
+        self.assertEqual(0, connection_index.get_id(self.CONNECTION_2))
+        self.assertEqual(1, connection_index.get_id(self.CONNECTION_1))
+
+    def test_get_id_unknown_connection(self):
+        connection_index = ConnectionIndex([self.CONNECTION_1])
+        self.assertEqual(1, connection_index.get_id(self.CONNECTION_3))
+        self.assertEqual(1, connection_index.get_id(self.CONNECTION_3))
+        self.assertEqual(2, len(connection_index))
+
+    def test_lookup_only_index(self):
+        connection_index = ConnectionIndex([self.CONNECTION_1, self.CONNECTION_2], extendable=False)
+        self.assertEqual(1, connection_index.get_id(self.CONNECTION_2))
+        with self.assertRaises(KeyError):
+            connection_index.get_id(self.CONNECTION_3)
+        with self.assertRaises(KeyError):
+            connection_index.to_bitset({self.CONNECTION_3})
+        self.assertEqual(2, len(connection_index))
+
+    def test_find_id(self):
+        connection_index = ConnectionIndex([self.CONNECTION_1])
+        self.assertEqual(0, connection_index.find_id(self.CONNECTION_1))
+        self.assertIsNone(connection_index.find_id(self.CONNECTION_2))
+        self.assertEqual(1, len(connection_index))
+
+    def test_partition(self):
+        connection_index = ConnectionIndex([self.CONNECTION_1, self.CONNECTION_2], extendable=False)
+        self.assertEqual((0b10, frozenset({self.CONNECTION_3})),
+                         connection_index.partition([self.CONNECTION_2, self.CONNECTION_3]))
+        self.assertEqual(2, len(connection_index))
+        self.assertEqual((0b110, frozenset()),
+                         ConnectionIndex([self.CONNECTION_1]).partition([self.CONNECTION_2, self.CONNECTION_3]))
+
+    def test_to_bitset(self):
+        connection_index = ConnectionIndex([self.CONNECTION_1, self.CONNECTION_2, self.CONNECTION_3])
+        self.assertEqual(0, connection_index.to_bitset(set()))
+        self.assertEqual(0b101, connection_index.to_bitset({self.CONNECTION_1, self.CONNECTION_3}))
+
+    def test_to_connections(self):
+        connection_index = ConnectionIndex([self.CONNECTION_1, self.CONNECTION_2, self.CONNECTION_3])
+        self.assertEqual(set(), connection_index.to_connections(0))
+        self.assertEqual({self.CONNECTION_2, self.CONNECTION_3}, connection_index.to_connections(0b110))
+
+    def test_round_trip(self):
+        connection_index = ConnectionIndex()
+        connections = {self.CONNECTION_1, self.CONNECTION_2}
+        self.assertEqual(connections, connection_index.to_connections(connection_index.to_bitset(connections)))
+
+    def test_contains(self):
+        connection_index = ConnectionIndex([self.CONNECTION_1, self.CONNECTION_2])
+        self.assertTrue(connection_index.contains(0b10, self.CONNECTION_2))
+        self.assertFalse(connection_index.contains(0b10, self.CONNECTION_1))
+        self.assertFalse(connection_index.contains(0b11, self.CONNECTION_3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from Trains.Other.color import Color
+from Trains.Other.deck import Deck
+
+
+class DeckTests(unittest.TestCase):
+    CARDS = [Color.RED, Color.BLUE, Color.GREEN, Color.WHITE, Color.RED]
+
+    def test_len(self):
+        self.assertEqual(5, len(Deck(self.CARDS)))
+        self.assertEqual(0, len(Deck()))
+
+    def test_to_list(self):
+        self.assertListEqual(self.CARDS, Deck(self.CARDS).to_list())
+
+    def test_peek(self):
+        deck = Deck(self.CARDS)
+        self.assertListEqual([Color.RED, Color.BLUE], deck.peek(2))
+        self.assertListEqual(self.CARDS, deck.to_list())
+
+    def test_peek_more_than_deck(self):
+        self.assertListEqual([Color.RED], Deck([Color.RED]).peek(2))
+        self.assertListEqual([], Deck().peek(2))
+
+    def test_draw(self):
+        deck = Deck(self.CARDS)
+        new_deck = deck.draw(2)
+        self.assertListEqual([Color.GREEN, Color.WHITE, Color.RED], new_deck.to_list())
+        self.assertListEqual([Color.GREEN, Color.WHITE], new_deck.peek(2))
+        self.assertListEqual(self.CARDS, deck.to_list())
+
+    def test_draw_more_than_deck(self):
+        deck = Deck([Color.RED]).draw(2)
+        self.assertEqual(0, len(deck))
+        self.assertEqual(Deck(), deck)
+
+    def test_eq_drawn_and_fresh(self):
+        drawn_deck = Deck(self.CARDS).draw(3)
+        fresh_deck = Deck(self.CARDS[3:])
+        self.assertEqual(fresh_deck, drawn_deck)
+        self.assertEqual(hash(fresh_deck), hash(drawn_deck))
+
+    def test_eq_same_backing_cards(self):
+        deck = Deck(self.CARDS)
+        self.assertEqual(deck.draw(1).draw(1), deck.draw(2))
+        self.assertNotEqual(deck.draw(1), deck.draw(2))
+
+    def test_not_eq(self):
+        self.assertNotEqual(Deck([Color.RED, Color.BLUE]), Deck([Color.BLUE, Color.RED]))
+        self.assertNotEqual(Deck([Color.RED]), [Color.RED])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import itertools
+import unittest
+from Trains.Other.city import City
+from Trains.Other.destination import Destination
+from Trains.Other.destination_pool import DestinationPool
+
+
+class DestinationPoolTests(unittest.TestCase):
+    CITY_1 = City("city1", (0, 0))
+    CITY_2 = City("city2", (1, 0))
+    CITY_3 = City("city3", (2, 0))
+    CITY_4 = City("city4", (3, 0))
+
+    DEST_1 = Destination(CITY_1, CITY_2)
+    DEST_2 = Destination(CITY_1, CITY_3)
+    DEST_3 = Destination(CITY_1, CITY_4)
+    DEST_4 = Destination(CITY_2, CITY_3)
+    DEST_5 = Destination(CITY_2, CITY_4)
+    DEST_6 = Destination(CITY_3, CITY_4)
+    DESTINATIONS = [DEST_1, DEST_2, DEST_3, DEST_4, DEST_5, DEST_6]
+
+    def test_offer(self):
+        pool = DestinationPool(self.DESTINATIONS)
+        self.assertListEqual([self.DEST_1, self.DEST_2, self.DEST_3], pool.offer(3))
+        self.assertListEqual([self.DEST_1, self.DEST_2, self.DEST_3], pool.offer(3))
+
+    def test_offer_more_than_pool(self):
+        pool = DestinationPool(self.DESTINATIONS[:2])
+        self.assertListEqual([self.DEST_1, self.DEST_2], pool.offer(5))
+        self.assertListEqual([], DestinationPool([]).offer(5))
+
+    def test_remove(self):
+        pool = DestinationPool(self.DESTINATIONS)
+        pool.offer(3)
+        pool.remove({self.DEST_1, self.DEST_3})
+        self.assertListEqual([self.DEST_2, self.DEST_4, self.DEST_5], pool.offer(3))
+
+    def test_remove_before_offered(self):
+        pool = DestinationPool(self.DESTINATIONS)
+        pool.remove({self.DEST_2, self.DEST_5})
+        self.assertListEqual([self.DEST_1, self.DEST_3, self.DEST_4, self.DEST_6], pool.offer(5))
+
+    def test_offer_draws_lazily(self):
+        ordering = iter(self.DESTINATIONS)
+        pool = DestinationPool(ordering)
+        pool.offer(2)
+        self.assertEqual(self.DEST_3, next(ordering))
+
+    def test_offer_from_infinite_ordering(self):
+        pool = DestinationPool(itertools.cycle(self.DESTINATIONS))
+        self.assertListEqual(self.DESTINATIONS[:5], pool.offer(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
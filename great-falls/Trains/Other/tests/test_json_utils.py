@@ -1,3 +1,4 @@
+import io
 import unittest
 from unittest.mock import MagicMock
 
@@ -38,6 +39,16 @@ class JsonUtilsTest(unittest.TestCase):
     def test_find_city(self):
         self.assertEqual(find_city([self.CITY_1, self.CITY_2], self.CITY_NAME_1), self.CITY_1)
 
+    def test_index_cities(self):
+        self.assertDictEqual({self.CITY_NAME_1: self.CITY_1, self.CITY_NAME_2: self.CITY_2,
+                              self.CITY_NAME_3: self.CITY_3}, index_cities(self.CITY_LIST))
+
+    def test_dict_to_map_unknown_city(self):
+        map_dict = {"width": 500, "height": 800, "cities": [["city1", [350, 350]]],
+                    "connections": {"city1": {"city2": {"red": 4}}}}
+        with self.assertRaises(KeyError):
+            dict_to_map(map_dict)
+
     def test_dict_to_map(self):
         map_dict = {
             "width": 500,
@@ -71,6 +82,11 @@ class JsonUtilsTest(unittest.TestCase):
         expected_connection = UndirectedConnection(self.CITY_1, self.CITY_2, 5, Color.RED)
         self.assertEqual(expected_connection, actual_connection)
 
+    def test_array_to_undirected_connection_with_index(self):
+        connection_arr = ["city3", "city2", "blue", 3]
+        actual_connection = array_to_undirected_connection(connection_arr, index_cities(self.CITY_LIST))
+        self.assertEqual(UndirectedConnection(self.CITY_2, self.CITY_3, 3, Color.BLUE), actual_connection)
+
     def test_array_to_public_state(self):
         connection_arr_1 = ["city1", "city2", "red", 5]
         connection_arr_2 = ["city1", "city2", "blue", 3]
@@ -101,6 +117,10 @@ class JsonUtilsTest(unittest.TestCase):
         actual_destination = array_to_destination(destination_array, self.CITY_LIST)
         self.assertEqual(Destination(self.CITY_1, self.CITY_2), actual_destination)
 
+    def test_array_to_destination_with_index(self):
+        actual_destination = array_to_destination(["city3", "city1"], index_cities(self.CITY_LIST))
+        self.assertEqual(Destination(self.CITY_1, self.CITY_3), actual_destination)
+
     def test_dict_to_private_player_state(self):
         private_player_state_dict = {
             "destination1": ["city1", "city2"],
@@ -184,3 +204,29 @@ class JsonUtilsTest(unittest.TestCase):
         mock_game_result.get_cheaters.return_value = [mock_player_4]
 
         self.assertListEqual([[["Name2", "Name3"], ["Name1"]], ["Name4"]], serialize_game_result(mock_game_result))
+
+    def test_write_map(self):
+        trains_map = Map(800, 800, self.CITY_LIST, [self.DIRECTED_CONNECTION_1A, self.DIRECTED_CONNECTION_1B])
+        output = io.StringIO()
+        write_map(trains_map, output)
+        self.assertEqual({"width": 800, "height": 800,
+                          "cities": [["city1", [350, 350]], ["city2", [400, 400]], ["city3", [400, 401]]],
+                          "connections": {"city1": {"city2": {"red": 4}}}}, json.loads(output.getvalue()))
+
+    def test_write_map_round_trip(self):
+        trains_map = Map(800, 800, self.CITY_LIST, [self.DIRECTED_CONNECTION_1A, self.DIRECTED_CONNECTION_1B,
+                                                    DirectedConnection(self.CITY_2, self.CITY_3, 3, Color.BLUE),
+                                                    DirectedConnection(self.CITY_3, self.CITY_2, 3, Color.BLUE),
+                                                    DirectedConnection(self.CITY_2, self.CITY_3, 5, Color.WHITE),
+                                                    DirectedConnection(self.CITY_3, self.CITY_2, 5, Color.WHITE)])
+        output = io.StringIO()
+        write_map(trains_map, output)
+        read_map = dict_to_map(json.loads(output.getvalue()))
+        self.assertEqual(trains_map.get_cities(), read_map.get_cities())
+        self.assertEqual(trains_map.get_undirected_connections(), read_map.get_undirected_connections())
+
+    def test_write_map_no_connections(self):
+        output = io.StringIO()
+        write_map(Map(800, 800, [], []), output)
+        self.assertEqual({"width": 800, "height": 800, "cities": [], "connections": {}}, json.loads(output.getvalue()))
+
@@ -0,0 +1,50 @@
+import unittest
+from Trains.Common.longest_route_solver import LongestRouteSolver
+
+
+class LongestRouteSolverTests(unittest.TestCase):
+    PATH = [(0, 1, 3), (1, 2, 4), (2, 3, 5)]
+    TREE = [(0, 1, 3), (0, 2, 4), (0, 3, 5), (3, 4, 3)]
+    TRIANGLE = [(0, 1, 3), (1, 2, 4), (0, 2, 5)]
+    CLIQUE_4 = [(0, 1, 3), (0, 2, 3), (0, 3, 3), (1, 2, 3), (1, 3, 3), (2, 3, 5)]
+
+    def test_no_edges(self):
+        self.assertEqual(0, LongestRouteSolver().longest_route([]))
+
+    def test_path(self):
+        self.assertEqual(12, LongestRouteSolver().longest_route(self.PATH))
+
+    def test_tree(self):
+        self.assertEqual(12, LongestRouteSolver().longest_route(self.TREE))
+
+    def test_cycle(self):
+        self.assertEqual(9, LongestRouteSolver().longest_route(self.TRIANGLE))
+
+    def test_clique(self):
+        self.assertEqual(11, LongestRouteSolver().longest_route(self.CLIQUE_4))
+
+    def test_parallel_edges(self):
+        self.assertEqual(5, LongestRouteSolver().longest_route([(0, 1, 3), (1, 0, 5)]))
+
+    def test_separate_components(self):
+        other_component = [(10, 11, 5), (11, 12, 5), (12, 13, 5)]
+        self.assertEqual(15, LongestRouteSolver().longest_route(self.TRIANGLE + other_component))
+
+    def test_cached_component(self):
+        solver = LongestRouteSolver(cache_size=1)
+        self.assertEqual(11, solver.longest_route(self.CLIQUE_4))
+        self.assertEqual(9, solver.longest_route(self.TRIANGLE))
+        self.assertEqual(11, solver.longest_route(reversed(self.CLIQUE_4)))
+
+    def test_get_components(self):
+        other_component = [(10, 11, 5), (11, 12, 5)]
+        components = LongestRouteSolver.get_components(self.TRIANGLE + other_component + [(1, 0, 5)])
+        self.assertCountEqual([frozenset([(0, 1, 5), (1, 2, 4), (0, 2, 5)]), frozenset(other_component)], components)
+
+    def test_longest_route_of_components(self):
+        components = LongestRouteSolver.get_components(self.PATH + [(10, 11, 5)])
+        self.assertEqual(12, LongestRouteSolver().longest_route_of_components(components))
+
+
+if __name__ == '__main__':
+    unittest.main()
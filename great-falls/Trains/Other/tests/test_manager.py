@@ -1,10 +1,30 @@
+import glob
+import json
+import os
+import random
+import tempfile
+import time
 import unittest
 from unittest.mock import MagicMock, patch, Mock
 
+import Trains.Other.admin_utils as admin_utils
 from Trains.Admin.manager import Manager
+from Trains.Admin.tournament_checkpoint import TournamentCheckpoint
+from Trains.Common.map import Map
+from Trains.Common.map_cache import MAP_CACHE
+from Trains.Other.game_result import GameResult
+from Trains.Other.interfaces.i_player import IPlayer
+from Trains.Other.map_generator import MapGeneratorProcedural
+from Trains.Other.timings import TIMINGS
+from Trains.Player.buy_now import BuyNowStrategy
+from Trains.Player.cheat import CheatStrategy
+from Trains.Player.hold_ten import HoldTenStrategy
+from Trains.Player.player import Player
 
 
 class ManagerTests(unittest.TestCase):
+    STRESS_TEST_TIME_LIMIT = 5.0
+
     @patch('Trains.Admin.manager.IMapGenerator')
     @patch('Trains.Admin.manager.Referee')
     def test_run_tournament(self, mock_referee, mock_map_generator):
@@ -12,7 +32,7 @@ class ManagerTests(unittest.TestCase):
         all_players[4].start = Mock(side_effect=Exception("Did not respond"))
 
         mock_valid_map = MagicMock()
-        mock_valid_map.get_feasible_destinations.return_value = [1] * 80
+        mock_valid_map.has_feasible_destinations.return_value = True
         all_players[3].start.return_value = mock_valid_map
 
         mock_game_result_1 = MagicMock()
@@ -34,7 +54,7 @@ class ManagerTests(unittest.TestCase):
     def test_setup_with_valid_map(self, mock_generator):
         all_players = self.setup_player_mocks()
         mock_valid_map = MagicMock()
-        mock_valid_map.get_feasible_destinations.return_value = [1] * 80
+        mock_valid_map.has_feasible_destinations.return_value = True
         all_players[3].start.return_value = mock_valid_map
         actual_map, cheaters = Manager.setup_tournament(all_players, mock_generator.return_value)
         for player in all_players:
@@ -47,8 +67,8 @@ class ManagerTests(unittest.TestCase):
         all_players = self.setup_player_mocks()
         mock_valid_map = MagicMock()
         mock_invalid_map = MagicMock()
-        mock_invalid_map.get_feasible_destinations.return_value = [1] * 2
-        all_players[0].start.return_value = mock_valid_map
+        mock_invalid_map.has_feasible_destinations.return_value = False
+        all_players[0].start.return_value = mock_invalid_map
         mock_map_generator_instance = mock_generator.return_value
         mock_map_generator_instance.generate_map.return_value = mock_valid_map
         actual_map, cheaters = Manager.setup_tournament(all_players, mock_generator.return_value)
@@ -57,11 +77,37 @@ class ManagerTests(unittest.TestCase):
         self.assertEqual(mock_valid_map, actual_map)
         self.assertListEqual([], cheaters)
 
+    @patch('Trains.Admin.manager.IMapGenerator')
+    def test_setup_checks_each_distinct_map_once(self, mock_generator):
+        all_players = self.setup_player_mocks()
+        mock_invalid_map = MagicMock()
+        mock_invalid_map.fingerprint.return_value = "invalid"
+        mock_invalid_map.has_feasible_destinations.return_value = False
+        mock_valid_map = MagicMock()
+        mock_valid_map.has_feasible_destinations.return_value = True
+        for player in all_players[:5]:
+            player.start.return_value = mock_invalid_map
+        all_players[5].start.return_value = mock_valid_map
+        actual_map, cheaters = Manager.setup_tournament(all_players, mock_generator.return_value)
+        self.assertEqual(mock_valid_map, actual_map)
+        mock_invalid_map.has_feasible_destinations.assert_called_once()
+        mock_valid_map.has_feasible_destinations.assert_called_once()
+        for player in all_players[6:]:
+            player.start.return_value.has_feasible_destinations.assert_not_called()
+
+    def test_setup_with_identical_default_maps(self):
+        all_players = [Player(BuyNowStrategy(), f"player{i}") for i in range(3)]
+        mock_generator = MagicMock()
+        actual_map, cheaters = Manager.setup_tournament(all_players, mock_generator)
+        self.assertEqual(all_players[0].start(True).fingerprint(), actual_map.fingerprint())
+        mock_generator.generate_map.assert_not_called()
+        self.assertListEqual([], cheaters)
+
     @patch('Trains.Admin.manager.IMapGenerator')
     def test_setup_with_cheaters(self, mock_generator):
         all_players = self.setup_player_mocks()
         mock_valid_map = MagicMock()
-        mock_valid_map.get_feasible_destinations.return_value = [1] * 80
+        mock_valid_map.has_feasible_destinations.return_value = True
         all_players[3].start.return_value = mock_valid_map
         all_players[4].start = Mock(side_effect=Exception("Did not respond"))
         all_players[7].start = Mock(side_effect=Exception("Did not respond"))
@@ -143,6 +189,148 @@ class ManagerTests(unittest.TestCase):
         for winner in winners:
             winner.end.assert_called_with(True)
 
+    def test_run_rounds_in_workers_matches_sequential(self):
+        class LocalPlayer(Player):
+            pass
+
+        tournament_map = MapGeneratorProcedural(30, seed=0).generate_map()
+        strategies = [BuyNowStrategy, HoldTenStrategy, CheatStrategy]
+        players = [LocalPlayer(strategies[i % len(strategies)], f"player{i}") for i in range(20)]
+
+        random.seed(0)
+        sequential_winners, sequential_cheaters = Manager.run_rounds(players, tournament_map)
+        random.seed(0)
+        winners, cheaters = Manager.run_rounds(players, tournament_map, num_workers=2)
+        self.assertListEqual(sequential_winners, winners)
+        self.assertListEqual(sequential_cheaters, cheaters)
+        self.assertTrue(all(player in players for player in winners + cheaters))
+
+    def test_run_rounds_in_workers_updates_players(self):
+        class CountingPlayer(Player):
+            def __init__(self, strategy, name):
+                super().__init__(strategy, name)
+                self.num_games = 0
+
+            def setup(self, trains_map, num_rails, starting_cards):
+                super().setup(trains_map, num_rails, starting_cards)
+                self.num_games += 1
+
+        tournament_map = MapGeneratorProcedural(30, seed=0).generate_map()
+        strategies = [BuyNowStrategy, HoldTenStrategy]
+        sequential_players = [CountingPlayer(strategies[i % 2], f"player{i}") for i in range(20)]
+        players = [CountingPlayer(strategies[i % 2], f"player{i}") for i in range(20)]
+
+        random.seed(0)
+        Manager.run_rounds(sequential_players, tournament_map)
+        random.seed(0)
+        Manager.run_rounds(players, tournament_map, num_workers=2)
+        self.assertListEqual([player.num_games for player in sequential_players],
+                             [player.num_games for player in players])
+        self.assertTrue(all(player.num_games > 0 for player in players))
+        self.assertListEqual([player.initial_cards for player in sequential_players],
+                             [player.initial_cards for player in players])
+        self.assertTrue(all(player.trains_map is tournament_map for player in players))
+
+    def test_run_round_in_workers_computes_feasible_destinations_before_forking(self):
+        tournament_map = MapGeneratorProcedural(30, seed=1).generate_map()
+        players = [Player([BuyNowStrategy, HoldTenStrategy][i % 2], f"player{i}") for i in range(16)]
+        MAP_CACHE.clear()
+        Manager._Manager__run_round(players, tournament_map, 2)
+        misses = MAP_CACHE.get_stats()["misses"]
+        admin_utils.get_feasible_destinations(tournament_map)
+        self.assertEqual(misses, MAP_CACHE.get_stats()["misses"])
+
+    def test_resume_tournament_matches_uninterrupted_tournament(self):
+        tournament_map = MapGeneratorProcedural(30, seed=0).generate_map()
+
+        class LocalPlayer(Player):
+            def start(self, is_starting: bool) -> Map:
+                return tournament_map
+
+        strategies = [BuyNowStrategy, HoldTenStrategy, CheatStrategy]
+        players = [LocalPlayer(strategies[i % len(strategies)], f"player{i}") for i in range(20)]
+        checkpoints = []
+        write_checkpoint = TournamentCheckpoint.write
+
+        def record_checkpoint(checkpoint, path):
+            checkpoints.append(checkpoint)
+            write_checkpoint(checkpoint, path)
+
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_path = os.path.join(directory, "tournament.json")
+            random.seed(0)
+            with patch.object(TournamentCheckpoint, "write", autospec=True, side_effect=record_checkpoint):
+                winners, cheaters = Manager.run_tournament(players, MagicMock(), checkpoint_path=checkpoint_path)
+            self.assertGreater(len(checkpoints), 1)
+            self.assertTrue(checkpoints[-1].is_finished)
+            self.assertEqual(checkpoints[-1], TournamentCheckpoint.read(checkpoint_path))
+            self.assertListEqual([checkpoint_path], glob.glob(os.path.join(directory, "*")) +
+                                 glob.glob(os.path.join(directory, ".*")))
+
+            for checkpoint in checkpoints:
+                checkpoint.write(checkpoint_path)
+                random.seed(1)
+                self.assertEqual((winners, cheaters),
+                                 Manager.resume_tournament(players, tournament_map, checkpoint_path))
+
+    def test_run_tournament_timings_report(self):
+        tournament_map = MapGeneratorProcedural(30, seed=0).generate_map()
+
+        class LocalPlayer(Player):
+            def start(self, is_starting: bool) -> Map:
+                return tournament_map
+
+        players = [LocalPlayer([BuyNowStrategy, HoldTenStrategy][i % 2], f"player{i}") for i in range(20)]
+        with tempfile.TemporaryDirectory() as directory:
+            report_path = os.path.join(directory, "timings.json")
+            random.seed(0)
+            Manager.run_tournament(players, MagicMock(), report_path=report_path)
+            with open(report_path) as report_file:
+                report = json.load(report_file)
+            random.seed(0)
+            TIMINGS.clear()
+            Manager.run_rounds(players, tournament_map, num_workers=2)
+            worker_report = TIMINGS.to_dict()
+
+        self.assertEqual(1, report["tournament/map_selection"]["count"])
+        num_tables = report["tournament/table"]["count"]
+        self.assertGreater(num_tables, 3)
+        self.assertEqual(num_tables, report["referee/turns"]["count"])
+        self.assertEqual(num_tables, sum(report["tournament/table"]["histogram_us"].values()))
+        for method in ["start", "setup", "pick", "play", "end"]:
+            self.assertIn(f"player/player0/{method}", report)
+        self.assertEqual(num_tables, worker_report["tournament/table"]["count"])
+        self.assertEqual(report["player/player0/play"]["count"], worker_report["player/player0/play"]["count"])
+
+    def test_resume_tournament_with_another_map(self):
+        players = self.setup_player_mocks()
+        checkpoint = TournamentCheckpoint(len(players), "fingerprint", 1, 10, False, [0, 1], [], [0, 1],
+                                          random.getstate())
+        other_map = MagicMock()
+        other_map.fingerprint.return_value = "other fingerprint"
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_path = os.path.join(directory, "tournament.json")
+            checkpoint.write(checkpoint_path)
+            self.assertRaises(ValueError, Manager.resume_tournament, players, other_map, checkpoint_path)
+            self.assertRaises(ValueError, Manager.resume_tournament, players[1:], MagicMock(), checkpoint_path)
+
+    @patch('Trains.Admin.manager.Referee')
+    def test_run_rounds_10000_players(self, mock_referee):
+        class Bot(IPlayer):
+            pass
+
+        def first_player_wins_and_last_cheats(_, players, *args):
+            return GameResult(players[:-1], [1] + [0] * (len(players) - 2), players[-1:])
+
+        mock_referee.run_game = first_player_wins_and_last_cheats
+        all_players = [Bot() for _ in range(10000)]
+        start = time.perf_counter()
+        winners, cheaters = Manager.run_rounds(all_players, MagicMock())
+        self.assertLess(time.perf_counter() - start, self.STRESS_TEST_TIME_LIMIT)
+        self.assertListEqual([all_players[0]], winners)
+        self.assertEqual(1250 + 157 + 20 + 3 + 1, len(cheaters))
+        self.assertEqual(len(cheaters), len(set(map(id, cheaters))))
+
     def setup_player_mocks(self):
         player_1 = MagicMock()
         player_2 = MagicMock()
@@ -154,4 +342,7 @@ class ManagerTests(unittest.TestCase):
         player_8 = MagicMock()
         player_9 = MagicMock()
         player_10 = MagicMock()
+        for player in [player_1, player_2, player_3, player_4, player_5, player_6, player_7, player_8, player_9,
+                       player_10]:
+            player.start.return_value.has_feasible_destinations.return_value = False
         return [player_1, player_2, player_3, player_4, player_5, player_6, player_7, player_8, player_9, player_10]
@@ -1,9 +1,13 @@
 import unittest
+from typing import Iterable
+from Trains.Common.owned_subgraph import OwnedSubgraph
 from Trains.Other.color import Color
 from Trains.Other.directed_connection import DirectedConnection
 from Trains.Common.map import Map
 from Trains.Other.city import City
 from Trains.Other.destination import Destination
+from Trains.Other.player_state import PublicPlayerState
+from Trains.Other.undirected_connection import UndirectedConnection
 
 
 class MapTests(unittest.TestCase):
@@ -142,11 +146,47 @@ class MapTests(unittest.TestCase):
                 [self.DIRECTED_CONNECTION_1A, self.DIRECTED_CONNECTION_1B,
                  self.DIRECTED_CONNECTION_2A])
 
+    def test_map_constructor_invalid_duplicate_mirrored_connection(self):
+        with self.assertRaises(ValueError):
+            Map(self.MAP_WIDTH, self.MAP_HEIGHT, [self.CITY_1, self.CITY_2],
+                [self.DIRECTED_CONNECTION_1A, self.DIRECTED_CONNECTION_1B, self.DIRECTED_CONNECTION_1B])
+
+    def test_map_constructor_valid_connections_in_any_order(self):
+        connections = [self.DIRECTED_CONNECTION_2A, self.DIRECTED_CONNECTION_1A, self.DIRECTED_CONNECTION_2B,
+                       self.DIRECTED_CONNECTION_1B]
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, connections)
+        self.assertEqual(len(connections), len(train_map.get_all_directed_connections()))
+
+    def test_map_constructor_invalid_mirror_different_length(self):
+        with self.assertRaises(ValueError):
+            Map(self.MAP_WIDTH, self.MAP_HEIGHT, [self.CITY_1, self.CITY_2],
+                [self.DIRECTED_CONNECTION_1A, DirectedConnection(self.CITY_2, self.CITY_1, 4, Color.RED)])
+
+    def test_map_get_outgoing_connections_no_connections(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertEqual([], train_map.get_outgoing_connections(self.CITY_6))
+
     def test_map_get_cities(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, [self.CITY_1, self.CITY_2],
                         [self.DIRECTED_CONNECTION_1A, self.DIRECTED_CONNECTION_1B])
         self.assertEqual([self.CITY_1, self.CITY_2], train_map.get_cities())
 
+    def test_map_interns_cities(self):
+        duplicate_city_1 = City(self.CITY_NAME_1, self.POSITION_1)
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, [self.CITY_2, self.CITY_1, duplicate_city_1],
+                        [self.DIRECTED_CONNECTION_1A, self.DIRECTED_CONNECTION_1B])
+        city_table = train_map.get_city_table()
+        city_2, city_1 = train_map.get_cities()
+
+        self.assertEqual([self.CITY_2, self.CITY_1], train_map.get_cities())
+        self.assertIs(city_table.intern(self.CITY_1), city_1)
+        self.assertEqual([city_1, city_2], city_table.get_cities())
+        connection = train_map.get_outgoing_connections(self.CITY_1)[0]
+        self.assertIs(city_1, connection.from_city)
+        self.assertIs(city_2, connection.to_city)
+        destination = next(iter(train_map.get_feasible_destinations(self.STARTING_RAILS)))
+        self.assertEqual((0, 1), destination.ordinals)
+
     def test_map_get_city_names(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, [self.CITY_1, self.CITY_2],
                         [self.DIRECTED_CONNECTION_1A, self.DIRECTED_CONNECTION_1B])
@@ -172,6 +212,80 @@ class MapTests(unittest.TestCase):
         self.assertSetEqual({self.DESTINATION_1, self.DESTINATION_2, self.DESTINATION_3},
                             train_map.get_feasible_destinations(3))
 
+    def test_map_get_feasible_destinations_different_budgets(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertSetEqual(set(), train_map.get_feasible_destinations(2))
+        self.assertSetEqual({self.DESTINATION_1, self.DESTINATION_2, self.DESTINATION_3},
+                            train_map.get_feasible_destinations(5))
+        self.assertSetEqual({self.DESTINATION_1, self.DESTINATION_2, self.DESTINATION_3, self.DESTINATION_4},
+                            train_map.get_feasible_destinations(6))
+
+    def test_map_has_feasible_destinations(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertTrue(train_map.has_feasible_destinations(self.STARTING_RAILS, 0))
+        self.assertTrue(train_map.has_feasible_destinations(self.STARTING_RAILS, 4))
+        self.assertFalse(train_map.has_feasible_destinations(self.STARTING_RAILS, 5))
+        self.assertTrue(train_map.has_feasible_destinations(3, 3))
+        self.assertFalse(train_map.has_feasible_destinations(3, 4))
+        self.assertFalse(train_map.has_feasible_destinations(2, 1))
+
+    def test_map_has_feasible_destinations_empty_map(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, [])
+        self.assertFalse(train_map.has_feasible_destinations(self.STARTING_RAILS, 1))
+
+    def test_map_get_sorted_feasible_destinations(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertEqual((self.DESTINATION_1, self.DESTINATION_2, self.DESTINATION_4, self.DESTINATION_3),
+                         train_map.get_sorted_feasible_destinations(self.STARTING_RAILS))
+
+    def test_map_get_undirected_connections(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertEqual({self.DIRECTED_CONNECTION_1A.make_undirected(), self.DIRECTED_CONNECTION_2A.make_undirected(),
+                          self.DIRECTED_CONNECTION_3A.make_undirected()}, train_map.get_undirected_connections())
+
+    def test_map_get_sorted_undirected_connections(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertEqual(tuple(sorted(train_map.get_undirected_connections())),
+                         train_map.get_sorted_undirected_connections())
+        self.assertIsInstance(train_map.get_sorted_undirected_connections()[0], UndirectedConnection)
+
+    def test_map_fingerprint_equal_maps(self):
+        train_map_1 = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        train_map_2 = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertEqual(train_map_1.fingerprint(), train_map_2.fingerprint())
+
+    def test_map_fingerprint_different_maps(self):
+        train_map_1 = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        train_map_2 = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)
+        train_map_3 = Map(self.MAP_WIDTH, self.MAP_HEIGHT, list(reversed(self.CITY_LIST)),
+                          self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertNotEqual(train_map_1.fingerprint(), train_map_2.fingerprint())
+        self.assertNotEqual(train_map_1.fingerprint(), train_map_3.fingerprint())
+
+    def test_map_get_connection_index(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        connection_index = train_map.get_connection_index()
+        sorted_connections = train_map.get_sorted_undirected_connections()
+        self.assertEqual(len(sorted_connections), len(connection_index))
+        for connection_id, connection in enumerate(sorted_connections):
+            self.assertEqual(connection_id, connection_index.get_id(connection))
+
+    def test_map_get_connection_index_is_lookup_only(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        connection_index = train_map.get_connection_index()
+        off_map_connection = UndirectedConnection(self.CITY_5, self.CITY_6, self.LENGTH, Color.RED)
+        with self.assertRaises(KeyError):
+            connection_index.get_id(off_map_connection)
+        PublicPlayerState({off_map_connection}, connection_index=connection_index)
+        self.assertEqual(len(train_map.get_undirected_connections()), len(connection_index))
+
+    def test_map_get_feasible_destinations_sharded(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)
+        sharded_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, list(reversed(self.CITY_LIST)),
+                          self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)
+        self.assertSetEqual(set(train_map.get_feasible_destinations(6)),
+                            set(sharded_map.get_feasible_destinations(6, num_workers=2)))
+
     def test_map_get_all_directed_connections(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
         self.assertListEqual(
@@ -179,60 +293,86 @@ class MapTests(unittest.TestCase):
             sorted(train_map.get_all_directed_connections(),
                    key=lambda conn: (conn.from_city, conn.color.value)))
 
-    def test_map_are_cities_connected_same_component(self):
+    def test_owned_subgraph_are_cities_connected_same_component(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
-        self.assertTrue(
-            train_map.are_cities_connected(self.CITY_2, self.CITY_3, set(self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)))
+        owned_subgraph = self.get_owned_subgraph(train_map, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertTrue(owned_subgraph.are_cities_connected(self.CITY_2, self.CITY_3))
 
-    def test_map_are_cities_connected_different_component(self):
+    def test_owned_subgraph_are_cities_connected_different_component(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
-        self.assertFalse(
-            train_map.are_cities_connected(self.CITY_2, self.CITY_5, set(self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)))
+        owned_subgraph = self.get_owned_subgraph(train_map, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        self.assertFalse(owned_subgraph.are_cities_connected(self.CITY_2, self.CITY_5))
 
-    def test_map_are_cities_connected_no_acquireds(self):
+    def test_owned_subgraph_are_cities_connected_no_acquireds(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
-        self.assertFalse(train_map.are_cities_connected(self.CITY_2, self.CITY_1, set()))
+        self.assertFalse(self.get_owned_subgraph(train_map, set()).are_cities_connected(self.CITY_2, self.CITY_1))
 
-    def test_map_are_cities_connected_missing_connection(self):
+    def test_owned_subgraph_are_cities_connected_missing_connection(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
-        self.assertFalse(train_map.are_cities_connected(self.CITY_2, self.CITY_3, {self.DIRECTED_CONNECTION_1A,
-                                                                                   self.DIRECTED_CONNECTION_1B}))
+        owned_subgraph = self.get_owned_subgraph(train_map, {self.DIRECTED_CONNECTION_1A, self.DIRECTED_CONNECTION_1B})
+        self.assertFalse(owned_subgraph.are_cities_connected(self.CITY_2, self.CITY_3))
 
-    def test_map_longest_continuous_path_separate_components(self):
+    def test_owned_subgraph_longest_route_separate_components(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
-        self.assertEqual(6, train_map.longest_continuous_route(set(self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)))
+        self.assertEqual(6, self.get_owned_subgraph(train_map,
+                                                    self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH).get_longest_route())
 
-    def test_map_longest_continuous_path_cyclic_map(self):
+    def test_owned_subgraph_longest_route_cyclic_map(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)
-        self.assertEqual(17, train_map.longest_continuous_route(set(self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)))
+        self.assertEqual(17, self.get_owned_subgraph(train_map,
+                                                     self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH).get_longest_route())
 
-    def test_map_longest_continuous_path_cyclic_map_missing_connection(self):
+    def test_owned_subgraph_longest_route_cyclic_map_missing_connection(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)
-        self.assertEqual(16, train_map.longest_continuous_route(
-            set(self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH) - {self.DIRECTED_CONNECTION_5_6,
-                                                                self.DIRECTED_CONNECTION_6_5}))
+        self.assertEqual(16, self.get_owned_subgraph(
+            train_map, set(self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH) - {self.DIRECTED_CONNECTION_5_6,
+                                                                           self.DIRECTED_CONNECTION_6_5}
+        ).get_longest_route())
 
-    def test_map_longest_continuous_path_cyclic_map_missing_connection_same_length(self):
+    def test_owned_subgraph_longest_route_cyclic_map_missing_connection_same_length(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)
-        self.assertEqual(17, train_map.longest_continuous_route(
-            set(self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH) - {self.DIRECTED_CONNECTION_5_3_BLUE,
-                                                                self.DIRECTED_CONNECTION_3_5_BLUE}))
+        self.assertEqual(17, self.get_owned_subgraph(
+            train_map, set(self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH) - {self.DIRECTED_CONNECTION_5_3_BLUE,
+                                                                           self.DIRECTED_CONNECTION_3_5_BLUE}
+        ).get_longest_route())
 
-    def test_map_longest_continuous_path_cyclic_map_no_acquireds(self):
+    def test_owned_subgraph_longest_route_cyclic_map_no_acquireds(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)
-        self.assertEqual(0, train_map.longest_continuous_route(set()))
+        self.assertEqual(0, self.get_owned_subgraph(train_map, set()).get_longest_route())
 
-    def test_map_longest_continuous_path_cyclic_map_separate_components(self):
+    def test_owned_subgraph_longest_route_cyclic_map_separate_components(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)
+        self.assertEqual(12, self.get_owned_subgraph(
+            train_map, set(self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH) - {self.DIRECTED_CONNECTION_5_3_BLUE,
+                                                                           self.DIRECTED_CONNECTION_3_5_BLUE,
+                                                                           self.DIRECTED_CONNECTION_5_3_RED,
+                                                                           self.DIRECTED_CONNECTION_3_5_RED,
+                                                                           self.DIRECTED_CONNECTION_2_3_BLUE,
+                                                                           self.DIRECTED_CONNECTION_3_2_BLUE,
+                                                                           self.DIRECTED_CONNECTION_2_3_RED,
+                                                                           self.DIRECTED_CONNECTION_3_2_RED}
+        ).get_longest_route())
+
+    def test_get_owned_subgraph(self):
         train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH)
-        self.assertEqual(12, train_map.longest_continuous_route(
-            set(self.DIRECTED_CONNECTION_LIST_COMPLEX_GRAPH) - {self.DIRECTED_CONNECTION_5_3_BLUE,
-                                                                self.DIRECTED_CONNECTION_3_5_BLUE,
-                                                                self.DIRECTED_CONNECTION_5_3_RED,
-                                                                self.DIRECTED_CONNECTION_3_5_RED,
-                                                                self.DIRECTED_CONNECTION_2_3_BLUE,
-                                                                self.DIRECTED_CONNECTION_3_2_BLUE,
-                                                                self.DIRECTED_CONNECTION_2_3_RED,
-                                                                self.DIRECTED_CONNECTION_3_2_RED}))
+        owned_subgraph = train_map.get_owned_subgraph(train_map.get_undirected_connections())
+        self.assertEqual(34, owned_subgraph.get_num_segments())
+        self.assertEqual(17, owned_subgraph.get_longest_route())
+        self.assertTrue(owned_subgraph.are_cities_connected(self.CITY_1, self.CITY_6))
+
+    def test_get_owned_subgraph_separate_components(self):
+        train_map = Map(self.MAP_WIDTH, self.MAP_HEIGHT, self.CITY_LIST, self.DIRECTED_CONNECTION_LIST_SIMPLE_GRAPH)
+        owned_subgraph = train_map.get_owned_subgraph(train_map.get_undirected_connections())
+        self.assertEqual(9, owned_subgraph.get_num_segments())
+        self.assertEqual(6, owned_subgraph.get_longest_route())
+        self.assertTrue(owned_subgraph.are_cities_connected(self.CITY_2, self.CITY_3))
+        self.assertFalse(owned_subgraph.are_cities_connected(self.CITY_1, self.CITY_4))
+        self.assertFalse(owned_subgraph.are_cities_connected(self.CITY_5, self.CITY_6))
+
+
+    @staticmethod
+    def get_owned_subgraph(train_map: Map, directed_connections: Iterable[DirectedConnection]) -> OwnedSubgraph:
+        return train_map.get_owned_subgraph(connection.make_undirected() for connection in directed_connections)
 
 
 if __name__ == '__main__':
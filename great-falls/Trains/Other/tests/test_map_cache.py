@@ -0,0 +1,51 @@
+import unittest
+from Trains.Common.map_cache import MapCache
+
+
+class MapCacheTests(unittest.TestCase):
+    FINGERPRINT_1 = "fingerprint1"
+    FINGERPRINT_2 = "fingerprint2"
+    ARTIFACT_1 = "artifact1"
+    ARTIFACT_2 = ("artifact2", 45)
+
+    def test_constructor_invalid_size(self):
+        with self.assertRaises(ValueError):
+            MapCache(0)
+
+    def test_get_or_compute_miss_then_hit(self):
+        cache = MapCache()
+        computed = []
+        compute = lambda: computed.append(1) or len(computed)
+        self.assertEqual(1, cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_1, compute))
+        self.assertEqual(1, cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_1, compute))
+        self.assertEqual(1, len(computed))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1}, cache.get_stats())
+
+    def test_get_or_compute_keys_by_fingerprint_and_artifact(self):
+        cache = MapCache()
+        cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_1, lambda: 1)
+        self.assertEqual(2, cache.get_or_compute(self.FINGERPRINT_2, self.ARTIFACT_1, lambda: 2))
+        self.assertEqual(3, cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_2, lambda: 3))
+        self.assertEqual({"hits": 0, "misses": 3, "size": 3}, cache.get_stats())
+
+    def test_get_or_compute_evicts_least_recently_used(self):
+        cache = MapCache(2)
+        cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_1, lambda: 1)
+        cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_2, lambda: 2)
+        cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_1, lambda: 1)
+        cache.get_or_compute(self.FINGERPRINT_2, self.ARTIFACT_1, lambda: 3)
+        self.assertEqual(1, cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_1, lambda: -1))
+        self.assertEqual(-2, cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_2, lambda: -2))
+        self.assertEqual(2, cache.get_stats()["size"])
+
+    def test_clear(self):
+        cache = MapCache()
+        cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_1, lambda: 1)
+        cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_1, lambda: 1)
+        cache.clear()
+        self.assertEqual({"hits": 0, "misses": 0, "size": 0}, cache.get_stats())
+        self.assertEqual(2, cache.get_or_compute(self.FINGERPRINT_1, self.ARTIFACT_1, lambda: 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from Trains.Other.color import Color
+from Trains.Other.map_generator import MapGeneratorDefault, MapGeneratorProcedural
+
+
+class MapGeneratorTests(unittest.TestCase):
+    NUM_CITIES = 40
+    MAX_PLAYER_RAILS = 45
+
+    def test_default_generate_map(self):
+        trains_map = MapGeneratorDefault().generate_map()
+        self.assertEqual(7, len(trains_map.get_cities()))
+        self.assertEqual(21, len(trains_map.get_feasible_destinations(self.MAX_PLAYER_RAILS)))
+
+    def test_procedural_constructor_invalid(self):
+        with self.assertRaises(ValueError):
+            MapGeneratorProcedural(1)
+        with self.assertRaises(ValueError):
+            MapGeneratorProcedural(5, width=2, height=2)
+        with self.assertRaises(ValueError):
+            MapGeneratorProcedural(5, connections_per_city=100)
+        with self.assertRaises(ValueError):
+            MapGeneratorProcedural(5, min_feasible_destinations=11)
+        with self.assertRaises(ValueError):
+            MapGeneratorProcedural(5, max_player_rails=2)
+        with self.assertRaises(ValueError):
+            MapGeneratorProcedural(5, color_weights={})
+
+    def test_procedural_generate_map_deterministic(self):
+        trains_map_1 = MapGeneratorProcedural(self.NUM_CITIES, seed=7).generate_map()
+        trains_map_2 = MapGeneratorProcedural(self.NUM_CITIES, seed=7).generate_map()
+        trains_map_3 = MapGeneratorProcedural(self.NUM_CITIES, seed=8).generate_map()
+        self.assertEqual(trains_map_1.fingerprint(), trains_map_2.fingerprint())
+        self.assertNotEqual(trains_map_1.fingerprint(), trains_map_3.fingerprint())
+
+    def test_procedural_generate_map_size(self):
+        trains_map = MapGeneratorProcedural(self.NUM_CITIES, connections_per_city=4, width=300, height=200).generate_map()
+        self.assertEqual(self.NUM_CITIES, len(trains_map.get_cities()))
+        self.assertEqual(self.NUM_CITIES * 2, len(trains_map.get_undirected_connections()))
+        self.assertEqual(self.NUM_CITIES, len({city.position for city in trains_map.get_cities()}))
+        self.assertTrue(all(city.position[0] < 300 and city.position[1] < 200 for city in trains_map.get_cities()))
+
+    def test_procedural_generate_map_connected(self):
+        trains_map = MapGeneratorProcedural(self.NUM_CITIES, connections_per_city=0).generate_map()
+        owned_subgraph = trains_map.get_owned_subgraph(trains_map.get_undirected_connections())
+        self.assertEqual(self.NUM_CITIES - 1, len(trains_map.get_undirected_connections()))
+        for city in trains_map.get_cities():
+            self.assertTrue(owned_subgraph.are_cities_connected(trains_map.get_cities()[0], city))
+
+    def test_procedural_generate_map_color_and_length_mix(self):
+        trains_map = MapGeneratorProcedural(self.NUM_CITIES, color_weights={Color.BLUE: 1, Color.GREEN: 2},
+                                            length_weights={5: 1}).generate_map()
+        connections = trains_map.get_undirected_connections()
+        self.assertEqual({Color.BLUE, Color.GREEN}, {connection.color for connection in connections})
+        self.assertEqual({5}, {connection.length for connection in connections})
+
+    def test_procedural_generate_map_min_feasible_destinations(self):
+        trains_map = MapGeneratorProcedural(self.NUM_CITIES, connections_per_city=1, min_feasible_destinations=500,
+                                            max_player_rails=10, length_weights={5: 1}).generate_map()
+        self.assertGreaterEqual(len(trains_map.get_feasible_destinations(10)), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
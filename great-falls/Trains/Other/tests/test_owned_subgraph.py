@@ -0,0 +1,58 @@
+import unittest
+from Trains.Common.longest_route_solver import LongestRouteSolver
+from Trains.Common.owned_subgraph import OwnedSubgraph
+from Trains.Other.city import City
+
+
+class OwnedSubgraphTests(unittest.TestCase):
+    CITY_1 = City("city1", (0, 0))
+    CITY_2 = City("city2", (10, 10))
+    CITY_3 = City("city3", (20, 20))
+    CITY_4 = City("city4", (30, 30))
+    CITY_5 = City("city5", (40, 40))
+    CITY_ORDINALS = {CITY_1: 0, CITY_2: 1, CITY_3: 2, CITY_4: 3, CITY_5: 4}
+
+    TRIANGLE = [(0, 1, 3), (1, 2, 4), (0, 2, 5)]
+    SEPARATE_EDGE = [(3, 4, 5)]
+
+    def test_no_edges(self):
+        owned_subgraph = OwnedSubgraph([], self.CITY_ORDINALS, LongestRouteSolver())
+        self.assertEqual(0, owned_subgraph.get_num_segments())
+        self.assertEqual(0, owned_subgraph.get_longest_route())
+        self.assertFalse(owned_subgraph.are_cities_connected(self.CITY_1, self.CITY_2))
+
+    def test_same_city_is_connected(self):
+        owned_subgraph = OwnedSubgraph([], self.CITY_ORDINALS, LongestRouteSolver())
+        self.assertTrue(owned_subgraph.are_cities_connected(self.CITY_1, self.CITY_1))
+
+    def test_num_segments_counts_parallel_edges(self):
+        owned_subgraph = OwnedSubgraph([(0, 1, 3), (0, 1, 5)], self.CITY_ORDINALS, LongestRouteSolver())
+        self.assertEqual(8, owned_subgraph.get_num_segments())
+        self.assertEqual(5, owned_subgraph.get_longest_route())
+
+    def test_are_cities_connected(self):
+        owned_subgraph = OwnedSubgraph(self.TRIANGLE + self.SEPARATE_EDGE, self.CITY_ORDINALS, LongestRouteSolver())
+        self.assertTrue(owned_subgraph.are_cities_connected(self.CITY_1, self.CITY_3))
+        self.assertTrue(owned_subgraph.are_cities_connected(self.CITY_5, self.CITY_4))
+        self.assertFalse(owned_subgraph.are_cities_connected(self.CITY_1, self.CITY_4))
+
+    def test_edge_joins_components(self):
+        path_edges = [(0, 1, 3), (2, 3, 4)]
+        owned_subgraph = OwnedSubgraph(path_edges, self.CITY_ORDINALS, LongestRouteSolver())
+        self.assertFalse(owned_subgraph.are_cities_connected(self.CITY_1, self.CITY_4))
+        joined_subgraph = OwnedSubgraph(path_edges + [(1, 2, 1)], self.CITY_ORDINALS, LongestRouteSolver())
+        self.assertTrue(joined_subgraph.are_cities_connected(self.CITY_1, self.CITY_4))
+        self.assertTrue(joined_subgraph.are_cities_connected(self.CITY_4, self.CITY_1))
+
+    def test_city_not_on_map(self):
+        owned_subgraph = OwnedSubgraph(self.TRIANGLE, self.CITY_ORDINALS, LongestRouteSolver())
+        self.assertFalse(owned_subgraph.are_cities_connected(self.CITY_1, City("city6", (50, 50))))
+
+    def test_longest_route(self):
+        owned_subgraph = OwnedSubgraph(self.TRIANGLE + self.SEPARATE_EDGE, self.CITY_ORDINALS, LongestRouteSolver())
+        self.assertEqual(17, owned_subgraph.get_num_segments())
+        self.assertEqual(9, owned_subgraph.get_longest_route())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from Trains.Common.acquirable_connections import AcquirableConnections
 from Trains.Common.map import Map
 from Trains.Common.player_game_state import PlayerGameState
 from Trains.Other.color import Color
@@ -92,3 +93,11 @@ class PlayerGameStateTests(unittest.TestCase):
                                               [self.PUBLIC_STATE_2, self.PUBLIC_STATE_3])
 
         self.assertSetEqual(set(), actual_player_state.get_acquirable_connections())
+
+    def test_get_acquirable_connections_given_acquirable_connections(self):
+        acquirable_connections = AcquirableConnections(self.TRAINS_MAP.get_connection_index(),
+                                                       {self.UNDIRECTED_CONNECTION_5, self.UNDIRECTED_CONNECTION_6})
+        actual_player_state = PlayerGameState(self.TRAINS_MAP, self.PRIVATE_STATE_1,
+                                              [self.PUBLIC_STATE_2, self.PUBLIC_STATE_3], acquirable_connections)
+
+        self.assertSetEqual({self.UNDIRECTED_CONNECTION_6}, actual_player_state.get_acquirable_connections())
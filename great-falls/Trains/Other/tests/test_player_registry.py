@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import MagicMock
+
+from Trains.Admin.player_registry import PlayerRegistry
+
+
+class PlayerRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.players = [MagicMock() for _ in range(5)]
+        self.registry = PlayerRegistry(self.players)
+
+    def test_all_players_start_active(self):
+        self.assertEqual(5, self.registry.get_num_active())
+        self.assertListEqual(self.players, self.registry.get_active_players())
+        self.assertListEqual([], self.registry.get_cheaters())
+        self.assertListEqual([], self.registry.get_losers())
+
+    def test_keep_winners(self):
+        self.registry.keep_winners([self.players[3], self.players[1]])
+        self.assertListEqual([self.players[1], self.players[3]], self.registry.get_active_players())
+        self.assertListEqual([self.players[0], self.players[2], self.players[4]], self.registry.get_losers())
+
+    def test_keep_winners_ignores_eliminated_winners(self):
+        self.registry.keep_winners([self.players[0]])
+        self.registry.keep_winners([self.players[0], self.players[1]])
+        self.assertListEqual([self.players[0]], self.registry.get_active_players())
+
+    def test_mark_cheaters(self):
+        self.registry.mark_cheaters([self.players[4], self.players[2], self.players[4]])
+        self.assertListEqual([self.players[4], self.players[2]], self.registry.get_cheaters())
+        self.assertEqual(5, self.registry.get_num_active())
+
+    def test_eliminate(self):
+        self.registry.eliminate([self.players[0], MagicMock()])
+        self.assertListEqual(self.players[1:], self.registry.get_active_players())
+        self.assertListEqual([self.players[0]], self.registry.get_losers())
+
+    def test_cheaters_are_not_losers(self):
+        self.registry.mark_cheaters([self.players[2]])
+        self.registry.keep_winners([self.players[0]])
+        self.assertListEqual([self.players[1], self.players[3], self.players[4]], self.registry.get_losers())
+        self.assertListEqual([self.players[2]], self.registry.get_cheaters())
+
+
+    def test_ids(self):
+        self.registry.mark_cheaters([self.players[3], self.players[1]])
+        self.registry.keep_winners([self.players[0], self.players[4]])
+        self.assertEqual(5, self.registry.get_num_players())
+        self.assertListEqual([0, 4], self.registry.get_active_ids())
+        self.assertListEqual([3, 1], self.registry.get_cheater_ids())
+        self.assertListEqual([4, 2], self.registry.get_ids([self.players[4], self.players[2]]))
+        self.assertListEqual([self.players[4], self.players[2]], self.registry.get_players([4, 2]))
+
+    def test_from_ids(self):
+        registry = PlayerRegistry.from_ids(self.players, [0, 4], [3, 1])
+        self.assertListEqual([self.players[0], self.players[4]], registry.get_active_players())
+        self.assertListEqual([self.players[3], self.players[1]], registry.get_cheaters())
+        self.assertListEqual([self.players[2]], registry.get_losers())
+
+
+if __name__ == '__main__':
+    unittest.main()
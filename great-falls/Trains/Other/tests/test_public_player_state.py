@@ -1,4 +1,6 @@
+import pickle
 import unittest
+from Trains.Other.connection_index import ConnectionIndex
 from Trains.Other.player_state import PublicPlayerState
 from Trains.Other.undirected_connection import UndirectedConnection
 from Trains.Other.city import City
@@ -54,3 +56,68 @@ class PublicPlayerStateTests(unittest.TestCase):
         self.assertEqual(2, len(player_state_added_connection.acquired_connections))
         self.assertTrue(self.UNDIRECTED_CONNECTION_2 in player_state_added_connection.acquired_connections)
 
+    def test_eq_shared_index(self):
+        connection_index = ConnectionIndex([self.UNDIRECTED_CONNECTION_2, self.UNDIRECTED_CONNECTION_1])
+        player_state_1 = PublicPlayerState(set(), connection_index=connection_index)
+        player_state_2 = PublicPlayerState({self.UNDIRECTED_CONNECTION_1}, connection_index=connection_index)
+        self.assertEqual(player_state_2, player_state_1.add_connection(self.UNDIRECTED_CONNECTION_1))
+        self.assertEqual(hash(player_state_2), hash(player_state_1.add_connection(self.UNDIRECTED_CONNECTION_1)))
+
+    def test_eq_different_index(self):
+        connection_index = ConnectionIndex([self.UNDIRECTED_CONNECTION_2, self.UNDIRECTED_CONNECTION_1])
+        player_state_1 = PublicPlayerState(self.CONNECTION_SET_1, connection_index=connection_index)
+        player_state_2 = PublicPlayerState(self.CONNECTION_SET_1)
+        self.assertEqual(player_state_1, player_state_2)
+        self.assertEqual(hash(player_state_1), hash(player_state_2))
+
+    def test_add_connection_already_acquired(self):
+        player_state = PublicPlayerState(self.CONNECTION_SET_1)
+        self.assertEqual(player_state, player_state.add_connection(self.UNDIRECTED_CONNECTION_1))
+        self.assertEqual(hash(player_state), hash(player_state.add_connection(self.UNDIRECTED_CONNECTION_1)))
+
+    def test_has_connection(self):
+        player_state = PublicPlayerState({self.UNDIRECTED_CONNECTION_1})
+        self.assertTrue(player_state.has_connection(self.UNDIRECTED_CONNECTION_1))
+        self.assertFalse(player_state.has_connection(self.UNDIRECTED_CONNECTION_2))
+
+    def test_get_acquired_bitset(self):
+        connection_index = ConnectionIndex([self.UNDIRECTED_CONNECTION_2, self.UNDIRECTED_CONNECTION_1])
+        player_state = PublicPlayerState({self.UNDIRECTED_CONNECTION_1}, connection_index=connection_index)
+        self.assertEqual(0b10, player_state.get_acquired_bitset(connection_index))
+        self.assertEqual(0b1, player_state.get_acquired_bitset(ConnectionIndex([self.UNDIRECTED_CONNECTION_1])))
+
+    def test_connection_not_in_lookup_only_index(self):
+        connection_index = ConnectionIndex([self.UNDIRECTED_CONNECTION_1], extendable=False)
+        player_state = PublicPlayerState({self.UNDIRECTED_CONNECTION_2}, connection_index=connection_index)
+        player_state = player_state.add_connection(self.UNDIRECTED_CONNECTION_1)
+
+        self.assertEqual(1, len(connection_index))
+        self.assertEqual(self.CONNECTION_SET_1, player_state.acquired_connections)
+        self.assertTrue(player_state.has_connection(self.UNDIRECTED_CONNECTION_2))
+        self.assertEqual(0b1, player_state.get_acquired_bitset(connection_index))
+        self.assertEqual(PublicPlayerState(self.CONNECTION_SET_1), player_state)
+        self.assertEqual(hash(PublicPlayerState(self.CONNECTION_SET_1)), hash(player_state))
+
+    def test_add_connection_not_in_lookup_only_index(self):
+        connection_index = ConnectionIndex([self.UNDIRECTED_CONNECTION_1], extendable=False)
+        player_state = PublicPlayerState(set(), connection_index=connection_index)
+        self.assertEqual(PublicPlayerState({self.UNDIRECTED_CONNECTION_2}, connection_index=connection_index),
+                         player_state.add_connection(self.UNDIRECTED_CONNECTION_2))
+        self.assertEqual(1, len(connection_index))
+
+    def test_acquired_connections_decoded_once(self):
+        player_state = PublicPlayerState({self.UNDIRECTED_CONNECTION_1})
+        self.assertIs(player_state.acquired_connections, player_state.acquired_connections)
+        self.assertEqual(frozenset({self.UNDIRECTED_CONNECTION_1}), player_state.acquired_connections)
+        self.assertEqual(self.CONNECTION_SET_1,
+                         player_state.add_connection(self.UNDIRECTED_CONNECTION_2).acquired_connections)
+        self.assertEqual({self.UNDIRECTED_CONNECTION_1}, player_state.acquired_connections)
+
+    def test_pickle(self):
+        connection_index = ConnectionIndex([self.UNDIRECTED_CONNECTION_1], extendable=False)
+        player_state = PublicPlayerState(self.CONNECTION_SET_1, connection_index=connection_index)
+        unpickled_state = pickle.loads(pickle.dumps(player_state))
+
+        self.assertEqual(PublicPlayerState(self.CONNECTION_SET_1), unpickled_state)
+        self.assertEqual(hash(player_state), hash(unpickled_state))
+        self.assertEqual(self.CONNECTION_SET_1, unpickled_state.acquired_connections)
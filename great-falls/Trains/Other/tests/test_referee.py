@@ -8,9 +8,12 @@ from Trains.Common.map import Map
 from Trains.Common.player_game_state import PlayerGameState
 from Trains.Other.city import City
 from Trains.Other.color import Color
+from Trains.Other.connection_index import ConnectionIndex
+from Trains.Other.deck import Deck
 from Trains.Other.destination import Destination
 from Trains.Other.directed_connection import DirectedConnection
 from Trains.Other.interfaces.i_strategy import IStrategy, MORE_CARDS_REQUEST
+from Trains.Other.timings import Timings
 from Trains.Player.buy_now import BuyNowStrategy
 from Trains.Other.undirected_connection import UndirectedConnection
 from Trains.Player.player import Player
@@ -152,6 +155,25 @@ class RefereeTests(unittest.TestCase):
         self.assertFalse(player_3 in winners)
         self.assertListEqual([], game_result.cheaters)
 
+    def test_referee_run_game_records_timings(self):
+        card_strategy_mock = MagicMock()
+        card_strategy_mock.create_deck.return_value = []
+        player_list = [Player(HoldStrategy, "hold1"), Player(HoldStrategy, "hold2"), Player(ExplodeStrategy, "explode")]
+        timings = Timings()
+        with patch('Trains.Admin.referee.TIMINGS', timings):
+            Referee.run_game(self.TRAIN_MAP, player_list, deck_creation_strategy=card_strategy_mock)
+        for phase in ["setup", "turns", "scoring"]:
+            self.assertEqual(1, timings.get_stats("referee", phase).count)
+        for name in ["hold1", "hold2", "explode"]:
+            self.assertEqual(1, timings.get_stats("player", name, "setup").count)
+            self.assertEqual(1, timings.get_stats("player", name, "pick").count)
+        self.assertEqual(1, timings.get_stats("player", "explode", "play").count)
+        self.assertEqual(0, timings.get_stats("player", "explode", "win").count)
+        self.assertEqual(1, timings.get_stats("player", "hold1", "win").count)
+        self.assertLessEqual(1, timings.get_stats("player", "hold1", "play").count)
+        self.assertEqual(timings.get_stats("player", "hold1", "play").count,
+                         timings.get_stats("player", "hold1", "more_cards").count)
+
     def test_referee_run_game_invalid_board(self):
         self.MOCK_TRAIN_MAP.get_feasible_destinations.return_value = []
         players = self.setup_player_mocks()
@@ -191,17 +213,19 @@ class RefereeTests(unittest.TestCase):
         mock_card_strategy_instance, mock_dest_strategy_instance = self.setup_strategy_mocks(mock_card_strategy,
                                                                                              mock_dest_strategy)
         mock_feasible_destinations = MagicMock()
-        self.MOCK_TRAIN_MAP.get_feasible_destinations.return_value = mock_feasible_destinations
+        self.MOCK_TRAIN_MAP.get_sorted_feasible_destinations.return_value = mock_feasible_destinations
+        self.MOCK_TRAIN_MAP.get_connection_index.return_value = ConnectionIndex(extendable=False)
         ref = Referee(self.MOCK_TRAIN_MAP, deck_creation_strategy=mock_card_strategy_instance,
                       destination_options_strategy=mock_dest_strategy_instance)
         ref.setup_game(players)
         mock_card_strategy_instance.create_deck.assert_called_with(250)
-        mock_ref_game_state.assert_called_with(self.MOCK_TRAIN_MAP, deque(zip(ps_list, players)), [Color.RED] * 238)
+        mock_ref_game_state.assert_called_with(self.MOCK_TRAIN_MAP, deque(zip(ps_list, players)),
+                                               Deck([Color.RED] * 238))
         for player, destinations in zip(players, [player_1_destinations, player_2_destinations, player_3_destinations]):
             player.setup.assert_called_with(self.MOCK_TRAIN_MAP, admin_utils.STARTING_NUM_RAILS, [Color.RED] * 4)
             player.pick.assert_called_with(destinations)
-        self.MOCK_TRAIN_MAP.get_feasible_destinations.assert_called()
-        mock_dest_strategy_instance.order_destinations.assert_called_with(mock_feasible_destinations)
+        self.MOCK_TRAIN_MAP.get_sorted_feasible_destinations.assert_called_with(admin_utils.STARTING_NUM_RAILS)
+        mock_dest_strategy_instance.iter_destinations.assert_called_with(mock_feasible_destinations)
 
     @patch('Trains.Admin.referee.RefereeGameState')
     @patch('Trains.Admin.referee.GameResult')
@@ -225,11 +249,11 @@ class RefereeTests(unittest.TestCase):
         mock_card_strategy_instance = mock_card_strategy.return_value
         mock_dest_strategy_instance = mock_dest_strategy.return_value
         mock_card_strategy_instance.create_deck.return_value = [Color.RED for _ in range(250)]
-        mock_dest_strategy_instance.order_destinations.return_value = [self.DEST_1, self.DEST_2, self.DEST_3,
-                                                                       self.DEST_4,
-                                                                       self.DEST_5, self.DEST_6, self.DEST_7,
-                                                                       self.DEST_8,
-                                                                       self.DEST_9]
+        mock_dest_strategy_instance.iter_destinations.return_value = [self.DEST_1, self.DEST_2, self.DEST_3,
+                                                                      self.DEST_4,
+                                                                      self.DEST_5, self.DEST_6, self.DEST_7,
+                                                                      self.DEST_8,
+                                                                      self.DEST_9]
         return mock_card_strategy_instance, mock_dest_strategy_instance
 
     def player_pick_mock_side_effect(self, destinations):
@@ -5,11 +5,13 @@ from Trains.Admin.referee_game_state import RefereeGameState
 from Trains.Common.map import Map
 from Trains.Other.cards import Cards
 from Trains.Other.color import Color
+from Trains.Other.deck import Deck
 from Trains.Other.directed_connection import DirectedConnection
 from Trains.Other.undirected_connection import UndirectedConnection
 from Trains.Other.city import City
 from Trains.Other.city_pair import CityPair
 from Trains.Other.player_state import PrivatePlayerState, PublicPlayerState
+from Trains.Other.score_breakdown import ScoreBreakdown
 
 
 class RefereeGameStateTests(unittest.TestCase):
@@ -31,9 +33,14 @@ class RefereeGameStateTests(unittest.TestCase):
     UNDIRECTED_CONNECTION_3 = UndirectedConnection(CITY_1, CITY_3, 4, Color.WHITE)
     CITY_PAIR_1 = CityPair(CITY_1, CITY_2)
     CITY_PAIR_2 = CityPair(CITY_2, CITY_3)
+    CITY_PAIR_3 = CityPair(CITY_1, CITY_3)
 
     MAP = Map(800, 800, [CITY_1, CITY_2],
               [DIRECTED_CONNECTION_1A, DIRECTED_CONNECTION_1B, DIRECTED_CONNECTION_2A, DIRECTED_CONNECTION_2B])
+    MAP_WITH_CITY_3 = Map(800, 800, [CITY_1, CITY_2, CITY_3],
+                          [DIRECTED_CONNECTION_1A, DIRECTED_CONNECTION_1B, DIRECTED_CONNECTION_2A,
+                           DIRECTED_CONNECTION_2B, DirectedConnection(CITY_1, CITY_3, 4, Color.WHITE),
+                           DirectedConnection(CITY_3, CITY_1, 4, Color.WHITE)])
 
     CARDS = Cards({Color.RED: 3, Color.BLUE: 4, Color.WHITE: 0, Color.GREEN: 10})
 
@@ -93,6 +100,60 @@ class RefereeGameStateTests(unittest.TestCase):
         ref_game_state_2 = RefereeGameState(self.MAP, self.STATE_PLAYER_DEQUE_2, self.GREEN_CARD_DECK)
         self.assertFalse(ref_game_state_2.__hash__() == ref_game_state_1.__hash__())
 
+    def assert_hash_matches_fresh_state(self, ref_game_state: RefereeGameState) -> None:
+        fresh_ref_game_state = RefereeGameState(
+            self.MAP, deque(zip(ref_game_state._RefereeGameState__get_player_states(), ref_game_state.get_players())),
+            ref_game_state._RefereeGameState__deck.to_list())
+        self.assertEqual(hash(fresh_ref_game_state), hash(ref_game_state))
+        self.assertEqual(fresh_ref_game_state, ref_game_state)
+
+    def test_hash_incremental_progress_turn(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_ALL_PLAYERS), self.RED_CARD_DECK)
+        for _ in range(4):
+            ref_game_state = ref_game_state.progress_turn()
+            self.assert_hash_matches_fresh_state(ref_game_state)
+
+    def test_hash_incremental_full_round(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_ALL_PLAYERS), self.RED_CARD_DECK)
+        rotated_ref_game_state = ref_game_state.progress_turn().progress_turn().progress_turn()
+        self.assertEqual(hash(ref_game_state), hash(rotated_ref_game_state))
+        self.assertEqual(ref_game_state, rotated_ref_game_state)
+
+    def test_hash_incremental_acquire_connection(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_ALL_PLAYERS), self.RED_CARD_DECK)
+        new_ref_game_state = ref_game_state.acquire_connection(self.UNDIRECTED_CONNECTION_1)
+        self.assert_hash_matches_fresh_state(new_ref_game_state)
+        self.assertNotEqual(hash(ref_game_state), hash(new_ref_game_state))
+        self.assertNotEqual(ref_game_state, new_ref_game_state)
+
+    def test_hash_incremental_draw_cards(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_ALL_PLAYERS),
+                                          [Color.WHITE, Color.RED, Color.GREEN])
+        new_ref_game_state = ref_game_state.draw_cards(ref_game_state.get_cards_to_draw())
+        self.assert_hash_matches_fresh_state(new_ref_game_state)
+        self.assertNotEqual(hash(ref_game_state), hash(new_ref_game_state))
+
+    def test_hash_incremental_remove_cheater(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_ALL_PLAYERS), self.RED_CARD_DECK)
+        new_ref_game_state = ref_game_state.progress_turn().remove_cheater()
+        self.assert_hash_matches_fresh_state(new_ref_game_state)
+        self.assertEqual(2, len(new_ref_game_state.get_players()))
+
+    def test_deck_and_list_of_cards_are_equal(self):
+        ref_game_state_1 = RefereeGameState(self.MAP, self.STATE_PLAYER_DEQUE_1, self.RED_CARD_DECK)
+        ref_game_state_2 = RefereeGameState(self.MAP, self.STATE_PLAYER_DEQUE_1, Deck(self.RED_CARD_DECK))
+        self.assertEqual(ref_game_state_1, ref_game_state_2)
+        self.assertEqual(hash(ref_game_state_1), hash(ref_game_state_2))
+
+    def test_updates_do_not_change_previous_state(self):
+        states_and_players = deque(self.STATE_PLAYER_DEQUE_ALL_PLAYERS)
+        ref_game_state = RefereeGameState(self.MAP, states_and_players, self.RED_CARD_DECK)
+        ref_game_state.acquire_connection(self.UNDIRECTED_CONNECTION_1)
+        ref_game_state.draw_cards(self.RED_CARD_DECK)
+        ref_game_state.remove_cheater()
+        self.assertEqual(self.STATE_PLAYER_DEQUE_ALL_PLAYERS, states_and_players)
+        self.assert_hash_matches_fresh_state(ref_game_state)
+
     def test_ref_game_state_create_player_game_state(self):
         ref_game_state = RefereeGameState(self.MAP, self.STATE_PLAYER_DEQUE_ALL_PLAYERS, self.EMPTY_CARD_DECK)
         first_player_game_state = ref_game_state.create_player_game_state()
@@ -109,20 +170,54 @@ class RefereeGameStateTests(unittest.TestCase):
         self.assertEqual(1, len(second_player_game_state.other_player_states))
         self.assertEqual(self.PRIVATE_PLAYER_STATE_1.public_state, second_player_game_state.other_player_states[0])
 
-    @patch('Trains.Admin.referee_game_state.PlayerGameState')
-    def test_ref_game_state_can_acquire_connection_true(self, mock_player_game_state):
-        player_game_state_instance = mock_player_game_state.return_value
-        player_game_state_instance.get_acquirable_connections.return_value = {self.UNDIRECTED_CONNECTION_1}
-        ref_game_state = RefereeGameState(self.MAP, self.STATE_PLAYER_DEQUE_1, self.EMPTY_CARD_DECK)
+    def test_ref_game_state_create_player_game_state_acquirable_connections(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_1), self.EMPTY_CARD_DECK)
+        self.assertEqual({self.UNDIRECTED_CONNECTION_1},
+                         ref_game_state.create_player_game_state().get_acquirable_connections())
+
+        new_ref_game_state = ref_game_state.acquire_connection(self.UNDIRECTED_CONNECTION_1).progress_turn()
+        self.assertEqual(set(), new_ref_game_state.create_player_game_state().get_acquirable_connections())
+
+        released_ref_game_state = new_ref_game_state.progress_turn().remove_cheater()
+        self.assertEqual({self.UNDIRECTED_CONNECTION_1},
+                         released_ref_game_state.create_player_game_state().get_acquirable_connections())
+
+    def test_ref_game_state_can_acquire_connection_true(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_1), self.EMPTY_CARD_DECK)
         self.assertTrue(ref_game_state.can_acquire_connection(self.UNDIRECTED_CONNECTION_1))
 
-    @patch('Trains.Admin.referee_game_state.PlayerGameState')
-    def test_ref_game_state_can_acquire_connection_false(self, mock_player_game_state):
-        player_game_state_instance = mock_player_game_state.return_value
-        player_game_state_instance.get_acquirable_connections.return_value = {self.UNDIRECTED_CONNECTION_2}
-        ref_game_state = RefereeGameState(self.MAP, self.STATE_PLAYER_DEQUE_1, self.EMPTY_CARD_DECK)
+    def test_ref_game_state_can_acquire_connection_not_on_map(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_1), self.EMPTY_CARD_DECK)
+        self.assertFalse(ref_game_state.can_acquire_connection(self.UNDIRECTED_CONNECTION_3))
+
+    def test_ref_game_state_can_acquire_connection_insufficient_cards(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_1), self.EMPTY_CARD_DECK)
+        self.assertFalse(ref_game_state.can_acquire_connection(self.UNDIRECTED_CONNECTION_2))
+
+    def test_ref_game_state_can_acquire_connection_insufficient_rails(self):
+        player_state = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 4, PublicPlayerState(set()))
+        ref_game_state = RefereeGameState(self.MAP, deque([(player_state, self.PLAYER_1)]), self.EMPTY_CARD_DECK)
+        self.assertTrue(ref_game_state.can_acquire_connection(self.UNDIRECTED_CONNECTION_1))
+        self.assertFalse(ref_game_state.can_acquire_connection(self.UNDIRECTED_CONNECTION_2))
+
+    def test_ref_game_state_can_acquire_connection_owned(self):
+        player_state = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30,
+                                          PublicPlayerState({self.UNDIRECTED_CONNECTION_1}))
+        ref_game_state = RefereeGameState(self.MAP, deque([(self.PRIVATE_PLAYER_STATE_1, self.PLAYER_1),
+                                                           (player_state, self.PLAYER_2)]), self.EMPTY_CARD_DECK)
         self.assertFalse(ref_game_state.can_acquire_connection(self.UNDIRECTED_CONNECTION_1))
 
+    def test_ref_game_state_can_acquire_connection_after_acquire(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_1), self.EMPTY_CARD_DECK)
+        new_ref_game_state = ref_game_state.acquire_connection(self.UNDIRECTED_CONNECTION_1).progress_turn()
+        self.assertFalse(new_ref_game_state.can_acquire_connection(self.UNDIRECTED_CONNECTION_1))
+        self.assertTrue(ref_game_state.can_acquire_connection(self.UNDIRECTED_CONNECTION_1))
+
+    def test_ref_game_state_can_acquire_connection_after_remove_cheater(self):
+        ref_game_state = RefereeGameState(self.MAP, deque(self.STATE_PLAYER_DEQUE_1), self.EMPTY_CARD_DECK)
+        new_ref_game_state = ref_game_state.acquire_connection(self.UNDIRECTED_CONNECTION_1).remove_cheater()
+        self.assertTrue(new_ref_game_state.can_acquire_connection(self.UNDIRECTED_CONNECTION_1))
+
     @patch('Trains.Admin.referee_game_state.PrivatePlayerState')
     def test_acquire_connection(self, mock_private_player_state):
         player_state_instance = mock_private_player_state.return_value
@@ -187,53 +282,51 @@ class RefereeGameStateTests(unittest.TestCase):
                                                               [self.PLAYER_1, self.PLAYER_2])), self.GREEN_CARD_DECK)
         cards_to_draw = ref_game_state.get_cards_to_draw()
         new_game_state = ref_game_state.draw_cards(cards_to_draw)
-        self.assertListEqual(self.EMPTY_CARD_DECK, new_game_state._RefereeGameState__cards)
+        self.assertListEqual(self.EMPTY_CARD_DECK, new_game_state._RefereeGameState__deck.to_list())
         self.assertEqual(self.PRIVATE_PLAYER_STATE_3, new_game_state._RefereeGameState__get_player_states()[0])
 
-    @patch('Trains.Admin.referee_game_state.Map')
-    def test_count_scores(self, mock_map):
-        map_instance = mock_map.return_value
-        map_instance.are_cities_connected.return_value = True
-        map_instance.longest_continuous_route.return_value = 0
+    def test_count_scores(self):
         ps_1 = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30, PublicPlayerState(set()))
         ps_2 = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30,
                                   PublicPlayerState({self.UNDIRECTED_CONNECTION_1}))
         ps_3 = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30,
                                   PublicPlayerState({self.UNDIRECTED_CONNECTION_2, self.UNDIRECTED_CONNECTION_3}))
 
-        ref_game_state = RefereeGameState(map_instance, deque(zip([ps_1, ps_2, ps_3], self.ALL_PLAYERS)),
+        ref_game_state = RefereeGameState(self.MAP_WITH_CITY_3, deque(zip([ps_1, ps_2, ps_3], self.ALL_PLAYERS)),
+                                          self.EMPTY_CARD_DECK)
+        self.assertEqual([-20, 3, 49], ref_game_state.count_scores())
+
+    def test_count_scores_unconnected_destinations(self):
+        unconnected_destinations = {self.CITY_PAIR_2, self.CITY_PAIR_3}
+        ps_1 = PrivatePlayerState(self.CARDS, unconnected_destinations, 30, PublicPlayerState(set()))
+        ps_2 = PrivatePlayerState(self.CARDS, unconnected_destinations, 30,
+                                  PublicPlayerState({self.UNDIRECTED_CONNECTION_1}))
+        ps_3 = PrivatePlayerState(self.CARDS, unconnected_destinations, 30,
+                                  PublicPlayerState({self.UNDIRECTED_CONNECTION_1, self.UNDIRECTED_CONNECTION_2}))
+
+        ref_game_state = RefereeGameState(self.MAP_WITH_CITY_3, deque(zip([ps_1, ps_2, ps_3], self.ALL_PLAYERS)),
                                           self.EMPTY_CARD_DECK)
-        self.assertEqual([40, 43, 49], ref_game_state.count_scores())
+        self.assertEqual([-20, -17, 8], ref_game_state.count_scores())
 
-    @patch('Trains.Admin.referee_game_state.Map')
-    def test_count_scores_unconnected_destinations(self, mock_map):
-        map_instance = mock_map.return_value
-        map_instance.are_cities_connected.return_value = False
-        map_instance.longest_continuous_route.return_value = 0
+    def test_count_scores_longest_continuous_path_tie(self):
         ps_1 = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30, PublicPlayerState(set()))
         ps_2 = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30,
-                                  PublicPlayerState({self.UNDIRECTED_CONNECTION_1}))
+                                  PublicPlayerState({self.UNDIRECTED_CONNECTION_2}))
         ps_3 = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30,
-                                  PublicPlayerState({self.UNDIRECTED_CONNECTION_2, self.UNDIRECTED_CONNECTION_3}))
+                                  PublicPlayerState({self.UNDIRECTED_CONNECTION_1, self.UNDIRECTED_CONNECTION_2}))
 
-        ref_game_state = RefereeGameState(map_instance, deque(zip([ps_1, ps_2, ps_3], self.ALL_PLAYERS)),
+        ref_game_state = RefereeGameState(self.MAP_WITH_CITY_3, deque(zip([ps_1, ps_2, ps_3], self.ALL_PLAYERS)),
                                           self.EMPTY_CARD_DECK)
-        self.assertEqual([0, 3, 9], ref_game_state.count_scores())
-
-    @patch('Trains.Admin.referee_game_state.Map')
-    def test_count_scores_longest_continuous_path_non_tie(self, mock_map):
-        def longest_continuous_route_side_effect(connections):
-            return len(connections)
+        self.assertEqual([-20, 25, 28], ref_game_state.count_scores())
 
-        map_instance = mock_map.return_value
-        map_instance.are_cities_connected.return_value = True
-        map_instance.longest_continuous_route.side_effect = longest_continuous_route_side_effect
+    def test_get_score_breakdowns(self):
         ps_1 = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30, PublicPlayerState(set()))
         ps_2 = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30,
                                   PublicPlayerState({self.UNDIRECTED_CONNECTION_1}))
         ps_3 = PrivatePlayerState(self.CARDS, {self.CITY_PAIR_1, self.CITY_PAIR_2}, 30,
                                   PublicPlayerState({self.UNDIRECTED_CONNECTION_2, self.UNDIRECTED_CONNECTION_3}))
 
-        ref_game_state = RefereeGameState(map_instance, deque(zip([ps_1, ps_2, ps_3], self.ALL_PLAYERS)),
+        ref_game_state = RefereeGameState(self.MAP_WITH_CITY_3, deque(zip([ps_1, ps_2, ps_3], self.ALL_PLAYERS)),
                                           self.EMPTY_CARD_DECK)
-        self.assertEqual([20, 23, 49], ref_game_state.count_scores())
+        self.assertEqual([ScoreBreakdown(0, -20, 0, 0), ScoreBreakdown(3, 0, 3, 0), ScoreBreakdown(9, 20, 9, 20)],
+                         ref_game_state.get_score_breakdowns())
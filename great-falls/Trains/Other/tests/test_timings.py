@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from Trains.Other.timings import TimingStats, Timings
+
+
+class TimingStatsTests(unittest.TestCase):
+    def test_record(self):
+        stats = TimingStats()
+        stats.record(0.0000005)
+        stats.record(0.003)
+        stats.record(0.001)
+        self.assertEqual(3, stats.count)
+        self.assertAlmostEqual(0.0040005, stats.total)
+        self.assertEqual(0.003, stats.max)
+        self.assertEqual({"1": 1, "1024": 1, "4096": 1}, stats.to_dict()["histogram_us"])
+
+    def test_merge(self):
+        stats = TimingStats()
+        stats.record(0.000003)
+        other = TimingStats()
+        other.record(0.002)
+        other.record(0.000002)
+        stats.merge(other)
+        self.assertEqual(3, stats.count)
+        self.assertEqual(0.002, stats.max)
+        self.assertEqual({"4": 2, "2048": 1}, stats.to_dict()["histogram_us"])
+
+
+class TimingsTests(unittest.TestCase):
+    @patch('Trains.Other.timings.time.perf_counter', side_effect=[1.0, 1.5, 2.0, 2.25])
+    def test_measure(self, mock_perf_counter):
+        timings = Timings()
+        with timings.measure("referee", "turns"):
+            pass
+        with self.assertRaises(ValueError):
+            with timings.measure("referee", "turns"):
+                raise ValueError()
+        stats = timings.get_stats("referee", "turns")
+        self.assertEqual(2, stats.count)
+        self.assertEqual(0.75, stats.total)
+        self.assertEqual(0.5, stats.max)
+
+    def test_disabled(self):
+        timings = Timings(enabled=False)
+        with timings.measure("referee", "turns"):
+            pass
+        self.assertEqual(0, timings.get_stats("referee", "turns").count)
+        self.assertEqual({}, timings.to_dict())
+
+    def test_merge(self):
+        timings = Timings()
+        timings.record(("referee", "setup"), 0.25)
+        other = Timings()
+        other.record(("referee", "setup"), 0.5)
+        other.record(("player", "alice", "play"), 0.125)
+        timings.merge(other)
+        self.assertEqual(2, timings.get_stats("referee", "setup").count)
+        self.assertEqual(0.75, timings.get_stats("referee", "setup").total)
+        self.assertEqual(1, timings.get_stats("player", "alice", "play").count)
+
+    def test_report(self):
+        timings = Timings()
+        timings.record(("referee", "setup"), 0.25)
+        timings.record(("player", "alice", "play"), 0.125)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.json")
+            timings.write_report(path)
+            with open(path) as report:
+                self.assertEqual(timings.to_dict(), json.load(report))
+        self.assertListEqual(["player/alice/play", "referee/setup"], list(timings.to_dict()))
+
+    def test_clear(self):
+        timings = Timings()
+        timings.record(("referee", "setup"), 0.25)
+        timings.clear()
+        self.assertEqual({}, timings.to_dict())
+
+    def test_player_key(self):
+        player = MagicMock()
+        player.name = "alice"
+        self.assertEqual(("player", "alice", "pick"), Timings.player_key(player, "pick"))
+        self.assertEqual(("player", "object", "pick"), Timings.player_key(object(), "pick"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from Trains.Admin.tournament_checkpoint import TournamentCheckpoint
+
+
+class TournamentCheckpointTests(unittest.TestCase):
+    RNG_STATE = random.Random(0).getstate()
+    CHECKPOINT = TournamentCheckpoint(10, "fingerprint", 2, 4, False, [0, 3, 7], [5, 2], [7, 3, 0], RNG_STATE)
+
+    def test_dict_round_trip(self):
+        checkpoint_dict = json.loads(json.dumps(self.CHECKPOINT.to_dict()))
+        checkpoint = TournamentCheckpoint.from_dict(checkpoint_dict)
+        self.assertEqual(self.CHECKPOINT, checkpoint)
+        self.assertEqual(self.RNG_STATE, checkpoint.rng_state)
+
+    def test_write_and_read(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            self.CHECKPOINT.write(path)
+            self.assertEqual(self.CHECKPOINT, TournamentCheckpoint.read(path))
+            self.assertListEqual(["checkpoint.json"], os.listdir(directory))
+
+    def test_write_replaces_checkpoint(self):
+        finished = TournamentCheckpoint(10, "fingerprint", 3, 3, True, [0], [5, 2], [0], self.RNG_STATE)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            self.CHECKPOINT.write(path)
+            finished.write(path)
+            self.assertEqual(finished, TournamentCheckpoint.read(path))
+            self.assertListEqual(["checkpoint.json"], os.listdir(directory))
+
+    def test_failed_write_keeps_checkpoint(self):
+        unserializable = TournamentCheckpoint(10, object(), 3, 3, True, [0], [], [0], self.RNG_STATE)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            self.CHECKPOINT.write(path)
+            self.assertRaises(TypeError, unserializable.write, path)
+            self.assertEqual(self.CHECKPOINT, TournamentCheckpoint.read(path))
+            self.assertListEqual(["checkpoint.json"], os.listdir(directory))
+
+    def test_not_equal(self):
+        self.assertNotEqual(self.CHECKPOINT, TournamentCheckpoint(10, "fingerprint", 2, 4, False, [0, 3, 7], [2, 5],
+                                                                  [7, 3, 0], self.RNG_STATE))
+        self.assertNotEqual(self.CHECKPOINT, self.CHECKPOINT.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
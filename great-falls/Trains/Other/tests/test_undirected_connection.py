@@ -1,8 +1,9 @@
+import pickle
 import unittest
 from Trains.Other.color import Color
 from Trains.Other.directed_connection import DirectedConnection
 from Trains.Other.undirected_connection import UndirectedConnection
-from Trains.Other.city import City
+from Trains.Other.city import City, CityTable
 
 
 class UndirectedConnectionTests(unittest.TestCase):
@@ -54,3 +55,30 @@ class UndirectedConnectionTests(unittest.TestCase):
         connection_2 = UndirectedConnection(self.CITY2, self.CITY1, self.LENGTH, Color.RED)
         self.assertTrue(connection_1 < connection_2)
 
+    def test_undirected_connection_sort_key(self):
+        city_table = CityTable([self.CITY1, self.CITY2, self.CITY3])
+        city1, city2, city3 = city_table.get_cities()
+        connections = [UndirectedConnection(city2, city3, self.LENGTH, Color.RED),
+                       UndirectedConnection(city2, city1, self.LENGTH + 1, Color.RED),
+                       UndirectedConnection(city1, city2, self.LENGTH, Color.RED),
+                       UndirectedConnection(city1, city2, self.LENGTH, Color.BLUE)]
+
+        self.assertEqual(((0, 1), self.LENGTH, "red"), connections[2].get_sort_key())
+        self.assertIs(city_table.get_city(self.CITY_NAME1).table_id, connections[0].get_table_id())
+        self.assertEqual(sorted(connections), sorted(connections, key=UndirectedConnection.get_sort_key))
+        self.assertEqual([connections[3], connections[2], connections[1], connections[0]], sorted(connections))
+
+    def test_undirected_connection_not_interned(self):
+        connection = UndirectedConnection(self.CITY1, self.CITY2, self.LENGTH, Color.RED)
+        self.assertIsNone(connection.get_sort_key())
+        self.assertIsNone(connection.get_table_id())
+
+    def test_undirected_connection_pickle(self):
+        city_table = CityTable([self.CITY1, self.CITY2])
+        connection = UndirectedConnection(city_table.intern(self.CITY1), city_table.intern(self.CITY2), self.LENGTH,
+                                          Color.RED)
+        unpickled_connection = pickle.loads(pickle.dumps(connection))
+
+        self.assertEqual(connection, unpickled_connection)
+        self.assertEqual(hash(connection), hash(unpickled_connection))
+        self.assertEqual(connection.get_sort_key(), unpickled_connection.get_sort_key())
@@ -0,0 +1,188 @@
+import json
+import time
+from typing import Any, Dict, Hashable, List, Tuple
+
+from Trains.Other.interfaces.i_player import IPlayer
+
+
+class TimingStats:
+    """
+    Represents the wall-clock times of the calls of one kind, as a call count, a total, a maximum and a histogram
+    whose buckets double in width, so recording a time takes constant time and space however many calls there are.
+    Bucket i counts the times that are less than 2 ** i microseconds and at least half that.
+
+    Attributes:
+        count (int): the number of recorded times
+        total (float): the sum of the recorded times, in seconds
+        max (float): the greatest recorded time, in seconds
+        histogram (List[int]): the number of recorded times in each bucket
+    """
+    count: int
+    total: float
+    max: float
+    histogram: List[int]
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = []
+
+    def record(self, elapsed: float) -> None:
+        """
+        SIDE-EFFECTS:
+            - Adds the given time to the stats
+        :param elapsed: the time to record, in seconds
+        """
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        bucket = int(elapsed * 1_000_000).bit_length()
+        if bucket >= len(self.histogram):
+            self.histogram.extend([0] * (bucket + 1 - len(self.histogram)))
+        self.histogram[bucket] += 1
+
+    def merge(self, other: 'TimingStats') -> None:
+        """
+        SIDE-EFFECTS:
+            - Adds the times recorded in the given stats to these stats
+        :param other: the stats to add
+        """
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if len(other.histogram) > len(self.histogram):
+            self.histogram.extend([0] * (len(other.histogram) - len(self.histogram)))
+        for bucket, count in enumerate(other.histogram):
+            self.histogram[bucket] += count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: a JSON serializable dictionary of the stats, whose histogram maps the upper bound of each non-empty
+                 bucket in microseconds to its count
+        """
+        return {"count": self.count, "total_seconds": self.total, "max_seconds": self.max,
+                "histogram_us": {str(2 ** bucket): count for bucket, count in enumerate(self.histogram) if count}}
+
+
+class Timings:
+    """
+    Represents the wall-clock times of the phases of tournaments and games and of the calls to players, each kept as
+    TimingStats under a key such as ("referee", "turns") or ("player", <name>, "play"). Measuring a call costs a couple
+    of perf_counter calls and a dictionary lookup, so the timings are cheap enough to leave enabled.
+
+    Args:
+        enabled (bool): whether times are recorded
+
+    Attributes:
+        enabled (bool): whether times are recorded
+        __stats (Dict[Tuple[Hashable, ...], TimingStats]): the stats of each key
+    """
+    enabled: bool
+    __stats: Dict[Tuple[Hashable, ...], TimingStats]
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.__stats = {}
+
+    def measure(self, *key: Hashable) -> 'Measurement':
+        """
+        :param key: the key to record the time under
+        :return: a context manager that records the wall-clock time of its body under the key, even if it raises
+        """
+        return Measurement(self, key)
+
+    def record(self, key: Tuple[Hashable, ...], elapsed: float) -> None:
+        """
+        SIDE-EFFECTS:
+            - Records the given time under the given key, if enabled
+        :param key: the key to record the time under
+        :param elapsed: the time to record, in seconds
+        """
+        if self.enabled:
+            stats = self.__stats.get(key)
+            if stats is None:
+                stats = self.__stats[key] = TimingStats()
+            stats.record(elapsed)
+
+    def get_stats(self, *key: Hashable) -> TimingStats:
+        """
+        :param key: the key of the stats
+        :return: the stats recorded under the key, which are empty if nothing was recorded
+        """
+        return self.__stats.get(key, TimingStats())
+
+    def merge(self, other: 'Timings') -> None:
+        """
+        SIDE-EFFECTS:
+            - Adds the times recorded in the given timings, e.g. by a worker process, to these timings
+        :param other: the timings to add
+        """
+        for key, other_stats in other.__stats.items():
+            self.__stats.setdefault(key, TimingStats()).merge(other_stats)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: a JSON serializable dictionary mapping each key, with its parts joined by slashes, to its stats
+        """
+        return {"/".join(str(part) for part in key): stats.to_dict() for key, stats in sorted(
+            self.__stats.items(), key=lambda item: [str(part) for part in item[0]])}
+
+    def write_report(self, path: str) -> None:
+        """
+        SIDE-EFFECTS:
+            - Writes the timings as JSON (see to_dict) to the file at the given path
+        :param path: the path of the report
+        """
+        with open(path, "w") as report:
+            json.dump(self.to_dict(), report, indent=2)
+
+    def clear(self) -> None:
+        """
+        Removes every recorded time
+        """
+        self.__stats.clear()
+
+    @staticmethod
+    def player_key(player: IPlayer, method: str) -> Tuple[str, str, str]:
+        """
+        :param player: the player being called
+        :param method: the name of the player's method being called
+        :return: the key to record the call under, which identifies the player by name if it has one
+        """
+        return "player", str(getattr(player, "name", type(player).__name__)), method
+
+
+class Measurement:
+    """
+    Represents the measurement of the wall-clock time of a block of code (see Timings.measure)
+
+    Args:
+        timings (Timings): the timings to record the time in
+        key (Tuple[Hashable, ...]): the key to record the time under
+
+    Attributes:
+        __timings (Timings): the timings to record the time in
+        __key (Tuple[Hashable, ...]): the key to record the time under
+        __start (float): the perf_counter value when the block was entered
+    """
+    __slots__ = ("__timings", "__key", "__start")
+
+    def __init__(self, timings: Timings, key: Tuple[Hashable, ...]):
+        self.__timings = timings
+        self.__key = key
+        self.__start = 0.0
+
+    def __enter__(self) -> 'Measurement':
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.__timings.record(self.__key, time.perf_counter() - self.__start)
+
+
+TIMINGS = Timings()
+"""
+The timings shared by the manager and every referee, so that a tournament's report covers all of its games
+"""
@@ -1,3 +1,5 @@
+from typing import Tuple, Union
+
 from Trains.Other.city import City
 from Trains.Other.color import Color
 from Trains.Other.city_pair import CityPair
@@ -5,7 +7,8 @@ from Trains.Other.city_pair import CityPair
 
 class UndirectedConnection:
     """
-    Represents an undirected connection between two cities. city_1 is always lexicographically less than city_2
+    Represents an undirected connection between two cities. city_1 is always lexicographically less than city_2. The
+    hash is computed once, when the connection is constructed
 
     Args:
         city_1 (City): the city this connection starts from
@@ -17,10 +20,17 @@ class UndirectedConnection:
         _city_pair (CityPair): the pair of cities that make up the connection
         length (int): how many segments the connection has
         color (Color): the color of the connection
+        __hash (int): the hash of the city pair, length and color
+        __sort_key (Union[None, Tuple[Tuple[int, int], int, str]]): the ordinals of the cities, the length and the color
+                                                                    if the cities share a CityTable, None otherwise
     """
+    __slots__ = ("__city_pair", "length", "color", "__hash", "__sort_key")
+
     __city_pair: CityPair
     length: int
     color: Color
+    __hash: int
+    __sort_key: Union[None, Tuple[Tuple[int, int], int, str]]
 
     def __init__(self, city_1: City, city_2: City, length: int, color: Color):
         """
@@ -37,9 +47,26 @@ class UndirectedConnection:
         if city_1 == city_2:
             raise ValueError("city_1 must differ from city_2")
 
-        self.__city_pair = CityPair(city_1, city_2)
+        self.__set_fields(CityPair(city_1, city_2), length, color)
+
+    def __set_fields(self, city_pair: CityPair, length: int, color: Color) -> None:
+        """
+        SIDE-EFFECTS:
+            - Sets the fields of this connection and computes its hash
+        """
+        self.__city_pair = city_pair
         self.length = length
         self.color = color
+        self.__hash = hash((city_pair, length, color.value))
+        self.__sort_key = None if city_pair.table_id is None else (city_pair.ordinals, length, color.value)
+
+    # Override - the hash depends on the cities' hashes, so it is computed again after unpickling
+    def __getstate__(self):
+        return self.__city_pair, self.length, self.color
+
+    # Override
+    def __setstate__(self, state):
+        self.__set_fields(*state)
 
     # Override
     def __eq__(self, other):
@@ -47,7 +74,7 @@ class UndirectedConnection:
 
     # Override
     def __hash__(self):
-        return hash((self.__city_pair, self.length, self.color.value))
+        return self.__hash
 
     # Override
     def __lt__(self, other):
@@ -57,6 +84,9 @@ class UndirectedConnection:
         :param other: the other connection being compared against
         :return: true if this connection is less than the other, false otherwise
         """
+        if self.__sort_key is not None and self.__city_pair.table_id is other.__city_pair.table_id:
+            return self.__sort_key < other.__sort_key
+
         if self.__city_pair == other.__city_pair:
             if self.length == other.length:
                 return self.color.value < other.color.value
@@ -69,3 +99,16 @@ class UndirectedConnection:
 
     def get_city_2(self) -> City:
         return self.__city_pair.city_2
+
+    def get_sort_key(self) -> Union[None, Tuple[Tuple[int, int], int, str]]:
+        """
+        :return: a key that orders connections whose cities were interned in the same CityTable like __lt__ does, None
+                 if the cities were not interned in the same table
+        """
+        return self.__sort_key
+
+    def get_table_id(self) -> Union[None, object]:
+        """
+        :return: identifies the CityTable the cities were interned in, None if they were not interned in the same table
+        """
+        return self.__city_pair.table_id
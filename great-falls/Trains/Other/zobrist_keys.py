@@ -0,0 +1,39 @@
+import random
+from typing import Dict, Hashable
+
+HASH_BITS = 64
+HASH_MASK = (1 << HASH_BITS) - 1
+
+
+class ZobristKeys:
+    """
+    Represents a table of random 64-bit keys for Zobrist hashing. The hash of a collection of features is the exclusive
+    or of their keys, so adding or removing a feature updates the hash with a single exclusive or. Keys are drawn from a
+    seeded random number generator the first time each feature is looked up.
+
+    Args:
+        seed (int): the seed for the random number generator
+
+    Attributes:
+        __rng (random.Random): the random number generator the keys are drawn from
+        __keys (Dict[Hashable, int]): a mapping from each feature looked up so far to its key
+    """
+    __rng: random.Random
+    __keys: Dict[Hashable, int]
+
+    def __init__(self, seed: int = 0):
+        self.__rng = random.Random(seed)
+        self.__keys = {}
+
+    def get_key(self, feature: Hashable) -> int:
+        """
+        SIDE-EFFECTS:
+            - Draws a key for the feature if it does not have one yet
+        :param feature: the feature to look up
+        :return: the 64-bit key of the feature
+        """
+        key = self.__keys.get(feature)
+        if key is None:
+            key = self.__rng.getrandbits(HASH_BITS)
+            self.__keys[feature] = key
+        return key
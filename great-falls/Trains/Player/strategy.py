@@ -1,11 +1,10 @@
-import importlib.util
-import inspect
 from typing import Set, Union, Type
 from Trains.Common.map import Map
 from Trains.Common.player_game_state import PlayerGameState
 from Trains.Other.destination import Destination
 from Trains.Other.interfaces.i_strategy import IStrategy, MORE_CARDS_REQUEST
 from Trains.Other.undirected_connection import UndirectedConnection
+from Trains.Player.strategy_registry import STRATEGY_REGISTRY
 
 
 class AStrategy(IStrategy):
@@ -33,7 +32,7 @@ class AStrategy(IStrategy):
         """
         acquirable_connections = player_state.get_acquirable_connections()
         if acquirable_connections:
-            return sorted(acquirable_connections)[0]
+            return min(acquirable_connections)
         else:
             return MORE_CARDS_REQUEST
 
@@ -41,17 +40,9 @@ class AStrategy(IStrategy):
     def from_file(file_path: str) -> Type[IStrategy]:
         """
         Create a strategy from a filepath. This filepath must be a Linux path to a python file
-        containing a single strategy.
+        containing a single strategy. The file is only imported the first time it is loaded and after it changes
+        (see StrategyRegistry).
         :param file_path: a valid filepath to a python file defining a strategy
         :return: a strategy object extending from IStrategy
         """
-        module_name = 'strategy'
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        for _, obj in inspect.getmembers(module, inspect.isclass):
-            if inspect.isclass(obj) and obj.__module__ == module_name and issubclass(obj, IStrategy):
-                return obj
-
-        raise ValueError("Could not find a strategy class in the file")
+        return STRATEGY_REGISTRY.load(file_path)
@@ -0,0 +1,124 @@
+import hashlib
+import importlib.util
+import inspect
+import os
+import sys
+import threading
+from typing import Dict, Iterable, Tuple, Type
+
+from Trains.Other.interfaces.i_strategy import IStrategy
+
+
+class StrategyRegistry:
+    """
+    Represents the strategy classes loaded from Python files, so a file shared by many players is only imported
+    once. Entries are keyed by the file's resolved path and checked against the file's modification time and size on
+    every load, so an edited file is imported again. Each file is imported as its own module, named after a hash of
+    its resolved path and registered in sys.modules, so strategies from different files never collide and their
+    classes can be pickled by reference in worker processes forked after they were loaded.
+
+    Attributes:
+        hits (int): the number of loads that found a cached strategy
+        misses (int): the number of loads that had to import the file
+        __strategies (Dict[str, Tuple[Tuple[int, int], Type[IStrategy]]]): the modification time and size of each
+                                                                            loaded file and its strategy, keyed by
+                                                                            resolved path
+        __lock (threading.Lock): guards the entries, so strategies can be loaded from several threads
+    """
+    MODULE_PREFIX = "trains_strategy_"
+
+    hits: int
+    misses: int
+    __strategies: Dict[str, Tuple[Tuple[int, int], Type[IStrategy]]]
+    __lock: threading.Lock
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.__strategies = {}
+        self.__lock = threading.Lock()
+
+    def load(self, file_path: str) -> Type[IStrategy]:
+        """
+        Gets the strategy defined in a Python file, importing the file if it has not been imported since it last
+        changed
+        :param file_path: a path to a python file defining a single strategy
+        :return: the strategy class defined in the file
+        :raise ValueError: if the file does not define a strategy
+        """
+        resolved_path = os.path.realpath(file_path)
+        file_stat = os.stat(resolved_path)
+        version = (file_stat.st_mtime_ns, file_stat.st_size)
+        with self.__lock:
+            cached = self.__strategies.get(resolved_path)
+            if cached is not None and cached[0] == version:
+                self.hits += 1
+                return cached[1]
+
+            self.misses += 1
+            strategy = self.__import_strategy(resolved_path)
+            self.__strategies[resolved_path] = (version, strategy)
+            return strategy
+
+    def preload(self, file_paths: Iterable[str]) -> None:
+        """
+        Loads the strategies of the given files, e.g. before forking worker processes or in a worker's initializer
+        SIDE-EFFECTS:
+            - Imports each file that is not cached
+        :param file_paths: paths to python files defining strategies
+        """
+        for file_path in file_paths:
+            self.load(file_path)
+
+    def clear(self) -> None:
+        """
+        Forgets every loaded strategy and resets the hit and miss counters. Modules already imported stay in
+        sys.modules until their file is loaded again
+        """
+        with self.__lock:
+            self.__strategies.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        :return: the number of hits, misses and currently loaded strategies
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.__strategies)}
+
+    @staticmethod
+    def module_name(resolved_path: str) -> str:
+        """
+        :param resolved_path: the resolved path of a strategy file
+        :return: the name the file is imported as
+        """
+        return StrategyRegistry.MODULE_PREFIX + hashlib.sha256(resolved_path.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def __import_strategy(resolved_path: str) -> Type[IStrategy]:
+        """
+        SIDE-EFFECTS:
+            - Imports the file as a module and registers it in sys.modules, replacing any earlier import of it
+        :param resolved_path: the resolved path of a python file defining a single strategy
+        :return: the strategy class defined in the file
+        :raise ValueError: if the file does not define a strategy
+        """
+        module_name = StrategyRegistry.module_name(resolved_path)
+        spec = importlib.util.spec_from_file_location(module_name, resolved_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+            for _, obj in inspect.getmembers(module, inspect.isclass):
+                if obj.__module__ == module_name and issubclass(obj, IStrategy):
+                    return obj
+            raise ValueError("Could not find a strategy class in the file")
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+
+
+STRATEGY_REGISTRY = StrategyRegistry()
+"""
+The registry shared by every player, so that all players of a tournament with the same strategy file share one class
+"""